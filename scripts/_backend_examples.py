@@ -0,0 +1,27 @@
+"""Shared paths and hashing helpers for the backend-comparison example scripts."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+NARRATA_PROJECT = ROOT / "src" / "narrata"
+FIXTURE_PATH = NARRATA_PROJECT / "tests" / "assets" / "msft_1y.csv"
+UV_CACHE_DIR = ROOT / ".uv-cache"
+EXAMPLES_CACHE_DIR = UV_CACHE_DIR / "narrata-backend-examples"
+
+
+def narrata_sources() -> list[Path]:
+    """Return the files whose contents determine the installed narrata package."""
+    return [NARRATA_PROJECT / "pyproject.toml", *sorted((NARRATA_PROJECT / "narrata").rglob("*.py"))]
+
+
+def digest_files(paths: Iterable[Path], *, salt: str = "", digest_size: int = 64) -> str:
+    """Hash file paths (relative to the repo root) and contents into a hex cache key."""
+    digest = hashlib.blake2b(salt.encode(), digest_size=digest_size)
+    for path in paths:
+        digest.update(str(path.relative_to(ROOT)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
@@ -5,10 +5,11 @@ from __future__ import annotations
 
 import re
 import sys
+import tomllib
 from pathlib import Path
 
-VERSION_RE = re.compile(r"\d+\.\d+\.\d+(?:[a-zA-Z0-9\.\-\+]*)?")
-VERSION_LINE_RE = re.compile(r'(?m)^version\s*=\s*"([^"]+)"')
+VERSION_RE = re.compile(r"\A\d+\.\d+\.\d+[A-Za-z0-9.+-]*\Z")
+VERSION_LINE_RE = re.compile(rb'(?m)^version\s*=\s*"([^"]+)"')
 
 TARGETS = [
     Path("src/narrata/pyproject.toml"),
@@ -22,29 +23,32 @@ def main() -> int:
         return 2
 
     version = sys.argv[1].strip()
-    if not VERSION_RE.fullmatch(version):
+    if not VERSION_RE.match(version):
         print(f"Invalid version string: {version}")
         return 2
 
     changed = False
     for path in TARGETS:
-        content = path.read_text()
+        content = path.read_bytes()
         match = VERSION_LINE_RE.search(content)
         if not match:
             print(f"No version field found in {path}")
             return 1
 
-        current = match.group(1)
+        current = match.group(1).decode()
+        parsed = tomllib.loads(content.decode()).get("project", {}).get("version")
+        if parsed != current:
+            print(f"Version line in {path} ({current}) does not match [project].version ({parsed})")
+            return 1
+
         if current == version:
             print(f"No change needed for {path} (already {version})")
             continue
 
-        updated, count = VERSION_LINE_RE.subn(f'version = "{version}"', content, count=1)
-        if count != 1:
-            print(f"Could not update version in {path}")
-            return 1
+        start, end = match.span(1)
+        updated = content[:start] + version.encode() + content[end:]
 
-        path.write_text(updated)
+        path.write_bytes(updated)
         changed = True
         print(f"Updated {path}: {current} -> {version}")
 
@@ -5,9 +5,10 @@ from __future__ import annotations
 
 import re
 import sys
+import tomllib
 from pathlib import Path
 
-VERSION_RE = re.compile(r"\d+\.\d+\.\d+(?:[a-zA-Z0-9\.\-\+]*)?")
+VERSION_RE = re.compile(r"\A\d+\.\d+\.\d+[A-Za-z0-9.+-]*\Z")
 
 
 def main() -> int:
@@ -16,17 +17,18 @@ def main() -> int:
         return 2
 
     version = sys.argv[1].strip()
-    if not VERSION_RE.fullmatch(version):
+    if not VERSION_RE.match(version):
         print(f"Invalid version string: {version}")
         return 2
 
     for path in [Path("src/narrata/pyproject.toml"), Path("src/narrata-mcp/pyproject.toml")]:
-        content = path.read_text()
-        match = re.search(r'(?m)^version\s*=\s*"([^"]+)"', content)
-        if not match:
+        with path.open("rb") as fh:
+            data = tomllib.load(fh)
+        try:
+            actual = data["project"]["version"]
+        except KeyError:
             print(f"No version field found in {path}")
             return 1
-        actual = match.group(1)
         if actual != version:
             print(
                 f"Version mismatch: {path} has {actual}, but tag would be {version}. "
@@ -4,92 +4,189 @@
 from __future__ import annotations
 
 import argparse
+import difflib
 import json
 import os
+import shutil
 import subprocess
-import tempfile
-import textwrap
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-NARRATA_PROJECT = ROOT / "src" / "narrata"
+from _backend_examples import EXAMPLES_CACHE_DIR, FIXTURE_PATH, NARRATA_PROJECT, ROOT, digest_files, narrata_sources
+
 UV_CACHE_DIR = str(ROOT / ".uv-cache")
+VENV_CACHE_DIR = EXAMPLES_CACHE_DIR / "venvs"
+# Reflink out of the shared cache where the filesystem supports it (APFS); hardlink elsewhere.
+UV_LINK_MODE = os.environ.get("UV_LINK_MODE", "clone" if sys.platform == "darwin" else "hardlink")
 
+# Injected into each venv's interpreter; filled via str.format (literal braces are doubled).
+_NARRATE_SNIPPET = """\
+import json
+from importlib.metadata import packages_distributions
+import pandas as pd
+from narrata.composition.narrate import narrate
 
-def _run(cmd: list[str]) -> subprocess.CompletedProcess[str]:
+# Installed-distribution index lookup; maps import names (pandas_ta) to dists (pandas-ta-openbb).
+installed = packages_distributions()
+mods = {{m: m in installed for m in ('pandas_ta', 'ruptures', 'tslearn')}}
+
+df = pd.read_pickle({fixture_path!r})
+
+payload = {{
+    'mode': {mode!r},
+    'deps': mods,
+    'text': narrate(df, ticker='MSFT', digit_level=False),
+}}
+print(json.dumps(payload, ensure_ascii=False))
+"""
+
+# Parses the CSV fixture once per venv; narrate runs then load the typed frame directly.
+_FIXTURE_SNIPPET = """\
+import pandas as pd
+
+pd.read_csv({csv_path!r}, index_col='Date', parse_dates=True).to_pickle({pickle_path!r})
+"""
+
+
+def _env() -> dict[str, str]:
     env = dict(os.environ)
     env["UV_CACHE_DIR"] = UV_CACHE_DIR
+    return env
+
+
+def _run(cmd: list[str]) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
         cmd,
         cwd=ROOT,
-        env=env,
+        env=_env(),
         check=True,
         text=True,
         capture_output=True,
     )
 
 
-def _narrate_for_mode(mode: str, install_target: str) -> dict[str, object]:
-    fixture_path = ROOT / "src" / "narrata" / "tests" / "assets" / "msft_1y.csv"
+def _run_quiet(cmd: list[str]) -> None:
+    """Run a command whose stdout is not needed; stderr is kept for CalledProcessError."""
+    subprocess.run(
+        cmd,
+        cwd=ROOT,
+        env=_env(),
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+
+def _venv_key(install_target: str) -> str:
+    """Hash the narrata side of a mode's venv: its install target and local sources.
+
+    Third-party versions are resolved when the venv is built and are not part of the key,
+    so a cached venv keeps them until it is rebuilt (``--rebuild-venvs``).
+    """
+    # narrata is installed from the local tree (not editable), so its sources belong in the key.
+    return digest_files(narrata_sources(), salt=install_target, digest_size=8)
+
+
+def _venv_python(mode: str, install_target: str, rebuild: bool = False) -> Path:
+    """Return the interpreter of a cached venv for *mode*, building it on a key miss.
+
+    Venvs hardcode their own location, so they are built in place and only marked
+    reusable once the install has finished.  *rebuild* discards a cached venv so that
+    dependencies are resolved afresh.
+    """
+    mode_dir = VENV_CACHE_DIR / mode
+    key_dir = mode_dir / _venv_key(install_target)
+    venv_dir = key_dir / ".venv"
+    python_bin = venv_dir / "bin" / "python"
+    ready_marker = key_dir / ".ready"
+    if not rebuild and ready_marker.exists() and python_bin.exists():
+        return python_bin
+
+    if mode_dir.exists():
+        shutil.rmtree(mode_dir)
+    key_dir.mkdir(parents=True)
+    _run_quiet(["uv", "venv", str(venv_dir)])
+
+    if not python_bin.exists():
+        raise RuntimeError(f"Expected virtualenv python at {python_bin}, but it was not found.")
+
+    _run_quiet(
+        [
+            "uv",
+            "pip",
+            "install",
+            "--cache-dir",
+            UV_CACHE_DIR,
+            "--link-mode",
+            UV_LINK_MODE,
+            # Compile into the cached venv so narrate runs do not byte-compile narrata on import.
+            "--compile-bytecode",
+            "--python",
+            str(python_bin),
+            install_target,
+        ]
+    )
+    ready_marker.touch()
+    return python_bin
 
-    with tempfile.TemporaryDirectory(prefix=f"narrata-{mode}-") as tmp_dir:
-        venv_dir = Path(tmp_dir) / ".venv"
-        _run(["uv", "venv", str(venv_dir)])
 
-        python_bin = venv_dir / "bin" / "python"
-        if not python_bin.exists():
-            raise RuntimeError(f"Expected virtualenv python at {python_bin}, but it was not found.")
+def _venv_fixture(python_bin: Path) -> Path:
+    """Return the fixture pickled by the venv's own pandas, regenerating it when the CSV is newer.
 
-        _run(["uv", "pip", "install", "--python", str(python_bin), install_target])
+    Pickles are not portable across pandas versions, so each venv keeps its own copy.
+    """
+    pickle_path = python_bin.parents[2] / f"{FIXTURE_PATH.stem}.pkl"
+    if pickle_path.exists() and pickle_path.stat().st_mtime >= FIXTURE_PATH.stat().st_mtime:
+        return pickle_path
 
-        code = textwrap.dedent(
-            f"""
-            import importlib.util
-            import json
-            import pandas as pd
-            from narrata.composition.narrate import narrate
+    code = _FIXTURE_SNIPPET.format(csv_path=str(FIXTURE_PATH), pickle_path=str(pickle_path))
+    _run_quiet([str(python_bin), "-c", code])
+    return pickle_path
 
-            mods = {{m: (importlib.util.find_spec(m) is not None) for m in ('pandas_ta', 'ruptures', 'tslearn')}}
 
-            df = pd.read_csv({str(fixture_path)!r}, index_col='Date', parse_dates=True)
+def _narrate_for_mode(mode: str, install_target: str, rebuild: bool = False) -> dict[str, object]:
+    python_bin = _venv_python(mode, install_target, rebuild=rebuild)
+    fixture_path = _venv_fixture(python_bin)
 
-            payload = {{
-                'mode': {mode!r},
-                'deps': mods,
-                'text': narrate(df, ticker='MSFT', digit_level=False),
-            }}
-            print(json.dumps(payload, ensure_ascii=False))
-            """
-        )
-        result = _run([str(python_bin), "-c", code])
-        return json.loads(result.stdout.strip().splitlines()[-1])
+    code = _NARRATE_SNIPPET.format(fixture_path=str(fixture_path), mode=mode)
+    result = _run([str(python_bin), "-c", code])
+    return json.loads(result.stdout.strip().splitlines()[-1])
 
 
 def _diff_lines(fallback_text: str, extras_text: str) -> list[dict[str, str]]:
     fallback_lines = fallback_text.splitlines()
     extras_lines = extras_text.splitlines()
-    max_len = max(len(fallback_lines), len(extras_lines))
+    matcher = difflib.SequenceMatcher(None, fallback_lines, extras_lines, autojunk=False)
 
     diffs: list[dict[str, str]] = []
-    for idx in range(max_len):
-        fb = fallback_lines[idx] if idx < len(fallback_lines) else ""
-        ex = extras_lines[idx] if idx < len(extras_lines) else ""
-        if fb == ex:
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
             continue
-        label = ex.split(":", maxsplit=1)[0] if ":" in ex else f"line {idx + 1}"
-        diffs.append(
-            {
-                "label": label,
-                "fallback": fb,
-                "extras": ex,
-            }
-        )
+        fb_block = fallback_lines[i1:i2]
+        ex_block = extras_lines[j1:j2]
+        for offset in range(max(len(fb_block), len(ex_block))):
+            fb = fb_block[offset] if offset < len(fb_block) else ""
+            ex = ex_block[offset] if offset < len(ex_block) else ""
+            source = ex or fb
+            label = source.split(":", maxsplit=1)[0] if ":" in source else f"line {j1 + offset + 1}"
+            diffs.append(
+                {
+                    "label": label,
+                    "fallback": fb,
+                    "extras": ex,
+                }
+            )
     return diffs
 
 
-def generate() -> dict[str, object]:
-    fallback = _narrate_for_mode("fallback_only", str(NARRATA_PROJECT))
-    extras = _narrate_for_mode("external_enabled", f"{NARRATA_PROJECT}[all]")
+def generate(rebuild_venvs: bool = False) -> dict[str, object]:
+    # Each mode has its own cached venv directory, so both can run at once.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fallback_future = executor.submit(_narrate_for_mode, "fallback_only", str(NARRATA_PROJECT), rebuild_venvs)
+        extras_future = executor.submit(_narrate_for_mode, "external_enabled", f"{NARRATA_PROJECT}[all]", rebuild_venvs)
+        fallback = fallback_future.result()
+        extras = extras_future.result()
 
     return {
         "fallback": fallback,
@@ -101,9 +198,12 @@ def generate() -> dict[str, object]:
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--json", action="store_true", help="Emit JSON payload")
+    parser.add_argument(
+        "--rebuild-venvs", action="store_true", help="Rebuild cached venvs so dependencies are resolved afresh"
+    )
     args = parser.parse_args()
 
-    payload = generate()
+    payload = generate(rebuild_venvs=args.rebuild_venvs)
     if args.json:
         print(json.dumps(payload, ensure_ascii=False))
         return
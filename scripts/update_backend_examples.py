@@ -3,13 +3,18 @@
 
 from __future__ import annotations
 
+import argparse
+import io
 import json
+import re
 import subprocess
 import sys
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
+from _backend_examples import EXAMPLES_CACHE_DIR, FIXTURE_PATH, ROOT, digest_files, narrata_sources
+
 GEN_SCRIPT = ROOT / "scripts" / "generate_backend_examples.py"
+SHARED_SCRIPT = ROOT / "scripts" / "_backend_examples.py"
 
 README_PATH = ROOT / "README.md"
 TUTORIAL_PATH = ROOT / "docs" / "tutorial.md"
@@ -19,27 +24,49 @@ README_END = "<!-- BACKEND_COMPARISON:END -->"
 TUTORIAL_START = "<!-- BACKEND_COMPARISON_TUTORIAL:START -->"
 TUTORIAL_END = "<!-- BACKEND_COMPARISON_TUTORIAL:END -->"
 
+_README_BLOCK_RE = re.compile(re.escape(README_START) + r".*?" + re.escape(README_END), re.DOTALL)
+_TUTORIAL_BLOCK_RE = re.compile(re.escape(TUTORIAL_START) + r".*?" + re.escape(TUTORIAL_END), re.DOTALL)
+
+
+def _payload_cache_key() -> str:
+    """Hash every input that can change the generated payload."""
+    return digest_files([GEN_SCRIPT, SHARED_SCRIPT, FIXTURE_PATH, *narrata_sources()])
 
-def _load_payload() -> dict[str, object]:
+
+def _load_payload(force: bool = False) -> dict[str, object]:
+    cache_path = EXAMPLES_CACHE_DIR / f"{_payload_cache_key()}.json"
+    if not force and cache_path.exists():
+        return json.loads(cache_path.read_text())
+
+    # Forced runs also rebuild the cached venvs, which otherwise keep their resolved dependencies.
+    cmd = [sys.executable, str(GEN_SCRIPT), "--json"]
+    if force:
+        cmd.append("--rebuild-venvs")
     result = subprocess.run(
-        [sys.executable, str(GEN_SCRIPT), "--json"],
+        cmd,
         cwd=ROOT,
         check=True,
         text=True,
         capture_output=True,
     )
-    return json.loads(result.stdout.strip().splitlines()[-1])
+    payload = json.loads(result.stdout.strip().splitlines()[-1])
+
+    EXAMPLES_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False))
+    tmp_path.replace(cache_path)
+    return payload
 
 
-def _replace_between_markers(path: Path, start: str, end: str, replacement_body: str) -> None:
+def _replace_between_markers(
+    path: Path, block_re: re.Pattern[str], start: str, end: str, replacement_body: str
+) -> None:
     content = path.read_text()
-    if start not in content or end not in content:
+    block = f"{start}\n{replacement_body.rstrip()}\n{end}"
+    # Callable replacement so backslashes in the rendered body are kept literally.
+    updated, count = block_re.subn(lambda _match: block, content, count=1)
+    if count != 1:
         raise RuntimeError(f"Markers not found in {path}")
-
-    before, remainder = content.split(start, maxsplit=1)
-    _, after = remainder.split(end, maxsplit=1)
-
-    updated = f"{before}{start}\n{replacement_body.rstrip()}\n{end}{after}"
     path.write_text(updated)
 
 
@@ -48,33 +75,33 @@ def _render_readme(payload: dict[str, object]) -> str:
     extras = payload["extras"]
     differences = payload["differences"]
 
-    lines = [
-        "Using the same static real-market MSFT dataset (251 daily points, yfinance fixture):",
-        "",
-        "Use separate clean virtual environments when comparing fallback vs extras.",
-        "",
-        "Fallback-only (`pip install narrata`):",
-        "",
-        "```text",
-        str(fallback["text"]),
-        "```",
-        "",
-        'With extras (`pip install "narrata[all]"`):',
-        "",
-        "```text",
-        str(extras["text"]),
-        "```",
-        "",
-        "Main differences in this run:",
-    ]
+    buf = io.StringIO()
+    buf.write(
+        "Using the same static real-market MSFT dataset (251 daily points, yfinance fixture):\n"
+        "\n"
+        "Use separate clean virtual environments when comparing fallback vs extras.\n"
+        "\n"
+        "Fallback-only (`pip install narrata`):\n"
+        "\n"
+        f"```text\n{fallback['text']}\n```\n"
+        "\n"
+        'With extras (`pip install "narrata[all]"`):\n'
+        "\n"
+        f"```text\n{extras['text']}\n```\n"
+        "\n"
+        "Main differences in this run:\n"
+    )
 
     if differences:
-        for diff in differences:
-            lines.append(f"- `{diff['label']}` changed: `{diff['fallback']}` -> `{diff['extras']}`")
+        buf.write(
+            "\n".join(
+                f"- `{diff['label']}` changed: `{diff['fallback']}` -> `{diff['extras']}`" for diff in differences
+            )
+        )
     else:
-        lines.append("- No line-level differences were observed on this fixture.")
+        buf.write("- No line-level differences were observed on this fixture.")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def _render_tutorial(payload: dict[str, object]) -> str:
@@ -82,76 +109,76 @@ def _render_tutorial(payload: dict[str, object]) -> str:
     extras = payload["extras"]
     differences = payload["differences"]
 
-    lines = [
-        "This comparison uses the same static real-market MSFT fixture (251 daily points from yfinance).",
-        "",
-        "Use separate clean virtual environments when comparing fallback vs extras.",
-        "",
-        "### Fallback-only environment",
-        "",
-        "Install only the core package:",
-        "",
-        "```bash",
-        "pip install narrata",
-        "```",
-        "",
-        "Detected optional backends:",
-        "",
-        f"- `{fallback['deps']}`",
-        "",
-        "Representative output:",
-        "",
-        "```text",
-        str(fallback["text"]),
-        "```",
-        "",
-        "### Extras-enabled environment",
-        "",
-        "Install optional backends:",
-        "",
-        "```bash",
-        'pip install "narrata[all]"',
-        "```",
-        "",
-        "Detected optional backends:",
-        "",
-        f"- `{extras['deps']}`",
-        "",
-        "Representative output:",
-        "",
-        "```text",
-        str(extras["text"]),
-        "```",
-        "",
-        "### Why the outputs differ",
-    ]
+    buf = io.StringIO()
+    buf.write(
+        "This comparison uses the same static real-market MSFT fixture (251 daily points from yfinance).\n"
+        "\n"
+        "Use separate clean virtual environments when comparing fallback vs extras.\n"
+        "\n"
+        "### Fallback-only environment\n"
+        "\n"
+        "Install only the core package:\n"
+        "\n"
+        "```bash\npip install narrata\n```\n"
+        "\n"
+        "Detected optional backends:\n"
+        "\n"
+        f"- `{fallback['deps']}`\n"
+        "\n"
+        "Representative output:\n"
+        "\n"
+        f"```text\n{fallback['text']}\n```\n"
+        "\n"
+        "### Extras-enabled environment\n"
+        "\n"
+        "Install optional backends:\n"
+        "\n"
+        '```bash\npip install "narrata[all]"\n```\n'
+        "\n"
+        "Detected optional backends:\n"
+        "\n"
+        f"- `{extras['deps']}`\n"
+        "\n"
+        "Representative output:\n"
+        "\n"
+        f"```text\n{extras['text']}\n```\n"
+        "\n"
+        "### Why the outputs differ\n"
+    )
 
     if differences:
-        for diff in differences:
-            lines.append(f"- `{diff['label']}` line changed")
-            lines.append(f"  fallback: `{diff['fallback']}`")
-            lines.append(f"  extras: `{diff['extras']}`")
+        buf.write(
+            "\n".join(
+                f"- `{diff['label']}` line changed\n  fallback: `{diff['fallback']}`\n  extras: `{diff['extras']}`"
+                for diff in differences
+            )
+        )
     else:
-        lines.append("- No line-level differences were observed on this fixture.")
-
-    lines.extend(
-        [
-            "",
-            "### Why some lines stay the same",
-            "",
-            "- Sparkline, summary statistics, support/resistance, and many pattern labels "
-            "come from deterministic in-house logic.",
-            "- RSI/MACD values are often numerically close between in-house and `pandas_ta` for the same input series.",
-        ]
+        buf.write("- No line-level differences were observed on this fixture.")
+
+    buf.write(
+        "\n"
+        "\n"
+        "### Why some lines stay the same\n"
+        "\n"
+        "- Sparkline, summary statistics, support/resistance, and many pattern labels "
+        "come from deterministic in-house logic.\n"
+        "- RSI/MACD values are often numerically close between in-house and `pandas_ta` for the same input series."
     )
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def main() -> None:
-    payload = _load_payload()
-    _replace_between_markers(README_PATH, README_START, README_END, _render_readme(payload))
-    _replace_between_markers(TUTORIAL_PATH, TUTORIAL_START, TUTORIAL_END, _render_tutorial(payload))
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild the venvs and regenerate outputs even if a cached payload matches"
+    )
+    args = parser.parse_args()
+
+    payload = _load_payload(force=args.force)
+    _replace_between_markers(README_PATH, _README_BLOCK_RE, README_START, README_END, _render_readme(payload))
+    _replace_between_markers(TUTORIAL_PATH, _TUTORIAL_BLOCK_RE, TUTORIAL_START, TUTORIAL_END, _render_tutorial(payload))
     print("Updated README.md and docs/tutorial.md backend comparison blocks.")
 
 
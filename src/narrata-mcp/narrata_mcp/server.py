@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
+import sys
+from datetime import date, timedelta
+from typing import Annotated, Any, Literal, NotRequired
 
 from fastmcp import FastMCP
 from narrata.exceptions import NarrataError
@@ -17,24 +19,29 @@ from narrata.mcp_api import (
     sax_from_records,
     summary_from_records,
 )
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, with_config
+from typing_extensions import TypedDict
 
 OutputFormat = Literal["plain", "markdown_kv", "toon", "json"]
 
 mcp = FastMCP("narrata_mcp")
 
 
-class OhlcvPoint(BaseModel):
+# A TypedDict rather than a BaseModel: pydantic validates each point in its core
+# validator and yields plain dicts, so points reach narrata.mcp_api without one
+# model instantiation (and re-dump) per row.
+@with_config(ConfigDict(populate_by_name=True, str_strip_whitespace=True, extra="forbid"))
+class OhlcvPoint(TypedDict):
     """One OHLCV point."""
 
-    model_config = ConfigDict(populate_by_name=True, str_strip_whitespace=True, extra="forbid")
-
-    timestamp: str = Field(description="Timestamp for this row, ISO 8601 string (for example '2025-01-02T15:30:00').")
-    open: float | None = Field(default=None, alias="Open", description="Open price.")
-    high: float | None = Field(default=None, alias="High", description="High price.")
-    low: float | None = Field(default=None, alias="Low", description="Low price.")
-    close: float | None = Field(default=None, alias="Close", description="Close price.")
-    volume: float | None = Field(default=None, alias="Volume", description="Traded volume.")
+    timestamp: Annotated[
+        str, Field(description="Timestamp for this row, ISO 8601 string (for example '2025-01-02T15:30:00').")
+    ]
+    open: NotRequired[Annotated[float | None, Field(alias="Open", description="Open price.")]]
+    high: NotRequired[Annotated[float | None, Field(alias="High", description="High price.")]]
+    low: NotRequired[Annotated[float | None, Field(alias="Low", description="Low price.")]]
+    close: NotRequired[Annotated[float | None, Field(alias="Close", description="Close price.")]]
+    volume: NotRequired[Annotated[float | None, Field(alias="Volume", description="Traded volume.")]]
 
 
 class OhlcvPayload(BaseModel):
@@ -487,12 +494,40 @@ def narrata_levels_ohlcv(params: LevelsInput) -> dict[str, Any]:
         raise ValueError(str(exc)) from exc
 
 
-def _records(points: list[OhlcvPoint]) -> list[dict[str, Any]]:
-    return [point.model_dump(by_alias=False) for point in points]
+def _records(points: list[OhlcvPoint]) -> dict[str, list[Any]]:
+    # Column-oriented: narrata builds the frame from one list per field instead of walking row dicts.
+    records: dict[str, list[Any]] = {"timestamp": [point["timestamp"] for point in points]}
+    for field in ("open", "high", "low", "close", "volume"):
+        records[field] = [point.get(field) for point in points]
+    return records
+
+
+def _warm_up() -> None:
+    """Narrate a synthetic series once so lazy backend setup happens before the first request.
+
+    Optional backends load on first use (pandas_ta's candlestick helpers also load
+    numba-compiled kernels), which would otherwise land on the first tool call.
+    """
+    start = date(2024, 1, 1)
+    size = 64
+    closes = [100.0 + 0.5 * idx + (idx % 5) for idx in range(size)]
+    records: dict[str, list[Any]] = {
+        "timestamp": [(start + timedelta(days=idx)).isoformat() for idx in range(size)],
+        "open": [close - 0.5 for close in closes],
+        "high": [close + 1.0 for close in closes],
+        "low": [close - 1.0 for close in closes],
+        "close": closes,
+        "volume": [1000.0 + idx for idx in range(size)],
+    }
+    try:
+        narrate_from_records(records)
+    except Exception as exc:  # warm-up is best effort; a faulty backend fails its own tool calls instead
+        print(f"narrata-mcp: warm-up failed: {exc!r}", file=sys.stderr)
 
 
 def main() -> None:
     """Run the FastMCP server over stdio transport."""
+    _warm_up()
     mcp.run(show_banner=False)
 
 
@@ -507,3 +507,26 @@ def test_no_volume_accepted() -> None:
                 assert "NOVOL (" in data["text"]
 
     anyio.run(_run)
+
+
+# ---------------------------------------------------------------------------
+# Startup
+# ---------------------------------------------------------------------------
+
+
+def test_main_runs_server_when_warm_up_fails(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    server = pytest.importorskip("narrata_mcp.server")
+
+    def _broken_narrate(records: Any) -> str:
+        raise RuntimeError("backend exploded")
+
+    runs: list[dict[str, Any]] = []
+    monkeypatch.setattr(server, "narrate_from_records", _broken_narrate)
+    monkeypatch.setattr(server.mcp, "run", lambda **kwargs: runs.append(kwargs))
+
+    server.main()
+
+    assert runs == [{"show_banner": False}]
+    assert "backend exploded" in capsys.readouterr().err
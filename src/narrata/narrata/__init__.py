@@ -4,7 +4,9 @@ from importlib.metadata import version
 
 from narrata.adapters import from_ccxt, from_coingecko
 from narrata.analysis.indicators import (
+    IndicatorsState,
     analyze_indicators,
+    analyze_indicators_batch,
     compute_bollinger,
     compute_ma_crossover,
     compute_macd,
@@ -46,6 +48,7 @@ __version__ = version("narrata")
 
 __all__ = [
     "IndicatorStats",
+    "IndicatorsState",
     "LevelStats",
     "NarrataError",
     "OutputFormat",
@@ -59,6 +62,7 @@ __all__ = [
     "astride_encode",
     "compare",
     "analyze_indicators",
+    "analyze_indicators_batch",
     "analyze_regime",
     "__version__",
     "analyze_summary",
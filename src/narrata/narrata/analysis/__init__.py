@@ -1,7 +1,9 @@
 """Numerical analysis primitives for narrata."""
 
 from narrata.analysis.indicators import (
+    IndicatorsState,
     analyze_indicators,
+    analyze_indicators_batch,
     compute_bollinger,
     compute_ma_crossover,
     compute_macd,
@@ -23,8 +25,10 @@ from narrata.analysis.support_resistance import describe_support_resistance, fin
 from narrata.analysis.symbolic import astride_encode, describe_astride, describe_sax, sax_encode
 
 __all__ = [
+    "IndicatorsState",
     "astride_encode",
     "analyze_indicators",
+    "analyze_indicators_batch",
     "analyze_regime",
     "analyze_summary",
     "compute_bollinger",
@@ -0,0 +1,22 @@
+"""Lazy loader for the optional ``pandas_ta`` dependency shared by the analysis modules."""
+
+from typing import Any
+
+# pandas_ta is slow to import, so it is loaded on the first indicator or pattern call rather
+# than by ``import narrata``; the cost moves to that first call, it is not avoided.
+# Tests replace ``ta`` (``None`` or a fake module) to select the code path.
+_NOT_LOADED: Any = object()
+ta: Any = _NOT_LOADED
+
+
+def load() -> Any | None:
+    """Return the ``pandas_ta`` module, or ``None`` when it is not installed."""
+    global ta
+    if ta is _NOT_LOADED:
+        try:
+            import pandas_ta
+        except ImportError:  # pragma: no cover - optional dependency path
+            ta = None
+        else:
+            ta = pandas_ta
+    return ta
@@ -0,0 +1,30 @@
+"""Cached ruptures change-point detection shared by regime and ASTRIDE analysis."""
+
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+
+def pelt_breakpoints(rpt_module: Any, signal: np.ndarray, min_size: int, penalty: float) -> list[int]:
+    """Return RBF Pelt breakpoints for a 1-D *signal*, reusing results for repeated inputs.
+
+    Results are keyed by the ruptures module, the signal bytes and the Pelt parameters, so
+    recomputing narration for unchanged data skips the quadratic RBF cost. Breakpoints are
+    cached rather than fitted algorithms because a fitted RBF cost holds an ``n x n`` Gram matrix.
+
+    :param rpt_module: The ``ruptures`` module (or a stand-in exposing ``Pelt``).
+    :param signal: Values to segment.
+    :param min_size: Minimum segment length.
+    :param penalty: Pelt penalty.
+    :return: Segment end positions, the last one equal to ``signal.size``.
+    """
+    values = np.ascontiguousarray(signal, dtype=np.float64)
+    return list(_cached_breakpoints(rpt_module, values.tobytes(), min_size, penalty))
+
+
+@lru_cache(maxsize=32)
+def _cached_breakpoints(rpt_module: Any, signal_bytes: bytes, min_size: int, penalty: float) -> tuple[int, ...]:
+    signal = np.frombuffer(signal_bytes, dtype=np.float64).reshape(-1, 1).copy()
+    algo = rpt_module.Pelt(model="rbf", min_size=min_size).fit(signal)
+    return tuple(int(bkpt) for bkpt in algo.predict(pen=penalty))
@@ -1,25 +1,71 @@
 """Technical indicator analysis and narration."""
 
-import importlib
-from typing import Any
+import math
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Self
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
 
+from narrata.analysis import _pandas_ta
 from narrata.exceptions import ValidationError
 from narrata.types import IndicatorStats
-from narrata.validation import validate_ohlcv_frame
+from narrata.validation import numeric_values, ohlcv_arrays, validate_ohlcv_frame
 from narrata.validation.ohlcv import BAR_UNIT_FREQUENCIES, is_intraday
 
-ta: Any | None
-try:
-    importlib.import_module("importlib.metadata")
-    import pandas_ta as ta
-except ImportError:  # pragma: no cover - optional dependency path
-    ta = None
+# Ascending band starts for each label ladder.  Lower bands include their upper edge
+# (``<= 0.5``), so those edges are nudged up one ulp; upper bands start inclusively (``>= 1.5``).
+# An empty label marks a middle band that the caller resolves from trend.
+_RSI_BOUNDS = (math.nextafter(30.0, math.inf), 70.0)
+_RSI_LABELS = ("oversold", "", "overbought")
+_BB_BOUNDS = (math.nextafter(0.05, math.inf), math.nextafter(0.20, math.inf), 0.80, 0.95)
+_BB_LABELS = ("below lower band", "near lower band", "", "near upper band", "above upper band")
+_VOLUME_BOUNDS = (math.nextafter(0.5, math.inf), math.nextafter(0.75, math.inf), 1.5, 2.0)
+_VOLUME_LABELS = ("unusually low", "below average", "average", "above average", "unusually high")
+_VOLATILITY_BOUNDS = (math.nextafter(10.0, math.inf), math.nextafter(25.0, math.inf), 75.0, 90.0)
+_VOLATILITY_LABELS = ("extremely low", "low", "moderate", "high", "extremely high")
 
 
-def compute_rsi(series: pd.Series, period: int = 14) -> float:
+def _band_label(value: float, bounds: tuple[float, ...], labels: tuple[str, ...]) -> str:
+    """Return the label of the band containing *value* with a single binary search."""
+    return labels[bisect_right(bounds, value)]
+
+
+def _ewm_horizon(alpha: float) -> int:
+    """Return how many steps it takes an EWM weight to decay below float64 resolution.
+
+    Bars older than this no longer change the latest smoothed value, so tail-only callers
+    can skip them (the adjust=False start-up value is forgotten within the same horizon).
+    """
+    return math.ceil(math.log(np.finfo(np.float64).eps) / math.log1p(-alpha))
+
+
+def _span_alpha(span: int) -> float:
+    """Return the EWM smoothing factor for a span, as in ``Series.ewm(span=span)``."""
+    return 2.0 / (span + 1)
+
+
+def _ewm_adjust_false(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponentially weighted mean equivalent to ``Series.ewm(alpha=alpha, adjust=False).mean()``.
+
+    Runs the recursion ``y[t] = (1 - alpha) * y[t - 1] + alpha * x[t]`` as a single IIR filter pass.
+
+    :param values: NaN-free, non-empty float array.
+    :param alpha: Smoothing factor in ``(0, 1]``.
+    :return: Smoothed array of the same length.
+    """
+    decay = 1.0 - alpha
+    smoothed, _ = lfilter([alpha], [1.0, -decay], values, zi=[decay * values[0]])
+    return np.asarray(smoothed, dtype=np.float64)
+
+
+def compute_rsi(series: pd.Series | np.ndarray, period: int = 14) -> float:
     """Compute RSI using Wilder-style exponential smoothing.
 
     :param series: Price series.
@@ -29,30 +75,31 @@ def compute_rsi(series: pd.Series, period: int = 14) -> float:
     if period < 2:
         raise ValidationError("RSI period must be >= 2.")
 
-    values = pd.to_numeric(series, errors="coerce").dropna()
+    values = numeric_values(series)
     if values.size < period + 1:
         raise ValidationError("Not enough data to compute RSI.")
 
-    delta = values.diff()
-    gains = delta.clip(lower=0.0)
-    losses = -delta.clip(upper=0.0)
-    avg_gain = gains.ewm(alpha=1.0 / period, adjust=False).mean()
-    avg_loss = losses.ewm(alpha=1.0 / period, adjust=False).mean()
-    latest_gain = float(avg_gain.iloc[-1])
-    latest_loss = float(avg_loss.iloc[-1])
-    if np.isclose(latest_gain, 0.0) and np.isclose(latest_loss, 0.0):
+    alpha = 1.0 / period
+    delta = np.diff(values[-(_ewm_horizon(alpha) + 1) :])
+    latest_gain = float(_ewm_adjust_false(np.maximum(delta, 0.0), alpha)[-1])
+    latest_loss = float(_ewm_adjust_false(np.maximum(-delta, 0.0), alpha)[-1])
+    return _rsi_from_averages(latest_gain, latest_loss)
+
+
+def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    if np.isclose(avg_gain, 0.0) and np.isclose(avg_loss, 0.0):
         latest = 50.0
-    elif np.isclose(latest_loss, 0.0):
+    elif np.isclose(avg_loss, 0.0):
         latest = 100.0
     else:
-        rs = latest_gain / latest_loss
+        rs = avg_gain / avg_loss
         latest = 100.0 - (100.0 / (1.0 + rs))
 
     return max(0.0, min(100.0, latest))
 
 
 def compute_macd(
-    series: pd.Series, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9
+    series: pd.Series | np.ndarray, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9
 ) -> tuple[float, float, float]:
     """Compute MACD values for the latest sample.
 
@@ -62,23 +109,49 @@ def compute_macd(
     :param signal_period: Signal EMA period.
     :return: Tuple of (macd_line, signal_line, histogram).
     """
+    macd_line, signal_line = _macd_lines(series, fast_period, slow_period, signal_period, tail_only=True)
+    latest_macd = float(macd_line[-1])
+    latest_signal = float(signal_line[-1])
+    return latest_macd, latest_signal, latest_macd - latest_signal
+
+
+def _macd_lines(
+    series: pd.Series | np.ndarray,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+    tail_only: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Validate *series* and return its MACD and signal lines.
+
+    With *tail_only*, only the bars that still affect the latest values are smoothed; the
+    returned lines then cover that tail instead of the full history.
+    """
     if fast_period >= slow_period:
         raise ValidationError("fast_period must be smaller than slow_period.")
 
-    values = pd.to_numeric(series, errors="coerce").dropna()
+    values = numeric_values(series)
     if values.size < slow_period + signal_period:
         raise ValidationError("Not enough data to compute MACD.")
+    if tail_only:
+        values = values[-(_ewm_horizon(_span_alpha(slow_period)) + _ewm_horizon(_span_alpha(signal_period))) :]
 
-    fast_ema = values.ewm(span=fast_period, adjust=False).mean()
-    slow_ema = values.ewm(span=slow_period, adjust=False).mean()
+    fast_ema = _ewm_adjust_false(values, _span_alpha(fast_period))
+    slow_ema = _ewm_adjust_false(values, _span_alpha(slow_period))
     macd_line = fast_ema - slow_ema
-    signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
-    histogram = macd_line - signal_line
+    return macd_line, _ewm_adjust_false(macd_line, _span_alpha(signal_period))
+
 
-    return float(macd_line.iloc[-1]), float(signal_line.iloc[-1]), float(histogram.iloc[-1])
+def _window_mean_std(windows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the mean and population standard deviation of each row of a sliding-window view."""
+    # Variance is shift-invariant; centring on each window's first value keeps flat windows exactly zero.
+    centered = windows - windows[:, :1]
+    centered -= centered.mean(axis=1, keepdims=True)
+    np.multiply(centered, centered, out=centered)
+    return windows.mean(axis=1), np.sqrt(centered.mean(axis=1))
 
 
-def compute_bollinger(series: pd.Series, period: int = 20, num_std: float = 2.0) -> tuple[str, bool]:
+def compute_bollinger(series: pd.Series | np.ndarray, period: int = 20, num_std: float = 2.0) -> tuple[str, bool]:
     """Compute Bollinger Band position and squeeze state.
 
     :param series: Price series.
@@ -86,42 +159,41 @@ def compute_bollinger(series: pd.Series, period: int = 20, num_std: float = 2.0)
     :param num_std: Number of standard deviations for band width.
     :return: Tuple of (position label, squeeze detected).
     """
-    values = pd.to_numeric(series, errors="coerce").dropna()
+    values = numeric_values(series)
     if values.size < period:
         raise ValidationError("Not enough data to compute Bollinger Bands.")
 
-    sma = values.rolling(window=period).mean()
-    std = values.rolling(window=period).std(ddof=0)
+    # Only the windows ending on the last ``period`` bars feed the squeeze check, so skip the rest.
+    windows = sliding_window_view(values[-(2 * period - 1) :], period)
+    sma, std = _window_mean_std(windows)
     upper = sma + num_std * std
     lower = sma - num_std * std
-    bandwidth = ((upper - lower) / sma).dropna()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bandwidth = (upper - lower) / sma
+    bandwidth = bandwidth[~np.isnan(bandwidth)]
 
-    latest_price = float(values.iloc[-1])
-    latest_upper = float(upper.iloc[-1])
-    latest_lower = float(lower.iloc[-1])
-    latest_sma = float(sma.iloc[-1])
+    latest_price = float(values[-1])
+    latest_upper = float(upper[-1])
+    latest_lower = float(lower[-1])
+    latest_sma = float(sma[-1])
 
     if latest_upper == latest_lower:
         position = "at midline"
     else:
         pct = (latest_price - latest_lower) / (latest_upper - latest_lower)
-        if pct >= 0.95:
-            position = "above upper band"
-        elif pct >= 0.80:
-            position = "near upper band"
-        elif pct <= 0.05:
-            position = "below lower band"
-        elif pct <= 0.20:
-            position = "near lower band"
-        elif latest_price > latest_sma:
-            position = "upper half"
-        else:
-            position = "lower half"
+        position = _band_label(pct, _BB_BOUNDS, _BB_LABELS)
+        if not position:
+            position = "upper half" if latest_price > latest_sma else "lower half"
 
     squeeze = False
     if bandwidth.size >= period:
-        recent_bw = float(bandwidth.iloc[-1])
-        lookback_bw = float(bandwidth.iloc[-period:].quantile(0.20))
+        recent_bw = float(bandwidth[-1])
+        # Linear-interpolated 20th percentile from two selected order statistics instead of a full sort.
+        rank = 0.20 * (period - 1)
+        lo = int(rank)
+        hi = min(lo + 1, period - 1)
+        selected = np.partition(bandwidth[-period:], (lo, hi))
+        lookback_bw = float(selected[lo] + (selected[hi] - selected[lo]) * (rank - lo))
         squeeze = recent_bw <= lookback_bw
 
     return position, squeeze
@@ -137,7 +209,7 @@ def compute_ma_crossover(
     :param slow_period: Slow SMA period.
     :return: Tuple of (cross type or None, days since cross or None).
     """
-    values = pd.to_numeric(series, errors="coerce").dropna()
+    values = pd.Series(numeric_values(series), copy=False)
     if values.size < slow_period + 1:
         return None, None
 
@@ -147,15 +219,20 @@ def compute_ma_crossover(
     if diff.size < 2:
         return None, None
 
-    signs = np.sign(diff.to_numpy())
-    current = "golden cross" if signs[-1] >= 0.0 else "death cross"
+    diff_values = diff.to_numpy()
+    current = "golden cross" if diff_values[-1] >= 0.0 else "death cross"
+    return current, _bars_since_sign_flip(diff_values)
 
-    for idx in range(signs.size - 1, 0, -1):
-        if signs[idx] != signs[idx - 1] and signs[idx] != 0.0 and signs[idx - 1] != 0.0:
-            days_ago = signs.size - 1 - idx
-            return current, days_ago
 
-    return current, None
+def _bars_since_sign_flip(diff: np.ndarray) -> int | None:
+    """Return how many bars ago adjacent non-zero values of *diff* last changed sign, or ``None``."""
+    # Zeros are neither positive nor negative, so touching zero never counts as a flip.
+    positive = diff > 0.0
+    negative = diff < 0.0
+    flips = np.flatnonzero((positive[1:] & negative[:-1]) | (negative[1:] & positive[:-1]))
+    if flips.size == 0:
+        return None
+    return int(diff.size - 2 - flips[-1])
 
 
 def compute_volume_state(df: pd.DataFrame, lookback: int = 20) -> tuple[float, str]:
@@ -168,32 +245,27 @@ def compute_volume_state(df: pd.DataFrame, lookback: int = 20) -> tuple[float, s
     if "Volume" not in df.columns:
         raise ValidationError("DataFrame must contain Volume column.")
 
-    volume = pd.to_numeric(df["Volume"], errors="coerce").dropna()
+    return _volume_state(numeric_values(df["Volume"]), lookback)
+
+
+def _volume_state(volume: np.ndarray, lookback: int) -> tuple[float, str]:
     if volume.size < lookback + 1:
         raise ValidationError("Not enough data to compute volume state.")
 
-    avg = float(volume.rolling(window=lookback).mean().iloc[-1])
+    # Only the latest moving-average value is reported, so average just the trailing window.
+    avg = float(volume[-lookback:].mean())
     if avg <= 0.0:
         return 1.0, "average"
 
-    latest = float(volume.iloc[-1])
+    latest = float(volume[-1])
     ratio = latest / avg
 
-    if ratio >= 2.0:
-        state = "unusually high"
-    elif ratio >= 1.5:
-        state = "above average"
-    elif ratio <= 0.5:
-        state = "unusually low"
-    elif ratio <= 0.75:
-        state = "below average"
-    else:
-        state = "average"
-
-    return round(ratio, 2), state
+    return round(ratio, 2), _band_label(ratio, _VOLUME_BOUNDS, _VOLUME_LABELS)
 
 
-def compute_volatility_percentile(series: pd.Series, window: int = 20, lookback: int = 252) -> tuple[float, str]:
+def compute_volatility_percentile(
+    series: pd.Series | np.ndarray, window: int = 20, lookback: int = 252
+) -> tuple[float, str]:
     """Compute historical volatility percentile rank.
 
     :param series: Price series.
@@ -201,34 +273,27 @@ def compute_volatility_percentile(series: pd.Series, window: int = 20, lookback:
     :param lookback: Lookback period for percentile ranking.
     :return: Tuple of (percentile 0-100, state label).
     """
-    values = pd.to_numeric(series, errors="coerce").dropna()
+    values = numeric_values(series)
     if values.size < window + 2:
         raise ValidationError("Not enough data to compute volatility percentile.")
 
-    returns = values.pct_change().dropna()
-    rolling_vol = returns.rolling(window=window).std(ddof=0).dropna()
-    if rolling_vol.empty:
+    # Only the rolling windows that can enter the lookback ranking are computed.
+    tail = values[-(lookback + window) :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = tail[1:] / tail[:-1] - 1.0
+        _, rolling_vol = _window_mean_std(sliding_window_view(returns, window))
+    rolling_vol = rolling_vol[~np.isnan(rolling_vol)]
+    if rolling_vol.size == 0:
         raise ValidationError("Not enough data to compute volatility percentile.")
 
-    current_vol = float(rolling_vol.iloc[-1])
-    rank_window = rolling_vol.tail(min(lookback, rolling_vol.size))
-    lower_count = int((rank_window < current_vol).sum())
-    equal_count = int((rank_window == current_vol).sum())
+    current_vol = float(rolling_vol[-1])
+    rank_window = np.sort(rolling_vol[-min(lookback, rolling_vol.size) :])
+    lower_count = int(np.searchsorted(rank_window, current_vol, side="left"))
+    equal_count = int(np.searchsorted(rank_window, current_vol, side="right")) - lower_count
     percentile = float((lower_count + 0.5 * equal_count) / rank_window.size * 100.0)
     percentile = round(percentile, 0)
 
-    if percentile <= 10:
-        state = "extremely low"
-    elif percentile <= 25:
-        state = "low"
-    elif percentile >= 90:
-        state = "extremely high"
-    elif percentile >= 75:
-        state = "high"
-    else:
-        state = "moderate"
-
-    return percentile, state
+    return percentile, _band_label(percentile, _VOLATILITY_BOUNDS, _VOLATILITY_LABELS)
 
 
 # Approximate bars per trading day for each intraday frequency.
@@ -286,27 +351,30 @@ def analyze_indicators(
     :return: Structured indicator statistics.
     """
     validate_ohlcv_frame(df, required_columns=("Close",))
-    if column not in df.columns:
-        raise ValidationError(f"Column '{column}' does not exist in DataFrame.")
+    arrays = ohlcv_arrays(df, column=column)
 
     defaults = _intraday_defaults(frequency)
 
-    values = pd.to_numeric(df[column], errors="coerce").dropna()
-    if ta is None:
-        rsi_value = compute_rsi(values, period=rsi_period)
-        macd_value, signal_value, histogram = compute_macd(values)
-        macd_state, crossover_days = _classify_macd(values)
+    close = arrays.close
+    # pandas_ta and the rolling-mean crossover take a Series; wrap the shared buffer without copying.
+    values = pd.Series(close, copy=False)
+    ta_module = _pandas_ta.load()
+    if ta_module is None:
+        rsi_value = compute_rsi(close, period=rsi_period)
+        macd_value, signal_value, histogram, macd_state, crossover_days = _macd_fallback(close)
     else:
-        rsi_value = _compute_rsi_with_pandas_ta(values, period=rsi_period)
-        macd_value, signal_value, histogram, macd_state, crossover_days = _compute_macd_with_pandas_ta(values)
+        rsi_value = _compute_rsi_with_pandas_ta(ta_module, values, period=rsi_period)
+        macd_value, signal_value, histogram, macd_state, crossover_days = _compute_macd_with_pandas_ta(
+            ta_module, values
+        )
 
-    rsi_state = _classify_rsi(values, rsi_value)
+    rsi_state = _classify_rsi(close, rsi_value)
 
     bb_position: str | None = None
     bb_squeeze: bool | None = None
     bb_period = defaults["bb_period"]
     try:
-        bb_position, bb_squeeze = compute_bollinger(values, period=bb_period)
+        bb_position, bb_squeeze = compute_bollinger(close, period=bb_period)
     except ValidationError:
         pass
 
@@ -322,17 +390,18 @@ def analyze_indicators(
     vol_lookback = defaults["volume_lookback"]
     volume_ratio: float | None = None
     volume_state: str | None = None
-    try:
-        volume_ratio, volume_state = compute_volume_state(df, lookback=vol_lookback)
-    except ValidationError:
-        pass
+    if arrays.volume is not None:
+        try:
+            volume_ratio, volume_state = _volume_state(arrays.volume, vol_lookback)
+        except ValidationError:
+            pass
 
     vol_window = defaults["vol_window"]
     vol_lb = defaults["vol_lookback"]
     vol_pct: float | None = None
     vol_state: str | None = None
     try:
-        vol_pct, vol_state = compute_volatility_percentile(values, window=vol_window, lookback=vol_lb)
+        vol_pct, vol_state = compute_volatility_percentile(close, window=vol_window, lookback=vol_lb)
     except ValidationError:
         pass
 
@@ -363,6 +432,261 @@ def analyze_indicators(
     )
 
 
+def analyze_indicators_batch(
+    frames: Sequence[pd.DataFrame],
+    column: str = "Close",
+    rsi_period: int = 14,
+    frequency: str = "daily",
+    max_workers: int | None = None,
+) -> list[IndicatorStats]:
+    """Run :func:`analyze_indicators` over many independent OHLCV frames.
+
+    Frames are analyzed concurrently on a thread pool.  The NumPy/SciPy kernels release the
+    GIL, but validation, the rolling MA crossover and the ``pandas_ta`` path run at Python or
+    pandas level, so threads give only partial overlap on large frames.
+
+    :param frames: OHLCV DataFrames, e.g. one per symbol.
+    :param column: Price column to analyze.
+    :param rsi_period: RSI period.
+    :param frequency: Frequency label shared by all frames.
+    :param max_workers: Thread pool size; ``1`` runs sequentially, ``None`` uses the executor default.
+    :return: Indicator statistics in the same order as *frames*.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValidationError("max_workers must be >= 1.")
+
+    def analyze(df: pd.DataFrame) -> IndicatorStats:
+        return analyze_indicators(df, column=column, rsi_period=rsi_period, frequency=frequency)
+
+    if max_workers == 1 or len(frames) < 2:
+        return [analyze(df) for df in frames]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(analyze, frames))
+
+
+class IndicatorsState:
+    """Incrementally updated indicator state for streaming closes.
+
+    RSI and MACD are advanced with O(1) recursions per bar, and the MA crossover is tracked
+    as bars arrive.  Bollinger Bands, volume state, and volatility percentile are evaluated
+    on bounded buffers holding just the tail those indicators read.  Results match
+    :func:`analyze_indicators` with the in-house (non-``pandas_ta``) backend.
+
+    Missing closes or volumes are skipped, mirroring the ``dropna`` in the batch path.
+    """
+
+    def __init__(self, rsi_period: int = 14, frequency: str = "daily") -> None:
+        """Create an empty state.
+
+        :param rsi_period: RSI period.
+        :param frequency: Frequency label used to scale indicator windows.
+        """
+        if rsi_period < 2:
+            raise ValidationError("RSI period must be >= 2.")
+
+        self.rsi_period = rsi_period
+        self.frequency = frequency
+        self._defaults = _intraday_defaults(frequency)
+        # Smoothing weights are fixed per state, so each bar only multiplies and adds.
+        self._rsi_alpha = 1.0 / rsi_period
+        self._rsi_decay = 1.0 - self._rsi_alpha
+        self._fast_alpha = _span_alpha(12)
+        self._fast_decay = 1.0 - self._fast_alpha
+        self._slow_alpha = _span_alpha(26)
+        self._slow_decay = 1.0 - self._slow_alpha
+        self._signal_alpha = _span_alpha(9)
+        self._signal_decay = 1.0 - self._signal_alpha
+
+        self.bars = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._fast_ema = 0.0
+        self._slow_ema = 0.0
+        self._signal = 0.0
+        self._macd_diff = 0.0
+        self._macd_prev_diff = 0.0
+        self._macd_flip_bar: int | None = None
+        self._ma_sign = 0.0
+        self._ma_flip_bar: int | None = None
+
+        d = self._defaults
+        closes_needed = max(4, 2 * d["bb_period"] - 1, d["vol_lookback"] + d["vol_window"], d["ma_slow"])
+        self._closes: deque[float] = deque(maxlen=closes_needed)
+        self._volumes: deque[float] = deque(maxlen=d["volume_lookback"] + 1)
+
+    @classmethod
+    def from_history(
+        cls, df: pd.DataFrame, column: str = "Close", rsi_period: int = 14, frequency: str = "daily"
+    ) -> Self:
+        """Seed a state from historical OHLCV bars.
+
+        :param df: OHLCV DataFrame.
+        :param column: Price column to track.
+        :param rsi_period: RSI period.
+        :param frequency: Frequency label (e.g. ``"daily"``, ``"15min"``).
+        :return: State positioned after the last bar of *df*.
+        """
+        validate_ohlcv_frame(df, required_columns=("Close",))
+        if column not in df.columns:
+            raise ValidationError(f"Column '{column}' does not exist in DataFrame.")
+
+        state = cls(rsi_period=rsi_period, frequency=frequency)
+        # Closes and volumes stay row-aligned: missing entries are kept as NaN and skipped per bar.
+        closes = numeric_values(df[column], dropna=False)
+        if "Volume" in df.columns:
+            volumes = numeric_values(df["Volume"], dropna=False)
+        else:
+            volumes = np.full(closes.size, np.nan)
+        for close, volume in zip(closes.tolist(), volumes.tolist(), strict=True):
+            state.update_close(close, volume)
+        return state
+
+    def update_close(self, close: float, volume: float | None = None) -> None:
+        """Advance the state by one bar.
+
+        :param close: Latest close price.
+        :param volume: Latest volume, if tracked.
+        """
+        if volume is not None and not np.isnan(volume):
+            self._volumes.append(float(volume))
+        if np.isnan(close):
+            return
+
+        close = float(close)
+        if self.bars == 0:
+            self._fast_ema = close
+            self._slow_ema = close
+        else:
+            delta = close - self._closes[-1]
+            gain = max(delta, 0.0)
+            loss = max(-delta, 0.0)
+            if self.bars == 1:
+                self._avg_gain, self._avg_loss = gain, loss
+            else:
+                self._avg_gain = self._rsi_alpha * gain + self._rsi_decay * self._avg_gain
+                self._avg_loss = self._rsi_alpha * loss + self._rsi_decay * self._avg_loss
+            self._fast_ema = self._fast_alpha * close + self._fast_decay * self._fast_ema
+            self._slow_ema = self._slow_alpha * close + self._slow_decay * self._slow_ema
+            macd = self._fast_ema - self._slow_ema
+            self._signal = self._signal_alpha * macd + self._signal_decay * self._signal
+
+        self._closes.append(close)
+        diff = (self._fast_ema - self._slow_ema) - self._signal
+        if diff * self._macd_diff < 0.0:
+            self._macd_flip_bar = self.bars
+        self._macd_prev_diff, self._macd_diff = self._macd_diff, diff
+        self.bars += 1
+        self._update_ma_cross()
+
+    def update(self, close: float, volume: float | None = None) -> IndicatorStats:
+        """Advance the state by one bar and return the refreshed indicators.
+
+        :param close: Latest close price.
+        :param volume: Latest volume, if tracked.
+        :return: Structured indicator statistics.
+        """
+        self.update_close(close, volume)
+        return self.stats()
+
+    def stats(self) -> IndicatorStats:
+        """Return indicator statistics for the bars seen so far.
+
+        :return: Structured indicator statistics.
+        """
+        if self.bars < self.rsi_period + 1:
+            raise ValidationError("Not enough data to compute RSI.")
+        if self.bars < 26 + 9:
+            raise ValidationError("Not enough data to compute MACD.")
+
+        d = self._defaults
+        close_values = np.asarray(self._closes, dtype=np.float64)
+        closes = pd.Series(close_values)
+        rsi_value = _rsi_from_averages(self._avg_gain, self._avg_loss)
+        macd_value = self._fast_ema - self._slow_ema
+
+        direction = "bullish" if self._macd_diff >= 0.0 else "bearish"
+        crossover_days: int | None = None
+        if self._macd_flip_bar is not None:
+            macd_state = direction
+            crossover_days = self.bars - 1 - self._macd_flip_bar
+        else:
+            suffix = "widening" if abs(self._macd_diff) >= abs(self._macd_prev_diff) else "narrowing"
+            macd_state = f"{direction}, {suffix}"
+
+        bb_position: str | None = None
+        bb_squeeze: bool | None = None
+        try:
+            bb_position, bb_squeeze = compute_bollinger(closes, period=d["bb_period"])
+        except ValidationError:
+            pass
+
+        ma_cross: str | None = None
+        ma_cross_days: int | None = None
+        if self.bars >= d["ma_slow"] + 1:
+            ma_cross = "golden cross" if self._ma_sign >= 0.0 else "death cross"
+            if self._ma_flip_bar is not None:
+                ma_cross_days = self.bars - 1 - self._ma_flip_bar
+
+        volume_ratio: float | None = None
+        volume_state: str | None = None
+        if self._volumes:
+            try:
+                volume_frame = pd.DataFrame({"Volume": np.asarray(self._volumes, dtype=np.float64)})
+                volume_ratio, volume_state = compute_volume_state(volume_frame, lookback=d["volume_lookback"])
+            except ValidationError:
+                pass
+
+        vol_pct: float | None = None
+        vol_state: str | None = None
+        try:
+            vol_pct, vol_state = compute_volatility_percentile(
+                closes, window=d["vol_window"], lookback=d["vol_lookback"]
+            )
+        except ValidationError:
+            pass
+
+        return IndicatorStats(
+            rsi_period=self.rsi_period,
+            rsi_value=rsi_value,
+            rsi_state=_classify_rsi(close_values, rsi_value),
+            macd_value=macd_value,
+            macd_signal=self._signal,
+            macd_histogram=macd_value - self._signal,
+            macd_state=macd_state,
+            crossover_days_ago=crossover_days,
+            bb_position=bb_position,
+            bb_squeeze=bb_squeeze,
+            bb_period=d["bb_period"],
+            ma_cross=ma_cross,
+            ma_cross_days_ago=ma_cross_days,
+            ma_fast_period=d["ma_fast"],
+            ma_slow_period=d["ma_slow"],
+            volume_ratio=volume_ratio,
+            volume_state=volume_state,
+            volume_lookback=d["volume_lookback"],
+            volatility_percentile=vol_pct,
+            volatility_state=vol_state,
+            volatility_window=d["vol_window"],
+            volatility_lookback=d["vol_lookback"],
+            frequency=self.frequency,
+        )
+
+    def _update_ma_cross(self) -> None:
+        slow = self._defaults["ma_slow"]
+        if self.bars < slow:
+            return
+
+        window = np.fromiter(islice(reversed(self._closes), slow), dtype=np.float64, count=slow)
+        # Means are taken relative to one sample so flat windows compare exactly equal.
+        origin = window[0]
+        fast_mean = float((window[: self._defaults["ma_fast"]] - origin).mean())
+        slow_mean = float((window - origin).mean())
+        sign = float(np.sign(fast_mean - slow_mean))
+        if sign * self._ma_sign < 0.0:
+            self._ma_flip_bar = self.bars - 1
+        self._ma_sign = sign
+
+
 def describe_indicators(stats: IndicatorStats) -> str:
     """Render indicator statistics as concise narration lines.
 
@@ -405,78 +729,68 @@ def describe_indicators(stats: IndicatorStats) -> str:
     return "\n".join(parts)
 
 
-def _classify_rsi(values: pd.Series, rsi_value: float) -> str:
-    if rsi_value >= 70.0:
-        return "overbought"
-    if rsi_value <= 30.0:
-        return "oversold"
+def _classify_rsi(values: np.ndarray, rsi_value: float) -> str:
+    state = _band_label(rsi_value, _RSI_BOUNDS, _RSI_LABELS)
+    if state:
+        return state
 
-    recent = values.tail(4)
-    if recent.size >= 2 and float(recent.iloc[-1]) >= float(recent.iloc[0]):
+    recent = values[-4:]
+    if recent.size >= 2 and recent[-1] >= recent[0]:
         return "neutral-bullish"
     return "neutral-bearish"
 
 
-def _classify_macd(values: pd.Series) -> tuple[str, int | None]:
-    fast_ema = values.ewm(span=12, adjust=False).mean()
-    slow_ema = values.ewm(span=26, adjust=False).mean()
-    return _classify_macd_lines(fast_ema - slow_ema, (fast_ema - slow_ema).ewm(span=9, adjust=False).mean())
-
-
-def _classify_macd_lines(macd_line: pd.Series, signal_line: pd.Series) -> tuple[str, int | None]:
-    aligned = pd.concat(
-        [
-            pd.to_numeric(macd_line, errors="coerce"),
-            pd.to_numeric(signal_line, errors="coerce"),
-        ],
-        axis=1,
-    ).dropna()
-    if aligned.empty:
+def _classify_macd_lines(
+    macd_line: np.ndarray | pd.Series, signal_line: np.ndarray | pd.Series
+) -> tuple[str, int | None]:
+    macd_values = np.asarray(macd_line, dtype=np.float64)
+    signal_values = np.asarray(signal_line, dtype=np.float64)
+    finite = np.isfinite(macd_values) & np.isfinite(signal_values)
+    diff = macd_values[finite] - signal_values[finite]
+    if diff.size == 0:
         return "neutral", None
 
-    diff = aligned.iloc[:, 0] - aligned.iloc[:, 1]
+    direction = "bullish" if float(diff[-1]) >= 0.0 else "bearish"
 
-    direction = "bullish" if float(diff.iloc[-1]) >= 0.0 else "bearish"
+    days_ago = _bars_since_sign_flip(diff)
+    if days_ago is not None:
+        return direction, days_ago
 
-    signs = np.sign(diff.to_numpy())
-    for idx in range(signs.size - 1, 0, -1):
-        if signs[idx] == 0.0:
-            continue
-        if signs[idx - 1] == 0.0:
-            continue
-        if signs[idx] != signs[idx - 1]:
-            days_ago = signs.size - 1 - idx
-            return direction, days_ago
-
-    widening = abs(float(diff.iloc[-1])) >= abs(float(diff.iloc[-2])) if diff.size >= 2 else True
+    widening = abs(float(diff[-1])) >= abs(float(diff[-2])) if diff.size >= 2 else True
     suffix = "widening" if widening else "narrowing"
     return f"{direction}, {suffix}", None
 
 
-def _compute_rsi_with_pandas_ta(values: pd.Series, period: int) -> float:
-    if ta is None:  # pragma: no cover
-        return compute_rsi(values, period=period)
+def _line_values(line: pd.Series) -> np.ndarray:
+    return np.asarray(pd.to_numeric(line, errors="coerce"), dtype=np.float64)
 
-    rsi = ta.rsi(values, length=period)
-    if rsi is None:
-        return compute_rsi(values, period=period)
-    rsi_numeric = pd.to_numeric(rsi, errors="coerce").dropna()
-    if rsi_numeric.empty:
+
+def _last_valid(values: np.ndarray) -> float | None:
+    """Return the last non-NaN value of an indicator line without materializing a filtered copy."""
+    valid = np.flatnonzero(~np.isnan(values))
+    return float(values[valid[-1]]) if valid.size else None
+
+
+def _compute_rsi_with_pandas_ta(ta_module: Any, values: pd.Series, period: int) -> float:
+    rsi = ta_module.rsi(values, length=period)
+    latest = None if rsi is None else _last_valid(_line_values(rsi))
+    if latest is None:
         return compute_rsi(values, period=period)
-    return float(rsi_numeric.iloc[-1])
+    return latest
 
 
-def _macd_fallback(values: pd.Series) -> tuple[float, float, float, str, int | None]:
-    macd_value, signal_value, histogram = compute_macd(values)
-    macd_state, crossover_days = _classify_macd(values)
+def _macd_fallback(values: np.ndarray) -> tuple[float, float, float, str, int | None]:
+    # One MACD pass feeds both the reported values and the crossover classification.
+    macd_line, signal_line = _macd_lines(values)
+    macd_state, crossover_days = _classify_macd_lines(macd_line, signal_line)
+    macd_value = float(macd_line[-1])
+    signal_value = float(signal_line[-1])
+    histogram = macd_value - signal_value
     return macd_value, signal_value, histogram, macd_state, crossover_days
 
 
-def _compute_macd_with_pandas_ta(values: pd.Series) -> tuple[float, float, float, str, int | None]:
-    if ta is None:  # pragma: no cover
-        return _macd_fallback(values)
-
-    macd_frame = ta.macd(values, fast=12, slow=26, signal=9)
+def _compute_macd_with_pandas_ta(ta_module: Any, values: pd.Series) -> tuple[float, float, float, str, int | None]:
+    macd_frame = ta_module.macd(values, fast=12, slow=26, signal=9)
     if macd_frame is None or macd_frame.empty:
         return _macd_fallback(values)
 
@@ -487,20 +801,17 @@ def _compute_macd_with_pandas_ta(values: pd.Series) -> tuple[float, float, float
     if macd_col is None or signal_col is None or hist_col is None:
         return _macd_fallback(values)
 
-    macd_series = pd.to_numeric(macd_frame[macd_col], errors="coerce").dropna()
-    signal_series = pd.to_numeric(macd_frame[signal_col], errors="coerce").dropna()
-    hist_series = pd.to_numeric(macd_frame[hist_col], errors="coerce").dropna()
-    if macd_series.empty or signal_series.empty or hist_series.empty:
+    macd_line = _line_values(macd_frame[macd_col])
+    signal_line = _line_values(macd_frame[signal_col])
+    macd_value = _last_valid(macd_line)
+    signal_value = _last_valid(signal_line)
+    histogram = _last_valid(_line_values(macd_frame[hist_col]))
+    if macd_value is None or signal_value is None or histogram is None:
         return _macd_fallback(values)
 
-    macd_state, crossover_days = _classify_macd_lines(macd_series, signal_series)
-    return (
-        float(macd_series.iloc[-1]),
-        float(signal_series.iloc[-1]),
-        float(hist_series.iloc[-1]),
-        macd_state,
-        crossover_days,
-    )
+    # The unfiltered lines stay row-aligned; the classifier masks NaNs pairwise.
+    macd_state, crossover_days = _classify_macd_lines(macd_line, signal_line)
+    return macd_value, signal_value, histogram, macd_state, crossover_days
 
 
 def _format_ordinal(value: float) -> str:
@@ -1,22 +1,15 @@
 """Chart pattern and candlestick pattern detection."""
 
-import importlib
 from datetime import date
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from narrata.analysis import _pandas_ta
 from narrata.exceptions import ValidationError
 from narrata.types import PatternStats
-from narrata.validation import validate_ohlcv_frame
-
-ta: Any | None
-try:
-    importlib.import_module("importlib.metadata")
-    import pandas_ta as ta
-except ImportError:  # pragma: no cover - optional dependency path
-    ta = None
+from narrata.validation import numeric_values, validate_ohlcv_frame
 
 
 def detect_patterns(df: pd.DataFrame, lookback: int = 60) -> PatternStats:
@@ -30,8 +23,10 @@ def detect_patterns(df: pd.DataFrame, lookback: int = 60) -> PatternStats:
     if lookback < 10:
         raise ValidationError("lookback must be >= 10.")
 
-    chart_pattern, chart_since = detect_chart_pattern(df, lookback=lookback)
-    candle_pattern, candle_date = detect_candlestick_pattern(df)
+    # Coerce the OHLC columns once and share the block between both detectors.
+    ohlc = _ohlc_values(df)
+    chart_pattern, chart_since = _chart_pattern(ohlc[-lookback:, 1], ohlc[-lookback:, 2], df.index[-lookback:])
+    candle_pattern, candle_date = _candlestick_pattern(ohlc, df.index) if ohlc.shape[0] >= 2 else (None, None)
     return PatternStats(
         chart_pattern=chart_pattern,
         chart_pattern_since=chart_since,
@@ -50,26 +45,63 @@ def detect_chart_pattern(df: pd.DataFrame, lookback: int = 60) -> tuple[str | No
     if "High" not in df.columns or "Low" not in df.columns or "Close" not in df.columns:
         raise ValidationError("DataFrame must contain High, Low and Close columns.")
 
-    window = df.tail(lookback).copy()
-    highs = pd.to_numeric(window["High"], errors="coerce").dropna()
-    lows = pd.to_numeric(window["Low"], errors="coerce").dropna()
-    if highs.size < 5 or lows.size < 5:
+    window = df.tail(lookback)
+    return _chart_pattern(
+        numeric_values(window["High"], dropna=False),
+        numeric_values(window["Low"], dropna=False),
+        window.index,
+    )
+
+
+def _chart_pattern(highs: np.ndarray, lows: np.ndarray, index: pd.Index) -> tuple[str | None, date | None]:
+    """Detect an ascending triangle from window *highs* and *lows* (NaN where missing)."""
+    high_positions = np.flatnonzero(~np.isnan(highs))
+    low_positions = np.flatnonzero(~np.isnan(lows))
+    if high_positions.size < 5 or low_positions.size < 5:
         return None, None
 
-    resistance = highs.quantile(0.85)
-    high_band = highs[(highs >= resistance * 0.99) & (highs <= resistance * 1.01)]
-    if high_band.size < 2:
+    high_values = highs[high_positions]
+    resistance = _quantile(high_values, 0.85)
+    band_mask = (high_values >= resistance * 0.99) & (high_values <= resistance * 1.01)
+    if np.count_nonzero(band_mask) < 2:
         return None, None
 
-    low_x = np.arange(lows.size, dtype=float)
-    slope, _ = np.polyfit(low_x, lows.to_numpy(dtype=float), 1)
-    if slope <= 0:
+    if _trend_slope(lows[low_positions]) <= 0:
         return None, None
 
-    start_idx = min(high_band.index.min(), lows.index.min())
+    start_idx = min(index[high_positions[band_mask]].min(), index[low_positions].min())
     return "Ascending triangle", pd.Timestamp(start_idx).date()
 
 
+def _quantile(values: np.ndarray, q: float) -> float:
+    """Return the linearly interpolated *q* quantile of *values*, as ``Series.quantile`` does.
+
+    Only the two order statistics around the rank are selected with :func:`np.partition`,
+    instead of sorting the whole window.
+    """
+    rank = q * (values.size - 1)
+    lo = int(rank)
+    hi = min(lo + 1, values.size - 1)
+    selected = np.partition(values, (lo, hi))
+    below, above = float(selected[lo]), float(selected[hi])
+    # Same interpolation form as NumPy's "linear" method, so results match bit for bit.
+    weight = rank - lo
+    if weight >= 0.5:
+        return above - (above - below) * (1.0 - weight)
+    return below + (above - below) * weight
+
+
+def _trend_slope(values: np.ndarray) -> float:
+    """Return the least-squares slope of *values* against their positions ``0..n-1``.
+
+    Closed form of a degree-1 fit: for ``x = arange(n)`` the centred sum of squares is
+    ``n * (n**2 - 1) / 12``, so no design matrix or ``lstsq`` solve is needed.
+    """
+    n = values.size
+    offsets = np.arange(n, dtype=np.float64) - (n - 1) / 2.0
+    return float(offsets @ (values - values.mean())) / (n * (n * n - 1) / 12.0)
+
+
 def detect_candlestick_pattern(df: pd.DataFrame) -> tuple[str | None, date | None]:
     """Detect candlestick patterns using optional backend and in-house fallback.
 
@@ -82,30 +114,48 @@ def detect_candlestick_pattern(df: pd.DataFrame) -> tuple[str | None, date | Non
     if df.shape[0] < 2:
         return None, None
 
-    if ta is not None and "High" in df.columns and "Low" in df.columns:
-        detected = _detect_candlestick_with_pandas_ta(df)
+    if "High" not in df.columns or "Low" not in df.columns:
+        raise ValidationError("DataFrame must contain High and Low columns for in-house candlestick detection.")
+
+    return _candlestick_pattern(_ohlc_values(df), df.index)
+
+
+def _candlestick_pattern(ohlc: np.ndarray, index: pd.Index) -> tuple[str | None, date | None]:
+    """Run the optional pandas_ta backend, then the in-house scan, on an ``(n, 4)`` OHLC block."""
+    ta_module = _pandas_ta.load()
+    if ta_module is not None:
+        detected = _detect_candlestick_with_pandas_ta(ta_module, ohlc, index)
         if detected[0] is not None:
             return detected
 
-    return _detect_candlestick_inhouse(df)
+    return _detect_candlestick_inhouse(ohlc, index)
 
 
-def _detect_candlestick_with_pandas_ta(df: pd.DataFrame) -> tuple[str | None, date | None]:
+_OHLC_COLUMNS: list[str] = ["Open", "High", "Low", "Close"]
+
+
+def _ohlc_values(df: pd.DataFrame) -> np.ndarray:
+    """Return the Open/High/Low/Close columns as an ``(n, 4)`` float64 array, NaN where non-numeric."""
+    columns = df[_OHLC_COLUMNS]
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in columns.dtypes):
+        columns = columns.apply(pd.to_numeric, errors="coerce")
+    return np.asarray(columns.to_numpy(dtype=np.float64, na_value=np.nan), dtype=np.float64)
+
+
+def _detect_candlestick_with_pandas_ta(
+    ta_module: Any, ohlc: np.ndarray, index: pd.Index
+) -> tuple[str | None, date | None]:
     names: list[str] = ["doji", "inside"]
-    if bool(getattr(ta, "Imports", {}).get("talib", False)):
+    if bool(getattr(ta_module, "Imports", {}).get("talib", False)):
         names.append("engulfing")
 
-    clean = df[["Open", "High", "Low", "Close"]].apply(pd.to_numeric, errors="coerce").dropna()
-    if clean.shape[0] < 2:
+    valid = ~np.isnan(ohlc).any(axis=1)
+    if np.count_nonzero(valid) < 2:
         return None, None
 
-    patterns = ta.cdl_pattern(  # type: ignore[union-attr]
-        clean["Open"],
-        clean["High"],
-        clean["Low"],
-        clean["Close"],
-        name=names,
-    )
+    clean_index = index[valid]
+    open_, high, low, close = (pd.Series(column, index=clean_index) for column in ohlc[valid].T)
+    patterns = ta_module.cdl_pattern(open_, high, low, close, name=names)
     if patterns is None or patterns.empty:
         return None, None
 
@@ -137,51 +187,54 @@ def _map_candlestick_name(pattern_col: str, score: float) -> str:
     return normalized
 
 
-def _detect_candlestick_inhouse(df: pd.DataFrame) -> tuple[str | None, date | None]:
-    if "High" not in df.columns or "Low" not in df.columns:
-        raise ValidationError("DataFrame must contain High and Low columns for in-house candlestick detection.")
-    if df.shape[0] < 2:
+def _detect_candlestick_inhouse(ohlc: np.ndarray, index: pd.Index) -> tuple[str | None, date | None]:
+    # Scan the last 60 bars, skipping rows with a missing price.
+    recent = ohlc[-60:]
+    valid = ~np.isnan(recent).any(axis=1)
+    if np.count_nonzero(valid) < 2:
         return None, None
 
-    window = df.tail(60)[["Open", "High", "Low", "Close"]].apply(pd.to_numeric, errors="coerce").dropna()
-    if window.shape[0] < 2:
+    window = recent[valid]
+    idx, pattern_id = _scan_candles(window[:, 0], window[:, 1], window[:, 2], window[:, 3], doji_threshold=0.10)
+    if idx < 0:
         return None, None
+    # Map the row back to a position in the full index without building sliced Index objects.
+    position = ohlc.shape[0] - recent.shape[0] + int(np.flatnonzero(valid)[idx])
+    return _CANDLE_NAMES[pattern_id], pd.Timestamp(index[position]).date()
+
+
+_CANDLE_NAMES: tuple[str, ...] = ("Bullish Engulfing", "Bearish Engulfing", "Inside Bar", "Doji")
 
-    open_series = window["Open"]
-    high_series = window["High"]
-    low_series = window["Low"]
-    close_series = window["Close"]
-
-    doji_threshold = 0.10
-    for idx in range(window.shape[0] - 1, 0, -1):
-        prev_open = float(open_series.iloc[idx - 1])
-        prev_high = float(high_series.iloc[idx - 1])
-        prev_low = float(low_series.iloc[idx - 1])
-        prev_close = float(close_series.iloc[idx - 1])
-
-        curr_open = float(open_series.iloc[idx])
-        curr_high = float(high_series.iloc[idx])
-        curr_low = float(low_series.iloc[idx])
-        curr_close = float(close_series.iloc[idx])
-
-        # Engulfing patterns first - these are generally stronger signals.
-        if prev_close < prev_open and curr_close > curr_open and curr_open <= prev_close and curr_close >= prev_open:
-            return "Bullish Engulfing", pd.Timestamp(window.index[idx]).date()
-
-        if prev_close > prev_open and curr_close < curr_open and curr_open >= prev_close and curr_close <= prev_open:
-            return "Bearish Engulfing", pd.Timestamp(window.index[idx]).date()
-
-        # Inside bar: current range fully within previous range.
-        if curr_high <= prev_high and curr_low >= prev_low:
-            return "Inside Bar", pd.Timestamp(window.index[idx]).date()
-
-        # Doji: open and close are very close relative to candle range.
-        candle_range = max(curr_high - curr_low, 1e-9)
-        body = abs(curr_close - curr_open)
-        if body / candle_range <= doji_threshold:
-            return "Doji", pd.Timestamp(window.index[idx]).date()
-
-    return None, None
+
+def _scan_candles(
+    opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, doji_threshold: float
+) -> tuple[int, int]:
+    """Return ``(row, pattern id)`` of the newest candle matching a pattern, or ``(-1, 0)``.
+
+    Pattern ids index :data:`_CANDLE_NAMES`, in priority order: when several patterns match
+    the same candle, the first one wins.
+    """
+    prev_open, prev_high, prev_low, prev_close = opens[:-1], highs[:-1], lows[:-1], closes[:-1]
+    curr_open, curr_high, curr_low, curr_close = opens[1:], highs[1:], lows[1:], closes[1:]
+
+    # Inside bars and dojis fire on most candles, so find the newest of those first.
+    inside = (curr_high <= prev_high) & (curr_low >= prev_low)
+    doji = np.abs(curr_close - curr_open) / np.maximum(curr_high - curr_low, 1e-9) <= doji_threshold
+    common_rows = np.flatnonzero(inside | doji)
+    first = int(common_rows[-1]) if common_rows.size else 0
+
+    # Engulfing patterns outrank them, but only candles from that row on can still be the newest hit.
+    po, pc, co, cc = prev_open[first:], prev_close[first:], curr_open[first:], curr_close[first:]
+    bullish = (pc < po) & (cc > co) & (co <= pc) & (cc >= po)
+    bearish = (pc > po) & (cc < co) & (co >= pc) & (cc <= po)
+    engulfing_rows = np.flatnonzero(bullish | bearish)
+    if engulfing_rows.size:
+        offset = int(engulfing_rows[-1])
+        return first + offset + 1, 0 if bullish[offset] else 1
+
+    if common_rows.size == 0:
+        return -1, 0
+    return first + 1, 2 if inside[first] else 3
 
 
 def describe_patterns(stats: PatternStats) -> str | None:
@@ -4,14 +4,16 @@ Uses change-point detection from ruptures when available, with a robust
 rolling-statistics fallback when ruptures is not installed.
 """
 
-from datetime import date
+from datetime import date, datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from narrata.analysis.changepoints import pelt_breakpoints
 from narrata.exceptions import ValidationError
 from narrata.types import RegimeStats
-from narrata.validation import validate_ohlcv_frame
+from narrata.validation import numeric_values, validate_ohlcv_frame
 
 try:
     import ruptures as _rpt
@@ -43,8 +45,14 @@ def analyze_regime(
     if window < 5:
         raise ValidationError("window must be >= 5.")
 
-    prices = pd.to_numeric(df[column], errors="coerce").dropna()
-    returns = prices.pct_change().dropna()
+    raw = numeric_values(df[column], dropna=False)
+    valid = ~np.isnan(raw)
+    prices = raw[valid]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        changes = prices[1:] / prices[:-1] - 1.0
+    # Keep the dates of each return's closing bar; 0/0 returns are dropped like ``dropna`` did.
+    defined = ~np.isnan(changes)
+    returns = pd.Series(changes[defined], index=df.index[valid][1:][defined])
     if returns.size < window:
         raise ValidationError("Not enough data to infer regime.")
 
@@ -86,12 +94,11 @@ def _analyze_with_ruptures(
     min_size: int,
     rpt_module: Any,
 ) -> tuple[str, str, date]:
-    signal = returns.to_numpy(dtype=float).reshape(-1, 1)
-    algo = rpt_module.Pelt(model="rbf", min_size=max(10, min_size)).fit(signal)
-    bkpts = algo.predict(pen=max(penalty, 0.1))
+    signal = returns.to_numpy(dtype=float)
+    bkpts = pelt_breakpoints(rpt_module, signal, min_size=max(10, min_size), penalty=max(penalty, 0.1))
 
     last_start = bkpts[-2] if len(bkpts) > 1 else 0
-    last_end = bkpts[-1] if bkpts else signal.shape[0]
+    last_end = bkpts[-1] if bkpts else signal.size
     segment = returns.iloc[last_start:last_end]
     if segment.empty:
         segment = returns
@@ -108,24 +115,54 @@ def _analyze_with_ruptures(
 
 
 def _analyze_with_rolling(returns: pd.Series, window: int, trend_threshold: float) -> tuple[str, str, date]:
-    rolling_mean = returns.rolling(window=window, min_periods=window).mean().dropna()
-    rolling_std = returns.rolling(window=window, min_periods=window).std(ddof=0).dropna()
-    if rolling_mean.empty or rolling_std.empty:
+    values = returns.to_numpy(dtype=np.float64)
+    if values.size < window:
         raise ValidationError("Not enough data to infer regime.")
 
-    vol_baseline = float(rolling_std.median())
-    current_trend = _trend_label(float(rolling_mean.iloc[-1]), trend_threshold)
-    current_volatility = "high" if float(rolling_std.iloc[-1]) > vol_baseline else "low"
+    rolling_mean, rolling_std = _rolling_mean_std(values, window)
+    # Rolling value i covers returns[i : i + window] and is stamped with its last bar.
+    index = returns.index[window - 1 :]
 
-    start_ts = rolling_mean.index[-1]
-    for idx in range(rolling_mean.size - 1, -1, -1):
-        trend = _trend_label(float(rolling_mean.iloc[idx]), trend_threshold)
-        volatility = "high" if float(rolling_std.iloc[idx]) > vol_baseline else "low"
-        if trend != current_trend or volatility != current_volatility:
-            break
-        start_ts = rolling_mean.index[idx]
+    vol_baseline = float(np.median(rolling_std))
+    current_trend = _trend_label(float(rolling_mean[-1]), trend_threshold)
+    current_volatility = "high" if float(rolling_std[-1]) > vol_baseline else "low"
 
-    return current_trend, current_volatility, _to_date(start_ts)
+    # Encode each point's (trend, volatility) pair as one integer; the regime started right
+    # after the latest point whose code differs from the current one.
+    trend_codes = (rolling_mean > trend_threshold).astype(np.int8) - (rolling_mean < -trend_threshold)
+    regime_codes = 2 * trend_codes + (rolling_std > vol_baseline)
+    changed = np.flatnonzero(regime_codes != regime_codes[-1])
+    start = int(changed[-1]) + 1 if changed.size else 0
+
+    return current_trend, current_volatility, _to_date(index[start])
+
+
+def _rolling_mean_std(values: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the rolling mean and population standard deviation of every full window.
+
+    Both come from prefix sums, so each is one pass over *values* regardless of *window*.
+    Values are centred on their overall mean first to keep the sum-of-squares cancellation
+    small (variance is shift-invariant), and windows of identical values get an exact zero
+    standard deviation, as pandas' rolling ``std`` reports.
+    """
+    offset = values.mean()
+    centered = values - offset
+    # Row 0 holds prefix sums of the values, row 1 of their squares; both written in place.
+    prefix = np.zeros((2, values.size + 1))
+    np.cumsum(centered, out=prefix[0, 1:])
+    np.multiply(centered, centered, out=centered)
+    np.cumsum(centered, out=prefix[1, 1:])
+    moments = prefix[:, window:] - prefix[:, :-window]
+    moments /= window
+    window_mean, variance = moments
+    variance -= window_mean * window_mean
+
+    # Count value changes so a window with none can be detected from one more prefix sum.
+    changes = np.concatenate(([0], np.cumsum(values[1:] != values[:-1])))
+    variance[changes[window - 1 :] == changes[: changes.size - window + 1]] = 0.0
+    np.maximum(variance, 0.0, out=variance)
+    window_mean += offset
+    return window_mean, np.sqrt(variance, out=variance)
 
 
 def _trend_label(mean_return: float, threshold: float) -> str:
@@ -137,8 +174,9 @@ def _trend_label(mean_return: float, threshold: float) -> str:
 
 
 def _to_date(value: object) -> date:
-    if isinstance(value, pd.Timestamp):
-        return date.fromisoformat(value.strftime("%Y-%m-%d"))
+    # Timestamps are datetimes, which are dates too, so check the narrower type first.
+    if isinstance(value, datetime):
+        return value.date()
     if isinstance(value, date):
         return value
     raise TypeError(f"Cannot convert {type(value).__name__} to date.")
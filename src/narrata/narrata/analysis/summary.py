@@ -2,11 +2,12 @@
 
 import math
 
+import numpy as np
 import pandas as pd
 
 from narrata.exceptions import ValidationError
 from narrata.types import SummaryStats
-from narrata.validation.ohlcv import VALID_FREQUENCIES, infer_frequency_label, validate_ohlcv_frame
+from narrata.validation.ohlcv import VALID_FREQUENCIES, infer_frequency_label, numeric_values, validate_ohlcv_frame
 
 
 def analyze_summary(
@@ -32,12 +33,15 @@ def analyze_summary(
     if column not in df.columns:
         raise ValidationError(f"Column '{column}' does not exist in DataFrame.")
 
-    series = pd.to_numeric(df[column], errors="coerce").dropna()
-    if series.empty:
+    raw = numeric_values(df[column], dropna=False)
+    positions = np.flatnonzero(~np.isnan(raw))
+    if positions.size == 0:
         raise ValidationError(f"Column '{column}' contains no numeric values.")
+    values = raw if positions.size == raw.size else raw[positions]
 
-    start = float(series.iloc[0])
-    end = float(series.iloc[-1])
+    start = float(values[0])
+    end = float(values[-1])
+    mean, std = _mean_std(values)
 
     if start == 0.0:
         change_pct = math.nan
@@ -47,20 +51,32 @@ def analyze_summary(
     return SummaryStats(
         ticker=_resolve_ticker(df, ticker),
         column=column,
-        points=int(series.size),
+        points=int(values.size),
         frequency=frequency or infer_frequency_label(df.index),
-        start_date=series.index[0].date(),
-        end_date=series.index[-1].date(),
+        start_date=df.index[positions[0]].date(),
+        end_date=df.index[positions[-1]].date(),
         start=start,
         end=end,
-        minimum=float(series.min()),
-        maximum=float(series.max()),
-        mean=float(series.mean()),
-        std=float(series.std(ddof=0)),
+        minimum=float(values.min()),
+        maximum=float(values.max()),
+        mean=mean,
+        std=std,
         change_pct=change_pct,
     )
 
 
+def _mean_std(values: np.ndarray) -> tuple[float, float]:
+    """Return the mean and population standard deviation of *values*.
+
+    The mean is computed once and reused for the deviations, whose sum of squares is a single
+    dot product. The naive ``E[x**2] - E[x]**2`` form would save another pass, but it loses all
+    precision when the spread is tiny compared with the price level.
+    """
+    mean = float(values.mean())
+    centered = values - mean
+    return mean, math.sqrt(float(centered @ centered) / values.size)
+
+
 def describe_summary(
     summary: SummaryStats, currency_symbol: str = "", precision: int = 2, include_header: bool = True
 ) -> str:
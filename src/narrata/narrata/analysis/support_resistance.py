@@ -2,11 +2,11 @@
 
 import numpy as np
 import pandas as pd
-from scipy.signal import argrelextrema
+from scipy.ndimage import maximum_filter1d, minimum_filter1d
 
 from narrata.exceptions import ValidationError
 from narrata.types import LevelStats, PriceLevel
-from narrata.validation import validate_ohlcv_frame
+from narrata.validation import numeric_values, validate_ohlcv_frame
 
 
 def find_support_resistance(
@@ -35,30 +35,30 @@ def find_support_resistance(
     if extrema_order < 1:
         raise ValidationError("extrema_order must be >= 1.")
 
-    prices = pd.to_numeric(df[column], errors="coerce").dropna().to_numpy(dtype=float)
+    prices = numeric_values(df[column])
     if prices.size < extrema_order * 2 + 3:
         raise ValidationError("Not enough data to find support/resistance.")
 
-    minima_indices = argrelextrema(prices, np.less_equal, order=extrema_order)[0]
-    maxima_indices = argrelextrema(prices, np.greater_equal, order=extrema_order)[0]
+    minima_indices, maxima_indices = _local_extrema(prices, extrema_order)
     current_price = float(prices[-1])
     tolerance = max(current_price * tolerance_ratio, 1e-9)
 
-    support_values = [float(prices[idx]) for idx in minima_indices if prices[idx] <= current_price]
-    resistance_values = [float(prices[idx]) for idx in maxima_indices if prices[idx] >= current_price]
+    minima_values = prices[minima_indices]
+    maxima_values = prices[maxima_indices]
+    sorted_prices = np.sort(prices)
 
     supports = _build_levels(
-        candidate_values=support_values,
-        extrema_values=np.asarray([prices[idx] for idx in minima_indices], dtype=float),
-        all_prices=prices,
+        candidate_values=minima_values[minima_values <= current_price],
+        extrema_values=minima_values,
+        sorted_prices=sorted_prices,
         tolerance=tolerance,
         max_levels=max_levels,
         reverse=True,
     )
     resistances = _build_levels(
-        candidate_values=resistance_values,
-        extrema_values=np.asarray([prices[idx] for idx in maxima_indices], dtype=float),
-        all_prices=prices,
+        candidate_values=maxima_values[maxima_values >= current_price],
+        extrema_values=maxima_values,
+        sorted_prices=sorted_prices,
         tolerance=tolerance,
         max_levels=max_levels,
         reverse=False,
@@ -80,25 +80,39 @@ def describe_support_resistance(stats: LevelStats, currency_symbol: str = "", pr
     return f"Support: {support_text}  Resistance: {resistance_text}"
 
 
+def _local_extrema(prices: np.ndarray, order: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return indices of prices that are <= / >= every neighbour within *order* bars.
+
+    Equivalent to ``argrelextrema(prices, np.less_equal / np.greater_equal, order=order)``
+    (edges compare against clipped neighbours), but a point qualifies exactly when it equals
+    its window minimum or maximum, and the running min/max filters are O(n) instead of
+    ``order`` shifted comparison passes.
+    """
+    size = 2 * order + 1
+    minima = np.flatnonzero(prices == minimum_filter1d(prices, size, mode="nearest"))
+    maxima = np.flatnonzero(prices == maximum_filter1d(prices, size, mode="nearest"))
+    return minima, maxima
+
+
 def _build_levels(
-    candidate_values: list[float],
+    candidate_values: np.ndarray,
     extrema_values: np.ndarray,
-    all_prices: np.ndarray,
+    sorted_prices: np.ndarray,
     tolerance: float,
     max_levels: int,
     reverse: bool,
 ) -> tuple[PriceLevel, ...]:
-    if not candidate_values:
+    if candidate_values.size == 0:
         return ()
 
-    clusters = _cluster_values(candidate_values, tolerance=tolerance, reverse=reverse)
-    levels: list[PriceLevel] = []
-    for cluster in clusters:
-        level_price = float(np.mean(cluster))
-        touches_extrema = int(np.sum(np.abs(extrema_values - level_price) <= tolerance))
-        touches_band = int(np.sum(np.abs(all_prices - level_price) <= tolerance))
-        touches = max(touches_extrema, touches_band)
-        levels.append(PriceLevel(price=level_price, touches=touches))
+    level_prices = np.asarray(_cluster_means(candidate_values, tolerance=tolerance, reverse=reverse))
+    touches_extrema = _band_counts(np.sort(extrema_values), level_prices, tolerance)
+    touches_band = _band_counts(sorted_prices, level_prices, tolerance)
+    touches = np.maximum(touches_extrema, touches_band)
+    levels = [
+        PriceLevel(price=price, touches=count)
+        for price, count in zip(level_prices.tolist(), touches.tolist(), strict=True)
+    ]
 
     if reverse:
         levels.sort(key=lambda level: (level.touches, level.price), reverse=True)
@@ -107,19 +121,57 @@ def _build_levels(
     return tuple(levels[:max_levels])
 
 
-def _cluster_values(values: list[float], tolerance: float, reverse: bool) -> list[list[float]]:
-    ordered = sorted(values, reverse=reverse)
-    clusters: list[list[float]] = []
-    for value in ordered:
-        matched = False
-        for cluster in clusters:
-            if abs(value - float(np.mean(cluster))) <= tolerance:
-                cluster.append(value)
-                matched = True
-                break
-        if not matched:
-            clusters.append([value])
-    return clusters
+def _band_counts(sorted_values: np.ndarray, levels: np.ndarray, tolerance: float) -> np.ndarray:
+    """Count entries of *sorted_values* with ``abs(value - level) <= tolerance`` for each level.
+
+    Two binary searches bound each band in O(C log N) instead of an N x C comparison matrix.
+    The searched edges ``level -/+ tolerance`` round differently from ``value - level``, so
+    each edge is nudged until it agrees with the exact predicate, which is monotone in *value*.
+    """
+    lower = np.searchsorted(sorted_values, levels - tolerance, side="left")
+    upper = np.searchsorted(sorted_values, levels + tolerance, side="right")
+    size = sorted_values.size
+    counts = np.empty(levels.size, dtype=np.int64)
+    for i, level in enumerate(levels.tolist()):
+        lo = int(lower[i])
+        hi = int(upper[i])
+        while lo > 0 and abs(sorted_values[lo - 1] - level) <= tolerance:
+            lo -= 1
+        while lo < hi and abs(sorted_values[lo] - level) > tolerance:
+            lo += 1
+        while hi < size and abs(sorted_values[hi] - level) <= tolerance:
+            hi += 1
+        while hi > lo and abs(sorted_values[hi - 1] - level) > tolerance:
+            hi -= 1
+        counts[i] = hi - lo
+    return counts
+
+
+def _cluster_means(values: np.ndarray, tolerance: float, reverse: bool) -> list[float]:
+    """Group sorted *values* into clusters within *tolerance* of their running mean.
+
+    Once a value starts a new cluster, every later value lies even further from the older
+    clusters, so a single sweep comparing against the current cluster is enough.
+
+    :return: Mean of each cluster, in sweep order.
+    """
+    ordered = np.sort(values)
+    if reverse:
+        ordered = ordered[::-1]
+    means: list[float] = []
+    total = 0.0
+    count = 0
+    for value in ordered.tolist():
+        if count and abs(value - total / count) <= tolerance:
+            total += value
+            count += 1
+            continue
+        if count:
+            means.append(total / count)
+        total = value
+        count = 1
+    means.append(total / count)
+    return means
 
 
 def _format_levels(levels: tuple[PriceLevel, ...], currency_symbol: str, precision: int) -> str:
@@ -13,15 +13,17 @@ References:
 """
 
 import warnings
-from statistics import NormalDist
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
 import pandas as pd
+from scipy.special import ndtri
 
+from narrata.analysis.changepoints import pelt_breakpoints
 from narrata.exceptions import ValidationError
 from narrata.types import SymbolicStats
-from narrata.validation import validate_ohlcv_frame
+from narrata.validation import numeric_values, validate_ohlcv_frame
 
 try:
     import ruptures as _rpt
@@ -62,7 +64,7 @@ def sax_encode(df: pd.DataFrame, column: str = "Close", word_size: int = 16, alp
     if alphabet_size < 2 or alphabet_size > 26:
         raise ValidationError("alphabet_size must be between 2 and 26.")
 
-    values = pd.to_numeric(df[column], errors="coerce").dropna().to_numpy(dtype=float)
+    values = numeric_values(df[column])
     if values.size < word_size:
         raise ValidationError("Not enough data points for requested word_size.")
 
@@ -100,35 +102,51 @@ def _sax_encode_with_tslearn(values: np.ndarray, word_size: int, alphabet_size:
         scale=True,
     )
     transformed = model.fit_transform(values.reshape(1, -1, 1))
-    symbol_indices = transformed.reshape(-1).astype(int)
-    return "".join(chr(ord("a") + int(index)) for index in symbol_indices)
+    return _symbols(transformed.reshape(-1).astype(np.intp))
 
 
 def _sax_encode_inhouse(values: np.ndarray, word_size: int, alphabet_size: int) -> str:
     normalized = _z_normalize(values)
     paa = _piecewise_aggregate(normalized, segments=word_size)
     breakpoints = _gaussian_breakpoints(alphabet_size)
-    symbol_indices = np.searchsorted(breakpoints, paa, side="right")
-    return "".join(chr(ord("a") + int(index)) for index in symbol_indices)
+    return _symbols(np.searchsorted(breakpoints, paa, side="right"))
 
 
 def _z_normalize(values: np.ndarray) -> np.ndarray:
-    mean = float(values.mean())
-    std = float(values.std(ddof=0))
+    # Reuse one centred buffer for the standard deviation and the result (same steps as np.std).
+    centered: np.ndarray = values - values.mean()
+    std = float(np.sqrt(np.multiply(centered, centered).sum() / values.size))
     if np.isclose(std, 0.0):
-        return np.zeros_like(values)
-    return (values - mean) / std
+        centered[:] = 0.0
+        return centered
+    centered /= std
+    return centered
+
+
+_SYMBOL_TABLE = np.frombuffer(b"abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)
+
+
+def _symbols(symbol_indices: np.ndarray) -> str:
+    """Map alphabet indices to letters with one table lookup instead of a per-symbol ``chr`` loop."""
+    letters: np.ndarray = _SYMBOL_TABLE[symbol_indices]
+    return letters.tobytes().decode("ascii")
 
 
 def _piecewise_aggregate(values: np.ndarray, segments: int) -> np.ndarray:
-    chunks = np.array_split(values, segments)
-    return np.asarray([float(chunk.mean()) for chunk in chunks], dtype=float)
+    # Same segment boundaries as np.array_split: the first ``size % segments`` segments get one extra value.
+    base, extra = divmod(values.size, segments)
+    lengths = np.full(segments, base, dtype=np.int64)
+    lengths[:extra] += 1
+    starts = np.concatenate(([0], np.cumsum(lengths[:-1])))
+    return np.add.reduceat(values, starts) / lengths
 
 
+@lru_cache(maxsize=32)
 def _gaussian_breakpoints(alphabet_size: int) -> np.ndarray:
-    dist = NormalDist()
-    points = [dist.inv_cdf(i / alphabet_size) for i in range(1, alphabet_size)]
-    return np.asarray(points, dtype=float)
+    # Cached per alphabet size (at most 25 distinct values); read-only so callers cannot mutate the cache.
+    points = np.asarray(ndtri(np.arange(1, alphabet_size, dtype=np.float64) / alphabet_size), dtype=np.float64)
+    points.setflags(write=False)
+    return points
 
 
 def astride_encode(
@@ -162,7 +180,7 @@ def astride_encode(
         # Fall back to SAX when ruptures is unavailable (e.g. Python 3.14+)
         return sax_encode(df, column=column, word_size=n_segments, alphabet_size=alphabet_size)
 
-    values = pd.to_numeric(df[column], errors="coerce").dropna().to_numpy(dtype=float)
+    values = numeric_values(df[column])
     if values.size < n_segments:
         raise ValidationError("Not enough data points for requested n_segments.")
 
@@ -187,15 +205,11 @@ def describe_astride(stats: SymbolicStats) -> str:
 
 
 def _astride_encode_core(values: np.ndarray, n_segments: int, alphabet_size: int, penalty: float) -> str:
-    algo = rpt.Pelt(model="rbf", min_size=max(2, values.size // (n_segments * 2))).fit(values.reshape(-1, 1))  # type: ignore[union-attr]
-    bkpts = algo.predict(pen=penalty)
-
-    starts = [0] + bkpts[:-1]
-    ends = bkpts
-    segment_means = np.asarray(
-        [float(values[s:e].mean()) for s, e in zip(starts, ends, strict=True)],
-        dtype=float,
-    )
+    bkpts = pelt_breakpoints(rpt, values, min_size=max(2, values.size // (n_segments * 2)), penalty=penalty)
+
+    ends = np.asarray(bkpts, dtype=np.int64)
+    starts = np.concatenate(([0], ends[:-1]))
+    segment_means = np.add.reduceat(values, starts) / (ends - starts)
 
     if segment_means.size < 2:
         return "a" * max(1, len(segment_means))
@@ -203,4 +217,4 @@ def _astride_encode_core(values: np.ndarray, n_segments: int, alphabet_size: int
     quantile_boundaries = np.quantile(segment_means, np.linspace(0, 1, alphabet_size + 1))
     bins = quantile_boundaries[1:-1]
     symbol_indices = np.searchsorted(bins, segment_means, side="right")
-    return "".join(chr(ord("a") + min(int(idx), alphabet_size - 1)) for idx in symbol_indices)
+    return _symbols(np.minimum(symbol_indices, alphabet_size - 1))
@@ -1,5 +1,8 @@
 """High-level narration composition for LLM-ready text."""
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
 from narrata.analysis.indicators import analyze_indicators, describe_indicators
@@ -10,10 +13,15 @@ from narrata.analysis.support_resistance import describe_support_resistance, fin
 from narrata.analysis.symbolic import astride_encode, describe_astride, describe_sax, sax_encode
 from narrata.compression.digits import digit_tokenize
 from narrata.exceptions import ValidationError
-from narrata.formatting.serializers import format_sections
+from narrata.formatting.serializers import format_sections, to_plain
 from narrata.rendering.sparkline import make_sparkline
 from narrata.types import OutputFormat
-from narrata.validation.ohlcv import normalize_columns, validate_ohlcv_frame
+from narrata.validation.ohlcv import (
+    REQUIRED_OHLCV_COLUMNS,
+    normalize_columns,
+    numeric_values,
+    validate_ohlcv_frame,
+)
 
 
 def narrate(
@@ -39,6 +47,7 @@ def narrate(
     precision: int = 2,
     output_format: OutputFormat = "plain",
     verbose: bool = False,
+    max_workers: int | None = 1,
 ) -> str:
     """Compose selected narration components into one final text output.
 
@@ -64,8 +73,15 @@ def narrate(
     :param precision: Decimal places for price values (default: 2).
     :param output_format: Output format.
     :param verbose: Show all sections even when empty or insufficient data.
+    :param max_workers: Thread pool size for the regime, indicator, symbolic, pattern and
+        level analyzers; ``1`` (default) runs them sequentially, ``None`` uses the executor
+        default. Threads only pay off on long frames, where the NumPy/SciPy kernels
+        release the GIL.
     :return: Composed narration text.
     """
+    if max_workers is not None and max_workers < 1:
+        raise ValidationError("max_workers must be >= 1.")
+
     df = normalize_columns(df)
     validate_ohlcv_frame(df, required_columns=("Close",))
 
@@ -85,14 +101,15 @@ def narrate(
     ):
         raise ValidationError("At least one narration component must be enabled.")
 
+    df = _coerce_numeric_columns(df, column)
     sections: dict[str, str] = {}
     summary = analyze_summary(df, column=column, ticker=ticker, frequency=frequency)
 
     if include_summary or include_sparkline:
         entity_name = summary.ticker or summary.column
         if include_sparkline:
-            values = pd.to_numeric(df[column], errors="coerce").dropna().tolist()
-            if not values:
+            values = numeric_values(df[column])
+            if values.size == 0:
                 raise ValidationError(f"Column '{column}' contains no numeric values for sparkline rendering.")
             sparkline = make_sparkline(values, width=sparkline_width)
             sections["overview"] = f"{entity_name} ({summary.points} pts, {summary.frequency}): {sparkline}"
@@ -107,23 +124,21 @@ def narrate(
         sections["range"] = summary_lines[0]
         sections["change"] = summary_lines[1]
 
-    if include_regime:
+    def regime_section() -> dict[str, str]:
         try:
-            sections["regime"] = describe_regime(analyze_regime(df, column=column))
+            return {"regime": describe_regime(analyze_regime(df, column=column))}
         except ValidationError:
-            if verbose:
-                sections["regime"] = "Regime: insufficient data"
+            return {"regime": "Regime: insufficient data"} if verbose else {}
 
-    if include_indicators:
+    def indicators_section() -> dict[str, str]:
         try:
-            sections["indicators"] = describe_indicators(
-                analyze_indicators(df, column=column, frequency=summary.frequency)
-            )
+            return {
+                "indicators": describe_indicators(analyze_indicators(df, column=column, frequency=summary.frequency))
+            }
         except ValidationError:
-            if verbose:
-                sections["indicators"] = "Indicators: insufficient data"
+            return {"indicators": "Indicators: insufficient data"} if verbose else {}
 
-    if include_symbolic:
+    def symbolic_section() -> dict[str, str]:
         try:
             if symbolic_method == "astride":
                 symbolic = astride_encode(
@@ -133,48 +148,94 @@ def narrate(
                     alphabet_size=symbolic_alphabet_size,
                     penalty=symbolic_penalty,
                 )
-                sections["symbolic"] = (
-                    describe_astride(symbolic) if symbolic.method == "ASTRIDE" else describe_sax(symbolic)
-                )
-            else:
-                symbolic = sax_encode(
-                    df,
-                    column=column,
-                    word_size=symbolic_word_size,
-                    alphabet_size=symbolic_alphabet_size,
-                )
-                sections["symbolic"] = describe_sax(symbolic)
+                return {
+                    "symbolic": describe_astride(symbolic) if symbolic.method == "ASTRIDE" else describe_sax(symbolic)
+                }
+            symbolic = sax_encode(
+                df,
+                column=column,
+                word_size=symbolic_word_size,
+                alphabet_size=symbolic_alphabet_size,
+            )
+            return {"symbolic": describe_sax(symbolic)}
         except ValidationError:
-            if verbose:
-                label = "ASTRIDE" if symbolic_method == "astride" else f"SAX({symbolic_word_size})"
-                sections["symbolic"] = f"{label}: insufficient data"
+            if not verbose:
+                return {}
+            label = "ASTRIDE" if symbolic_method == "astride" else f"SAX({symbolic_word_size})"
+            return {"symbolic": f"{label}: insufficient data"}
 
-    if include_patterns:
+    def patterns_section() -> dict[str, str]:
         try:
             pattern_stats = detect_patterns(df)
-            pat = describe_patterns(pattern_stats)
-            cand = describe_candlestick(pattern_stats)
-            if pat is not None or verbose:
-                sections["patterns"] = pat or "Patterns: none detected"
-            if cand is not None or verbose:
-                sections["candlestick"] = cand or "Candlestick: none detected"
         except ValidationError:
-            if verbose:
-                sections["patterns"] = "Patterns: insufficient data"
-                sections["candlestick"] = "Candlestick: insufficient data"
-
-    if include_support_resistance:
+            if not verbose:
+                return {}
+            return {"patterns": "Patterns: insufficient data", "candlestick": "Candlestick: insufficient data"}
+        lines: dict[str, str] = {}
+        pat = describe_patterns(pattern_stats)
+        cand = describe_candlestick(pattern_stats)
+        if pat is not None or verbose:
+            lines["patterns"] = pat or "Patterns: none detected"
+        if cand is not None or verbose:
+            lines["candlestick"] = cand or "Candlestick: none detected"
+        return lines
+
+    def levels_section() -> dict[str, str]:
         try:
             levels = find_support_resistance(df, column=column)
-            sections["levels"] = describe_support_resistance(
-                levels, currency_symbol=currency_symbol, precision=precision
-            )
         except ValidationError:
-            if verbose:
-                sections["levels"] = "Support: insufficient data  Resistance: insufficient data"
-
-    rendered = format_sections(sections, output_format=output_format)
+            return {"levels": "Support: insufficient data  Resistance: insufficient data"} if verbose else {}
+        return {"levels": describe_support_resistance(levels, currency_symbol=currency_symbol, precision=precision)}
+
+    # The analyzers only read the validated frame, so they can run in any order or at once;
+    # sections are still merged in this fixed order.
+    builders: list[Callable[[], dict[str, str]]] = [
+        builder
+        for enabled, builder in (
+            (include_regime, regime_section),
+            (include_indicators, indicators_section),
+            (include_symbolic, symbolic_section),
+            (include_patterns, patterns_section),
+            (include_support_resistance, levels_section),
+        )
+        if enabled
+    ]
+    if max_workers == 1 or len(builders) < 2:
+        results = [builder() for builder in builders]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda builder: builder(), builders))
+    for result in results:
+        sections.update(result)
+
+    # Plain output only needs the ordered lines, so join them without the format dispatch.
+    if output_format == "plain":
+        rendered = to_plain(sections.values())
+    else:
+        rendered = format_sections(sections, output_format=output_format)
     if digit_level:
         return digit_tokenize(rendered)
 
     return rendered
+
+
+def _coerce_numeric_columns(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Convert non-numeric price and volume columns to float64 once for all analyzers.
+
+    Every analyzer coerces the columns it reads with ``pd.to_numeric(errors="coerce")``
+    semantics. Doing that up front means each later extraction takes the numeric fast path
+    of :func:`~narrata.validation.numeric_values` instead of re-parsing the same strings.
+
+    :param df: Validated OHLCV DataFrame.
+    :param column: Price column used across modules.
+    :return: *df*, or a shallow copy with the coerced columns replaced.
+    """
+    names = dict.fromkeys((column, *REQUIRED_OHLCV_COLUMNS))
+    coerced = {
+        name: numeric_values(df[name], dropna=False)
+        for name in names
+        if name in df.columns and not pd.api.types.is_numeric_dtype(df[name].dtype)
+    }
+    if not coerced:
+        return df
+    return df.assign(**coerced)
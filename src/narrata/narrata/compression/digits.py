@@ -5,9 +5,8 @@ References:
     Time Series Forecasters", NeurIPS 2023. arXiv:2310.07820
 """
 
-import re
-
-_DIGIT_PATTERN = re.compile(r"(\d)")
+# Pads each ASCII digit with spaces in one C-level ``str.translate`` pass.
+_DIGIT_TRANS: dict[int, str] = {ord(digit): f" {digit} " for digit in "0123456789"}
 
 
 def digit_tokenize(text: str, add_note: bool = True) -> str:
@@ -17,7 +16,7 @@ def digit_tokenize(text: str, add_note: bool = True) -> str:
     :param add_note: Prefix output with a short marker when digit splitting is applied.
     :return: Digit-tokenized text.
     """
-    spaced = _DIGIT_PATTERN.sub(r" \1 ", text)
+    spaced = text.translate(_DIGIT_TRANS)
     tokenized = " ".join(spaced.split())
     if add_note:
         return f"<digits-split>\n{tokenized}"
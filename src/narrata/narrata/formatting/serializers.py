@@ -1,7 +1,7 @@
 """Serializers for final narration output."""
 
 import json
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping
 
 from toons import dumps
 
@@ -9,13 +9,13 @@ from narrata.exceptions import UnsupportedFormatError
 from narrata.types import OutputFormat
 
 
-def to_plain(lines: Sequence[str]) -> str:
+def to_plain(lines: Iterable[str]) -> str:
     """Join non-empty lines into plain-text output.
 
     :param lines: Ordered lines to join.
     :return: Plain-text representation.
     """
-    return "\n".join(line for line in lines if line)
+    return "\n".join([line for line in lines if line])
 
 
 def to_markdown_kv(data: Mapping[str, object]) -> str:
@@ -24,7 +24,8 @@ def to_markdown_kv(data: Mapping[str, object]) -> str:
     :param data: Mapping of section names to values.
     :return: Markdown key-value representation.
     """
-    return "\n".join(f"**{key}**: {value}" for key, value in data.items())
+    # str.join materializes its input anyway; a list skips the generator resume per item.
+    return "\n".join([f"**{key}**: {value}" for key, value in data.items()])
 
 
 def to_toon(data: Mapping[str, object]) -> str:
@@ -35,7 +36,7 @@ def to_toon(data: Mapping[str, object]) -> str:
     :param data: Mapping of section names to values.
     :return: TOON string representation.
     """
-    return str(dumps(dict(data)))
+    return str(dumps(_as_dict(data)))
 
 
 def to_json(data: Mapping[str, object]) -> str:
@@ -44,7 +45,7 @@ def to_json(data: Mapping[str, object]) -> str:
     :param data: Mapping of section names to values.
     :return: JSON string.
     """
-    return json.dumps(dict(data), ensure_ascii=False)
+    return json.dumps(_as_dict(data), ensure_ascii=False)
 
 
 def format_sections(sections: Mapping[str, str], output_format: OutputFormat = "plain") -> str:
@@ -54,12 +55,24 @@ def format_sections(sections: Mapping[str, str], output_format: OutputFormat = "
     :param output_format: Output format selector.
     :return: Serialized text output.
     """
-    if output_format == "plain":
-        return to_plain(list(sections.values()))
-    if output_format == "markdown_kv":
-        return to_markdown_kv(sections)
-    if output_format == "toon":
-        return to_toon(sections)
-    if output_format == "json":
-        return to_json(sections)
-    raise UnsupportedFormatError(f"Unsupported output format: {output_format}")
+    formatter = _FORMATTERS.get(output_format)
+    if formatter is None:
+        raise UnsupportedFormatError(f"Unsupported output format: {output_format}")
+    return formatter(sections)
+
+
+def _as_dict(data: Mapping[str, object]) -> dict[str, object]:
+    # The encoders only accept real dicts; narrate() already passes one, so skip the copy.
+    return data if isinstance(data, dict) else dict(data)
+
+
+def _sections_to_plain(sections: Mapping[str, str]) -> str:
+    return to_plain(sections.values())
+
+
+_FORMATTERS: dict[str, Callable[[Mapping[str, str]], str]] = {
+    "plain": _sections_to_plain,
+    "markdown_kv": to_markdown_kv,
+    "toon": to_toon,
+    "json": to_json,
+}
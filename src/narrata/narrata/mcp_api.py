@@ -6,10 +6,13 @@ high-level helper functions suitable for MCP tool handlers.
 
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
+from collections.abc import Mapping, Sequence
+from dataclasses import fields, is_dataclass
 from datetime import date
+from functools import cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from narrata.analysis.indicators import analyze_indicators, describe_indicators
@@ -22,7 +25,10 @@ from narrata.composition.compare import compare
 from narrata.composition.narrate import narrate
 from narrata.exceptions import ValidationError
 from narrata.types import OutputFormat
-from narrata.validation.ohlcv import REQUIRED_OHLCV_COLUMNS, infer_frequency_label
+from narrata.validation.ohlcv import REQUIRED_OHLCV_COLUMNS, infer_frequency_label, mark_validated
+
+# Row-oriented records, or the same fields as column-oriented sequences of equal length.
+OhlcvRecords = list[dict[str, Any]] | Mapping[str, Sequence[Any]]
 
 _TIMESTAMP_CANDIDATES: tuple[str, ...] = ("timestamp", "datetime", "date", "time")
 _COLUMN_CANDIDATES: dict[str, tuple[str, ...]] = {
@@ -35,7 +41,7 @@ _COLUMN_CANDIDATES: dict[str, tuple[str, ...]] = {
 
 
 def ohlcv_records_to_frame(
-    records: list[dict[str, Any]],
+    records: OhlcvRecords,
     *,
     ticker: str | None = None,
     timestamp_field: str = "timestamp",
@@ -47,7 +53,7 @@ def ohlcv_records_to_frame(
     Missing numeric values are allowed and passed through as NaN so narrata
     analytics can handle patchy data gracefully.
 
-    :param records: List of OHLCV row dictionaries.
+    :param records: OHLCV row dictionaries, or a mapping of field name to column values.
     :param ticker: Optional ticker symbol attached to ``DataFrame.attrs["ticker"]``.
     :param timestamp_field: Preferred timestamp field name in each record.
     :param deduplicate_timestamps: If ``True``, keep only the latest row for duplicates.
@@ -57,15 +63,31 @@ def ohlcv_records_to_frame(
     if not records:
         raise ValidationError("At least one OHLCV record is required.")
 
-    raw = pd.DataFrame.from_records(records)
-    timestamp_column = _resolve_timestamp_column(raw, preferred=timestamp_field)
+    if isinstance(records, Mapping):
+        # Column-oriented input skips the per-row dict walk of from_records.
+        raw = pd.DataFrame(_checked_columns(records))
+    else:
+        raw = pd.DataFrame.from_records(records)
+
+    # Column labels are resolved against one hashed snapshot instead of repeated Index scans.
+    names = frozenset(raw.columns)
+    timestamp_column = _resolve_timestamp_column(raw, names, preferred=timestamp_field)
 
     timestamp = pd.to_datetime(raw[timestamp_column], errors="coerce")
     if timestamp.isna().all():
         raise ValidationError(f"Timestamp column '{timestamp_column}' contains no parseable datetime values.")
 
-    frame = raw.copy()
-    frame.index = pd.DatetimeIndex(timestamp)
+    sources = {
+        target: source
+        for target in REQUIRED_OHLCV_COLUMNS
+        if (source := _resolve_ohlcv_column(names, target, required=False)) is not None
+    }
+    if "Close" not in sources:
+        raise ValidationError("Input records are missing required OHLCV field: 'Close'.")
+
+    # Only the OHLCV source columns are carried forward, and re-labelling the rows does not
+    # copy them, so extra record fields and the timestamp column are never duplicated.
+    frame = raw[list(sources.values())].set_axis(pd.DatetimeIndex(timestamp), axis=0)
     frame = frame[~frame.index.isna()]
 
     if deduplicate_timestamps:
@@ -73,23 +95,28 @@ def ohlcv_records_to_frame(
     if sort_index:
         frame = frame.sort_index()
 
-    canonical: dict[str, pd.Series] = {}
-    for target in REQUIRED_OHLCV_COLUMNS:
-        source = _resolve_ohlcv_column(frame, target, required=False)
-        if source is not None:
-            canonical[target] = pd.to_numeric(frame[source], errors="coerce")
-
-    if "Close" not in canonical:
-        raise ValidationError("Input records are missing required OHLCV field: 'Close'.")
-
-    result = pd.DataFrame(canonical, index=frame.index)
-    if ticker and ticker.strip():
-        result.attrs["ticker"] = ticker.strip()
+    result = frame.set_axis(list(sources), axis=1)
+    # Numeric columns pass through untouched; only text or object columns need coercion.
+    coerced = {
+        target: pd.to_numeric(result[target], errors="coerce")
+        for target in sources
+        if not pd.api.types.is_numeric_dtype(result[target].dtype)
+    }
+    if coerced:
+        result = result.assign(**coerced)
+
+    symbol = ticker.strip() if ticker else ""
+    if symbol:
+        result.attrs["ticker"] = symbol
+    if deduplicate_timestamps and sort_index:
+        # Parseable rows exist, duplicates are gone and the index is sorted, so the
+        # downstream analyzers can skip the index scans when validating the frame.
+        mark_validated(result)
     return result
 
 
 def narrate_from_records(
-    records: list[dict[str, Any]],
+    records: OhlcvRecords,
     *,
     ticker: str | None = None,
     timestamp_field: str = "timestamp",
@@ -117,7 +144,7 @@ def narrate_from_records(
 ) -> str:
     """Generate the full narrata text from OHLCV records.
 
-    :param records: List of OHLCV row dictionaries.
+    :param records: OHLCV row dictionaries, or a mapping of field name to column values.
     :param ticker: Optional ticker symbol.
     :param timestamp_field: Preferred timestamp field name.
     :param deduplicate_timestamps: Keep only latest row for duplicate timestamps.
@@ -172,7 +199,7 @@ def narrate_from_records(
 
 
 def summary_from_records(
-    records: list[dict[str, Any]],
+    records: OhlcvRecords,
     *,
     ticker: str | None = None,
     timestamp_field: str = "timestamp",
@@ -182,7 +209,7 @@ def summary_from_records(
 ) -> dict[str, Any]:
     """Compute summary stats and text from OHLCV records.
 
-    :param records: List of OHLCV row dictionaries.
+    :param records: OHLCV row dictionaries, or a mapping of field name to column values.
     :param ticker: Optional ticker symbol.
     :param timestamp_field: Preferred timestamp field name.
     :param deduplicate_timestamps: Keep only latest row for duplicate timestamps.
@@ -202,7 +229,7 @@ def summary_from_records(
 
 
 def regime_from_records(
-    records: list[dict[str, Any]],
+    records: OhlcvRecords,
     *,
     ticker: str | None = None,
     timestamp_field: str = "timestamp",
@@ -215,7 +242,7 @@ def regime_from_records(
 ) -> dict[str, Any]:
     """Compute current regime classification and narration.
 
-    :param records: List of OHLCV row dictionaries.
+    :param records: OHLCV row dictionaries, or a mapping of field name to column values.
     :param ticker: Optional ticker symbol.
     :param timestamp_field: Preferred timestamp field name.
     :param deduplicate_timestamps: Keep only latest row for duplicate timestamps.
@@ -238,7 +265,7 @@ def regime_from_records(
 
 
 def indicators_from_records(
-    records: list[dict[str, Any]],
+    records: OhlcvRecords,
     *,
     ticker: str | None = None,
     timestamp_field: str = "timestamp",
@@ -250,7 +277,7 @@ def indicators_from_records(
 ) -> dict[str, Any]:
     """Compute indicator stats and narration from OHLCV records.
 
-    :param records: List of OHLCV row dictionaries.
+    :param records: OHLCV row dictionaries, or a mapping of field name to column values.
     :param ticker: Optional ticker symbol.
     :param timestamp_field: Preferred timestamp field name.
     :param deduplicate_timestamps: Keep only latest row for duplicate timestamps.
@@ -273,7 +300,7 @@ def indicators_from_records(
 
 
 def sax_from_records(
-    records: list[dict[str, Any]],
+    records: OhlcvRecords,
     *,
     ticker: str | None = None,
     timestamp_field: str = "timestamp",
@@ -285,7 +312,7 @@ def sax_from_records(
 ) -> dict[str, Any]:
     """Compute SAX symbols and narration from OHLCV records.
 
-    :param records: List of OHLCV row dictionaries.
+    :param records: OHLCV row dictionaries, or a mapping of field name to column values.
     :param ticker: Optional ticker symbol.
     :param timestamp_field: Preferred timestamp field name.
     :param deduplicate_timestamps: Keep only latest row for duplicate timestamps.
@@ -307,7 +334,7 @@ def sax_from_records(
 
 
 def astride_from_records(
-    records: list[dict[str, Any]],
+    records: OhlcvRecords,
     *,
     ticker: str | None = None,
     timestamp_field: str = "timestamp",
@@ -320,7 +347,7 @@ def astride_from_records(
 ) -> dict[str, Any]:
     """Compute ASTRIDE symbols and narration from OHLCV records.
 
-    :param records: List of OHLCV row dictionaries.
+    :param records: OHLCV row dictionaries, or a mapping of field name to column values.
     :param ticker: Optional ticker symbol.
     :param timestamp_field: Preferred timestamp field name.
     :param deduplicate_timestamps: Keep only latest row for duplicate timestamps.
@@ -343,7 +370,7 @@ def astride_from_records(
 
 
 def patterns_from_records(
-    records: list[dict[str, Any]],
+    records: OhlcvRecords,
     *,
     ticker: str | None = None,
     timestamp_field: str = "timestamp",
@@ -353,7 +380,7 @@ def patterns_from_records(
 ) -> dict[str, Any]:
     """Detect chart/candlestick patterns and narration from OHLCV records.
 
-    :param records: List of OHLCV row dictionaries.
+    :param records: OHLCV row dictionaries, or a mapping of field name to column values.
     :param ticker: Optional ticker symbol.
     :param timestamp_field: Preferred timestamp field name.
     :param deduplicate_timestamps: Keep only latest row for duplicate timestamps.
@@ -377,7 +404,7 @@ def patterns_from_records(
 
 
 def levels_from_records(
-    records: list[dict[str, Any]],
+    records: OhlcvRecords,
     *,
     ticker: str | None = None,
     timestamp_field: str = "timestamp",
@@ -390,7 +417,7 @@ def levels_from_records(
 ) -> dict[str, Any]:
     """Detect support/resistance levels and narration from OHLCV records.
 
-    :param records: List of OHLCV row dictionaries.
+    :param records: OHLCV row dictionaries, or a mapping of field name to column values.
     :param ticker: Optional ticker symbol.
     :param timestamp_field: Preferred timestamp field name.
     :param deduplicate_timestamps: Keep only latest row for duplicate timestamps.
@@ -419,8 +446,8 @@ def levels_from_records(
 
 
 def compare_from_records(
-    records_before: list[dict[str, Any]],
-    records_after: list[dict[str, Any]],
+    records_before: OhlcvRecords,
+    records_after: OhlcvRecords,
     *,
     ticker: str | None = None,
     timestamp_field: str = "timestamp",
@@ -482,10 +509,23 @@ def compare_from_records(
     )
 
 
-def _resolve_timestamp_column(frame: pd.DataFrame, preferred: str) -> str:
-    candidates = [preferred] + [name for name in _TIMESTAMP_CANDIDATES if name != preferred]
-    for candidate in candidates:
-        if candidate in frame.columns:
+def _checked_columns(columns: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Reject column mappings that ``pd.DataFrame`` would fail on with a bare ``ValueError``."""
+    lengths: set[int] = set()
+    for name, values in columns.items():
+        if isinstance(values, str | bytes) or not isinstance(values, Sequence | np.ndarray | pd.Series):
+            raise ValidationError(f"Column '{name}' must be a sequence of values, got {type(values).__name__}.")
+        lengths.add(len(values))
+    if len(lengths) > 1:
+        raise ValidationError(f"All columns must have the same length, got lengths {sorted(lengths)}.")
+    return columns
+
+
+def _resolve_timestamp_column(frame: pd.DataFrame, names: frozenset[Any], preferred: str) -> str:
+    if preferred in names:
+        return preferred
+    for candidate in _TIMESTAMP_CANDIDATES:
+        if candidate in names:
             return candidate
     available = ", ".join(map(str, frame.columns))
     raise ValidationError(
@@ -494,25 +534,37 @@ def _resolve_timestamp_column(frame: pd.DataFrame, preferred: str) -> str:
     )
 
 
-def _resolve_ohlcv_column(frame: pd.DataFrame, target: str, *, required: bool = True) -> str | None:
-    candidates = _COLUMN_CANDIDATES[target]
-    for candidate in candidates:
-        if candidate in frame.columns:
+def _resolve_ohlcv_column(names: frozenset[Any], target: str, *, required: bool = True) -> str | None:
+    for candidate in _COLUMN_CANDIDATES[target]:
+        if candidate in names:
             return candidate
     if required:
         raise ValidationError(f"Input records are missing required OHLCV field: '{target}'.")
     return None
 
 
+_SCALAR_TYPES: tuple[type, ...] = (str, int, float, type(None))
+
+
 def _to_serializable(value: Any) -> Any:
+    # Leaves dominate stats payloads, so test them before the dataclass and container checks.
+    if isinstance(value, _SCALAR_TYPES):
+        return value
     if is_dataclass(value) and not isinstance(value, type):
-        return _to_serializable(asdict(value))
+        # Convert fields directly: asdict would deep-copy nested tuples only for them to be rebuilt here.
+        return {name: _to_serializable(getattr(value, name)) for name in _field_names(type(value))}
     if isinstance(value, date):
         return value.isoformat()
     if isinstance(value, dict):
-        return {key: _to_serializable(item) for key, item in value.items()}
+        convert = _to_serializable
+        return {key: convert(item) for key, item in value.items()}
     if isinstance(value, tuple):
         return [_to_serializable(item) for item in value]
     if isinstance(value, list):
         return [_to_serializable(item) for item in value]
     return value
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(field.name for field in fields(cls))
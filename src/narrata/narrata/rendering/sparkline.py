@@ -1,63 +1,42 @@
 """Unicode sparkline rendering for compact trend visualization."""
 
 from collections.abc import Sequence
+from functools import lru_cache
 
 import numpy as np
 
 BARS = "▁▂▃▄▅▆▇█"
 
 
-def downsample_evenly(values: Sequence[float], width: int) -> list[float]:
+def downsample_evenly(values: Sequence[float] | np.ndarray, width: int) -> list[float]:
     """Reduce a sequence to an evenly sampled representation.
 
     :param values: Input numeric sequence.
     :param width: Output width.
     :return: Evenly sampled values.
     """
-    if width < 1:
-        raise ValueError("width must be >= 1")
-
-    array = np.asarray(values, dtype=float)
-    if array.size == 0:
-        return []
+    if isinstance(values, list) and 0 < width and len(values) <= width:
+        # Short lists come back unsampled, so skip the round trip through an ndarray.
+        try:
+            return list(map(float, values))
+        except TypeError:
+            pass  # e.g. ``None`` entries, which the array path turns into NaN
+    sampled: list[float] = _downsample(np.asarray(values, dtype=float), width).tolist()
+    return sampled
 
-    if array.size <= width:
-        return [float(value) for value in array.tolist()]
 
-    indices = np.linspace(0, array.size - 1, num=width)
-    sampled = array[np.round(indices).astype(int)]
-    return [float(value) for value in sampled.tolist()]
-
-
-def normalize_to_bins(values: Sequence[float], bins: int) -> list[int]:
+def normalize_to_bins(values: Sequence[float] | np.ndarray, bins: int) -> list[int]:
     """Map numeric values to integer bins in [0, bins - 1].
 
     :param values: Input numeric sequence.
     :param bins: Number of target bins.
     :return: Bin indices.
     """
-    if bins < 2:
-        raise ValueError("bins must be >= 2")
-
-    array = np.asarray(values, dtype=float)
-    if array.size == 0:
-        return []
-
-    if not np.isfinite(array).all():
-        raise ValueError("values must be finite numbers")
+    mapped: list[int] = _to_bins(np.asarray(values, dtype=float), bins).tolist()
+    return mapped
 
-    low = float(array.min())
-    high = float(array.max())
 
-    if high == low:
-        return [bins // 2] * int(array.size)
-
-    scaled = (array - low) / (high - low)
-    mapped = np.clip(np.rint(scaled * (bins - 1)).astype(int), 0, bins - 1)
-    return [int(value) for value in mapped.tolist()]
-
-
-def make_sparkline(values: Sequence[float], width: int = 20, bars: str = BARS) -> str:
+def make_sparkline(values: Sequence[float] | np.ndarray, width: int = 20, bars: str = BARS) -> str:
     """Create a single-line Unicode sparkline.
 
     :param values: Input numeric sequence.
@@ -68,9 +47,62 @@ def make_sparkline(values: Sequence[float], width: int = 20, bars: str = BARS) -
     if len(bars) < 2:
         raise ValueError("bars must have at least two characters")
 
-    sampled = downsample_evenly(values, width=width)
-    if not sampled:
+    sampled = _downsample(np.asarray(values, dtype=float), width)
+    if sampled.size == 0:
         return ""
 
-    bins = normalize_to_bins(sampled, bins=len(bars))
-    return "".join(bars[index] for index in bins)
+    palette = _BARS_PALETTE if bars == BARS else _palette(bars)
+    glyphs = palette[_to_bins(sampled, len(bars))]
+    # A contiguous run of single-character cells reads back as one string.
+    return str(glyphs.view(f"U{glyphs.size}")[0])
+
+
+@lru_cache(maxsize=8)
+def _palette(bars: str) -> np.ndarray:
+    palette = np.array(list(bars))
+    palette.flags.writeable = False
+    return palette
+
+
+# The default glyph palette is gathered from on every narration, so build it at import time.
+_BARS_PALETTE = _palette(BARS)
+
+
+def _downsample(array: np.ndarray, width: int) -> np.ndarray:
+    if width < 1:
+        raise ValueError("width must be >= 1")
+
+    if array.size <= width:
+        return array
+
+    indices = np.linspace(0, array.size - 1, num=width)
+    sampled: np.ndarray = array[np.round(indices).astype(int)]
+    return sampled
+
+
+def _to_bins(array: np.ndarray, bins: int) -> np.ndarray:
+    if bins < 2:
+        raise ValueError("bins must be >= 2")
+
+    if array.size == 0:
+        return np.empty(0, dtype=np.int64)
+
+    # NaN propagates through min/max and infinities become an extreme, so the two
+    # reductions double as the finiteness check without a separate boolean pass.
+    low = float(array.min())
+    high = float(array.max())
+    if not (np.isfinite(low) and np.isfinite(high)):
+        raise ValueError("values must be finite numbers")
+
+    if high == low:
+        return np.full(array.size, bins // 2, dtype=np.int64)
+
+    # Scale in one scratch buffer. (value - low) / (high - low) never exceeds 1, so the
+    # rounded bins already lie in [0, bins - 1] and no clip is needed.
+    scaled = np.subtract(array, low)
+    scaled /= high - low
+    scaled *= bins - 1
+    # Round half to even straight into the integer output, without a float rounding pass.
+    mapped = np.empty(array.size, dtype=np.int64)
+    np.rint(scaled, out=mapped, casting="unsafe")
+    return mapped
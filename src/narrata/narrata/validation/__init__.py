@@ -1,5 +1,19 @@
 """Validation contracts for input time-series frames."""
 
-from narrata.validation.ohlcv import REQUIRED_OHLCV_COLUMNS, infer_frequency_label, validate_ohlcv_frame
+from narrata.validation.ohlcv import (
+    REQUIRED_OHLCV_COLUMNS,
+    OhlcvArrays,
+    infer_frequency_label,
+    numeric_values,
+    ohlcv_arrays,
+    validate_ohlcv_frame,
+)
 
-__all__ = ["REQUIRED_OHLCV_COLUMNS", "infer_frequency_label", "validate_ohlcv_frame"]
+__all__ = [
+    "REQUIRED_OHLCV_COLUMNS",
+    "OhlcvArrays",
+    "infer_frequency_label",
+    "numeric_values",
+    "ohlcv_arrays",
+    "validate_ohlcv_frame",
+]
@@ -1,7 +1,11 @@
 """Validation routines for OHLCV time-series DataFrames."""
 
+from bisect import bisect_left
 from collections.abc import Sequence
+from typing import Any, NamedTuple
+from weakref import WeakValueDictionary
 
+import numpy as np
 import pandas as pd
 
 from narrata.exceptions import ValidationError
@@ -37,6 +41,33 @@ _FREQUENCY_LABELS = {
     "T": "minutely",
 }
 
+# Labels for evenly spaced indexes, keyed by step in seconds; these are the steps for
+# which ``pd.infer_freq`` yields a code with a fixed label.
+_UNIFORM_STEP_LABELS: dict[int, str] = {
+    60: "1min",
+    300: "5min",
+    900: "15min",
+    1800: "30min",
+    3600: "hourly",
+    86_400: "daily",
+    86_400 * 7: "weekly",
+}
+
+# Median-spacing fallback: the first label whose upper bound (inclusive, seconds) is not
+# below the median step; anything wider than a month is irregular.
+_SPACING_THRESHOLDS_SECONDS: tuple[float, ...] = (120, 600, 1200, 2400, 3600, 86_400, 86_400 * 7, 86_400 * 31)
+_SPACING_LABELS: tuple[str, ...] = (
+    "1min",
+    "5min",
+    "15min",
+    "30min",
+    "hourly",
+    "daily",
+    "weekly",
+    "monthly",
+    "irregular",
+)
+
 # Frequencies considered intraday (sub-daily).
 INTRADAY_FREQUENCIES: frozenset[str] = frozenset({"1min", "5min", "15min", "30min", "hourly", "minutely"})
 
@@ -63,7 +94,26 @@ VALID_FREQUENCIES: frozenset[str] = frozenset(
 BAR_UNIT_FREQUENCIES: frozenset[str] = INTRADAY_FREQUENCIES | {"irregular"}
 
 
-_VALIDATED_ATTR = "_narrata_validated"
+# Backing arrays of indexes that passed the index checks, keyed by ``id``. Frames derived
+# without reindexing (column renames, assign, column selection) share the array, and index
+# values are immutable, so a hit means the index checks would pass again.
+_VALIDATED_INDEX_ARRAYS: WeakValueDictionary[int, Any] = WeakValueDictionary()
+
+_NAT_INT64 = np.iinfo(np.int64).min
+
+_TICKS_PER_SECOND = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+
+class OhlcvArrays(NamedTuple):
+    """Contiguous float64 price and volume arrays of a validated OHLCV frame.
+
+    Each array holds the numeric values of one column with missing entries dropped, so
+    the arrays are not row-aligned when columns are patchy. ``volume`` is ``None`` when
+    the frame has no Volume column.
+    """
+
+    close: np.ndarray
+    volume: np.ndarray | None = None
 
 
 def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -112,9 +162,6 @@ def validate_ohlcv_frame(df: pd.DataFrame, required_columns: Sequence[str] = REQ
     :param required_columns: Required columns (default: OHLC only).
     :return: ``None`` if validation passes.
     """
-    if isinstance(df, pd.DataFrame) and df.attrs.get(_VALIDATED_ATTR):
-        return
-
     if not isinstance(df, pd.DataFrame):
         raise ValidationError("Input must be a pandas DataFrame.")
 
@@ -130,10 +177,9 @@ def validate_ohlcv_frame(df: pd.DataFrame, required_columns: Sequence[str] = REQ
     if not isinstance(df.index, pd.DatetimeIndex):
         raise ValidationError("DataFrame index must be a pandas DatetimeIndex.")
 
-    if df.index.has_duplicates:
-        raise ValidationError("DataFrame index must not contain duplicate timestamps.")
-
-    if not df.index.is_monotonic_increasing:
+    if not _is_validated_index(df.index) and not _is_strictly_increasing(df.index):
+        if df.index.has_duplicates:
+            raise ValidationError("DataFrame index must not contain duplicate timestamps.")
         raise ValidationError("DataFrame index must be sorted in ascending order.")
 
     missing_columns = [name for name in required_columns if name not in df.columns]
@@ -141,7 +187,82 @@ def validate_ohlcv_frame(df: pd.DataFrame, required_columns: Sequence[str] = REQ
         joined = ", ".join(missing_columns)
         raise ValidationError(f"DataFrame is missing required columns: {joined}.")
 
-    df.attrs[_VALIDATED_ATTR] = True
+    mark_validated(df)
+
+
+def mark_validated(df: pd.DataFrame) -> None:
+    """Record that the index of *df* satisfies the :func:`validate_ohlcv_frame` index checks.
+
+    For frames whose construction guarantees a unique, ascending DatetimeIndex, so later
+    validation calls skip the index scans. Column checks still run on every call.
+
+    :param df: DataFrame with a unique, ascending DatetimeIndex.
+    :return: ``None``.
+    """
+    array = df.index.array
+    _VALIDATED_INDEX_ARRAYS[id(array)] = array
+
+
+def _is_strictly_increasing(index: pd.DatetimeIndex) -> bool:
+    """Return whether *index* is unique and ascending, in one comparison pass over its int64 view.
+
+    NaT is the minimum int64, so it can only go unnoticed in the first slot, which is checked
+    explicitly. Comparing neighbours instead of differencing them avoids overflow around NaT.
+    """
+    values = index.asi8
+    if values[0] == _NAT_INT64:
+        return False
+    return bool(np.all(values[1:] > values[:-1]))
+
+
+def _is_validated_index(index: pd.DatetimeIndex) -> bool:
+    array = index.array
+    return _VALIDATED_INDEX_ARRAYS.get(id(array)) is array
+
+
+def numeric_values(series: pd.Series | np.ndarray, dropna: bool = True) -> np.ndarray:
+    """Return *series* as a contiguous float64 array, coercing non-numeric entries to NaN.
+
+    Numeric columns and arrays skip the ``pd.to_numeric`` pass, and the result shares the
+    input buffer when no conversion or filtering is needed, so callers must not modify it
+    in place.
+
+    :param series: Column or 1-D array to convert.
+    :param dropna: Drop missing entries (default) instead of keeping them as NaN.
+    :return: Float64 values.
+    """
+    if isinstance(series, np.ndarray) and series.dtype.kind in "biuf":
+        values = np.ascontiguousarray(series, dtype=np.float64)
+    else:
+        if not isinstance(series, pd.Series):
+            series = pd.Series(series, copy=False)
+        if not pd.api.types.is_numeric_dtype(series.dtype):
+            series = pd.to_numeric(series, errors="coerce")
+        values = np.ascontiguousarray(series.to_numpy(dtype=np.float64, na_value=np.nan))
+    if not dropna:
+        return values
+    missing = np.isnan(values)
+    if not missing.any():
+        return values
+    # Invert in place so filtering does not allocate a second boolean array.
+    present: np.ndarray = values[np.logical_not(missing, out=missing)]
+    return present
+
+
+def ohlcv_arrays(df: pd.DataFrame, column: str = "Close") -> OhlcvArrays:
+    """Convert the price column and Volume (when present) of a validated frame into :class:`OhlcvArrays`.
+
+    Only these two columns are converted; Open, High and Low are left untouched.
+
+    :param df: Validated OHLCV DataFrame.
+    :param column: Price column exposed as ``close``.
+    :return: Float64 column arrays with missing values dropped.
+    """
+    if column not in df.columns:
+        raise ValidationError(f"Column '{column}' does not exist in DataFrame.")
+
+    volume = numeric_values(df["Volume"]) if "Volume" in df.columns else None
+    return OhlcvArrays(close=numeric_values(df[column]), volume=volume)
 
 
 def is_intraday(frequency: str) -> bool:
@@ -158,42 +279,52 @@ def infer_frequency_label(index: pd.DatetimeIndex) -> str:
     if len(index) < 2:
         return "irregular"
 
+    # A frequency attached at construction (e.g. by ``pd.date_range``) describes the index
+    # exactly, so known codes skip the ``pd.infer_freq`` scan. Unknown codes still go
+    # through inference, which may map them differently (e.g. semi-month ends).
+    if index.freqstr is not None:
+        key = index.freqstr.split("-")[0]
+        if key in _FREQUENCY_LABELS or key.endswith(("min", "T")):
+            return _label_from_freq_key(key)
+
+    # Difference the int64 view (in units of ``index.unit``) directly; steps touching NaT
+    # are undefined.
+    values = index.asi8
+    deltas = np.diff(values)
+
+    # Evenly spaced tz-naive bars at a common step get the label ``pd.infer_freq`` would
+    # produce without running its offset matcher. Shorter indexes keep inference semantics.
+    if deltas.size > 1 and index.tz is None and not index.hasnans:
+        step = int(deltas[0])
+        seconds, remainder = divmod(step, _TICKS_PER_SECOND[index.unit])
+        if remainder == 0 and seconds in _UNIFORM_STEP_LABELS and bool(np.all(deltas == step)):
+            return _UNIFORM_STEP_LABELS[seconds]
+
     inferred = pd.infer_freq(index)
     if inferred:
-        key = str(inferred).split("-")[0]
-        # Handle sub-hourly pandas codes like "5min", "15min", "min".
-        if key.endswith("min"):
-            prefix = key[: -len("min")]
-            if prefix == "" or prefix == "1":
-                return "1min"
-            return f"{prefix}min"
-        if key.endswith("T"):
-            prefix = key[:-1]
-            if prefix == "" or prefix == "1":
-                return "1min"
-            return f"{prefix}min"
-        return _FREQUENCY_LABELS.get(key, key.lower())
-
-    deltas = index.to_series().diff().dropna()
-    if deltas.empty:
+        return _label_from_freq_key(str(inferred).split("-")[0])
+
+    if index.hasnans:
+        deltas = deltas[(values[1:] != _NAT_INT64) & (values[:-1] != _NAT_INT64)]
+    if deltas.size == 0:
         return "irregular"
 
-    median_seconds = float(deltas.dt.total_seconds().median())
-
-    if median_seconds <= 120:
-        return "1min"
-    if median_seconds <= 600:
-        return "5min"
-    if median_seconds <= 1200:
-        return "15min"
-    if median_seconds <= 2400:
-        return "30min"
-    if median_seconds <= 3600:
-        return "hourly"
-    if median_seconds <= 86_400:
-        return "daily"
-    if median_seconds <= 86_400 * 7:
-        return "weekly"
-    if median_seconds <= 86_400 * 31:
-        return "monthly"
-    return "irregular"
+    median_seconds = float(np.median(deltas)) / _TICKS_PER_SECOND[index.unit]
+
+    return _SPACING_LABELS[bisect_left(_SPACING_THRESHOLDS_SECONDS, median_seconds)]
+
+
+def _label_from_freq_key(key: str) -> str:
+    # Handle sub-hourly pandas codes like "5min", "15min", "min".
+    if key.endswith("min"):
+        prefix = key[: -len("min")]
+        if prefix == "" or prefix == "1":
+            return "1min"
+        return f"{prefix}min"
+    if key.endswith("T"):
+        prefix = key[:-1]
+        if prefix == "" or prefix == "1":
+            return "1min"
+        return f"{prefix}min"
+    label = _FREQUENCY_LABELS.get(key)
+    return label if label is not None else key.lower()
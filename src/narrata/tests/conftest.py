@@ -7,15 +7,16 @@ import pytest
 ASSETS_DIR = Path(__file__).parent / "assets"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def real_aapl_df() -> pd.DataFrame:
-    """AAPL 1-year daily OHLCV from yfinance (static fixture)."""
+    """AAPL 1-year daily OHLCV from yfinance (static fixture), parsed once and shared; copy before mutating."""
     df = pd.read_csv(ASSETS_DIR / "aapl_1y.csv", index_col="Date", parse_dates=True)
-    return df
+    return _read_only(df)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ohlcv_df() -> pd.DataFrame:
+    """Synthetic 120-day OHLCV frame, built once and shared; copy it before mutating."""
     points = 120
     dates = pd.date_range("2025-01-01", periods=points, freq="D")
     rng = np.random.default_rng(42)
@@ -38,4 +39,11 @@ def sample_ohlcv_df() -> pd.DataFrame:
         index=dates,
     )
     df.attrs["ticker"] = "AAPL"
+    return _read_only(df)
+
+
+def _read_only(df: pd.DataFrame) -> pd.DataFrame:
+    # Session-shared frames: in-place writes raise instead of leaking into later tests.
+    for block in df._mgr.blocks:
+        block.values.setflags(write=False)
     return df
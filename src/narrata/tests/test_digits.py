@@ -15,3 +15,7 @@ def test_digit_tokenize_leaves_text_without_digits_unchanged() -> None:
 
 def test_digit_tokenize_without_note() -> None:
     assert digit_tokenize("No numbers here.", add_note=False) == "No numbers here."
+
+
+def test_digit_tokenize_normalizes_whitespace_without_digits() -> None:
+    assert digit_tokenize("No  numbers\nhere.", add_note=False) == "No numbers here."
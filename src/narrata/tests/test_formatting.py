@@ -1,4 +1,5 @@
 import json
+from types import MappingProxyType
 
 import pytest
 
@@ -76,3 +77,9 @@ def test_format_sections_json() -> None:
 def test_format_sections_unsupported_format_raises() -> None:
     with pytest.raises(UnsupportedFormatError):
         format_sections({"summary": "s"}, output_format="invalid")  # type: ignore[arg-type]
+
+
+def test_to_toon_and_json_accept_read_only_mappings() -> None:
+    data = MappingProxyType({"overview": "AAPL"})
+    assert to_toon(data) == to_toon(dict(data))
+    assert json.loads(to_json(data)) == {"overview": "AAPL"}
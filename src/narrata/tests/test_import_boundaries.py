@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import ast
+import re
 from pathlib import Path
 
+import pytest
+
 FORBIDDEN_TOP_LEVEL_MODULES = {
     "backtesting",
     "brain",
@@ -20,26 +23,48 @@ def _package_python_files() -> list[Path]:
     return sorted(path for path in package_root.rglob("*.py") if "__pycache__" not in path.parts)
 
 
-def test_no_relative_imports_in_package() -> None:
-    for path in _package_python_files():
-        tree = ast.parse(path.read_text(), filename=str(path))
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom) and node.level > 0:
-                raise AssertionError(f"Relative import found in {path}:{node.lineno}")
+# Cheap text prefilters: any import the AST checks would flag matches these, so only matching
+# files are parsed. They also match mentions in strings and comments, which the AST rejects.
+_FORBIDDEN_MENTION_RE = re.compile(r"\b(?:" + "|".join(sorted(FORBIDDEN_TOP_LEVEL_MODULES)) + r")\b")
+_RELATIVE_FROM_RE = re.compile(r"\bfrom\s+\.")
+
+
+@pytest.fixture(scope="module")
+def package_sources() -> list[tuple[Path, str]]:
+    """Read every package module once for all boundary checks in this file."""
+    return [(path, path.read_text(encoding="utf-8")) for path in _package_python_files()]
+
+
+def _parse(path: Path, source: str) -> ast.Module:
+    return ast.parse(source, filename=str(path))
+
+
+def test_no_relative_imports_in_package(package_sources: list[tuple[Path, str]]) -> None:
+    violations = [
+        f"Relative import found in {path}:{node.lineno}"
+        for path, source in package_sources
+        if _RELATIVE_FROM_RE.search(source)
+        for node in ast.walk(_parse(path, source))
+        if isinstance(node, ast.ImportFrom) and node.level > 0
+    ]
+    assert not violations, "\n".join(violations)
 
 
-def test_no_cross_workspace_imports() -> None:
-    for path in _package_python_files():
-        tree = ast.parse(path.read_text(), filename=str(path))
-        for node in ast.walk(tree):
+def test_no_cross_workspace_imports(package_sources: list[tuple[Path, str]]) -> None:
+    violations: list[str] = []
+    for path, source in package_sources:
+        if not _FORBIDDEN_MENTION_RE.search(source):
+            continue
+        for node in ast.walk(_parse(path, source)):
             if isinstance(node, ast.Import):
-                for alias in node.names:
-                    top_level = alias.name.split(".", maxsplit=1)[0]
-                    assert top_level not in FORBIDDEN_TOP_LEVEL_MODULES, (
-                        f"Forbidden import in {path}:{node.lineno}: {alias.name}"
-                    )
+                names = [alias.name for alias in node.names]
             elif isinstance(node, ast.ImportFrom) and node.module:
-                top_level = node.module.split(".", maxsplit=1)[0]
-                assert top_level not in FORBIDDEN_TOP_LEVEL_MODULES, (
-                    f"Forbidden import in {path}:{node.lineno}: {node.module}"
-                )
+                names = [node.module]
+            else:
+                continue
+            violations.extend(
+                f"Forbidden import in {path}:{node.lineno}: {name}"
+                for name in names
+                if name.split(".", maxsplit=1)[0] in FORBIDDEN_TOP_LEVEL_MODULES
+            )
+    assert not violations, "\n".join(violations)
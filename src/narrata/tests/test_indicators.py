@@ -1,7 +1,11 @@
+import dataclasses
+
+import numpy as np
 import pandas as pd
 import pytest
 
 import narrata.analysis.indicators as indicators
+from narrata.analysis import _pandas_ta
 from narrata.analysis.indicators import (
     analyze_indicators,
     compute_bollinger,
@@ -25,6 +29,15 @@ def test_compute_rsi_flat_series_is_neutral() -> None:
     assert compute_rsi(series) == pytest.approx(50.0)
 
 
+def test_compute_rsi_drops_missing_and_non_numeric_values(sample_ohlcv_df: pd.DataFrame) -> None:
+    close = sample_ohlcv_df["Close"]
+    dirty = close.astype(object)
+    dirty.iloc[3] = float("nan")
+    dirty.iloc[7] = "n/a"
+
+    assert compute_rsi(dirty) == pytest.approx(compute_rsi(close.drop(close.index[[3, 7]])))
+
+
 def test_compute_macd_returns_three_values(sample_ohlcv_df: pd.DataFrame) -> None:
     macd, signal, hist = compute_macd(sample_ohlcv_df["Close"])
     assert isinstance(macd, float)
@@ -32,6 +45,17 @@ def test_compute_macd_returns_three_values(sample_ohlcv_df: pd.DataFrame) -> Non
     assert isinstance(hist, float)
 
 
+def test_compute_macd_matches_pandas_ewm(sample_ohlcv_df: pd.DataFrame) -> None:
+    close = sample_ohlcv_df["Close"]
+    macd_line = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    signal_line = macd_line.ewm(span=9, adjust=False).mean()
+
+    macd, signal, hist = compute_macd(close)
+    assert macd == pytest.approx(macd_line.iloc[-1])
+    assert signal == pytest.approx(signal_line.iloc[-1])
+    assert hist == pytest.approx(macd_line.iloc[-1] - signal_line.iloc[-1])
+
+
 def test_analyze_indicators_has_states(sample_ohlcv_df: pd.DataFrame) -> None:
     stats = analyze_indicators(sample_ohlcv_df)
     assert stats.rsi_state in {"overbought", "oversold", "neutral-bullish", "neutral-bearish"}
@@ -57,9 +81,9 @@ def test_describe_indicators_format(sample_ohlcv_df: pd.DataFrame) -> None:
 
 
 def test_analyze_indicators_fallback_without_pandas_ta(monkeypatch, sample_ohlcv_df: pd.DataFrame) -> None:
-    monkeypatch.setattr(indicators, "ta", None)
+    monkeypatch.setattr(_pandas_ta, "ta", None)
     monkeypatch.setattr(indicators, "compute_rsi", lambda _series, period=14: 55.5)
-    monkeypatch.setattr(indicators, "compute_macd", lambda _series: (1.1, 0.9, 0.2))
+    monkeypatch.setattr(indicators, "_macd_fallback", lambda _series: (1.1, 0.9, 0.2, "bullish", None))
 
     stats = indicators.analyze_indicators(sample_ohlcv_df)
     assert stats.rsi_value == 55.5
@@ -89,7 +113,7 @@ def test_analyze_indicators_uses_pandas_ta_when_available(monkeypatch, sample_oh
     def should_not_be_called(*_args, **_kwargs):
         raise AssertionError("Fallback implementation should not be used when pandas_ta is available.")
 
-    monkeypatch.setattr(indicators, "ta", FakeTA())
+    monkeypatch.setattr(_pandas_ta, "ta", FakeTA())
     monkeypatch.setattr(indicators, "compute_rsi", should_not_be_called)
     monkeypatch.setattr(indicators, "compute_macd", should_not_be_called)
 
@@ -121,8 +145,8 @@ def test_analyze_indicators_uses_pandas_ta_macd_lines_for_state(monkeypatch, sam
     def should_not_be_called(*_args, **_kwargs):
         raise AssertionError("In-house MACD classifier should not be used when pandas_ta data is available.")
 
-    monkeypatch.setattr(indicators, "ta", FakeTA())
-    monkeypatch.setattr(indicators, "_classify_macd", should_not_be_called)
+    monkeypatch.setattr(_pandas_ta, "ta", FakeTA())
+    monkeypatch.setattr(indicators, "_macd_fallback", should_not_be_called)
 
     stats = indicators.analyze_indicators(sample_ohlcv_df)
     assert stats.macd_state == "bullish"
@@ -148,6 +172,43 @@ def test_format_ordinal(value: float, expected: str) -> None:
     assert indicators._format_ordinal(value) == expected
 
 
+def test_classify_macd_lines_skips_rows_with_missing_values() -> None:
+    macd_line = pd.Series([float("nan"), -1.0, 0.5, 1.0])
+    signal_line = pd.Series([float("nan"), float("nan"), 0.0, 0.0])
+
+    assert indicators._classify_macd_lines(macd_line, signal_line) == ("bullish, widening", None)
+
+
+@pytest.mark.parametrize(
+    ("diff", "expected"),
+    [
+        ([1.0, 1.0, 1.0], None),
+        ([-1.0, 1.0, 1.0], 1),
+        ([1.0, -1.0, 1.0, 1.0], 1),
+        ([-1.0, 0.0, 1.0], None),
+        ([-1.0, 1.0, 0.0, 1.0], 2),
+        ([2.5, -1e-300, 0.0, 3.0, 7.0], 3),
+    ],
+)
+def test_bars_since_sign_flip(diff: list[float], expected: int | None) -> None:
+    assert indicators._bars_since_sign_flip(np.array(diff)) == expected
+
+
+@pytest.mark.parametrize(
+    ("ratio", "expected"),
+    [
+        (0.5, "unusually low"),
+        (0.6, "below average"),
+        (0.75, "below average"),
+        (1.0, "average"),
+        (1.5, "above average"),
+        (2.0, "unusually high"),
+    ],
+)
+def test_volume_band_edges(ratio: float, expected: str) -> None:
+    assert indicators._band_label(ratio, indicators._VOLUME_BOUNDS, indicators._VOLUME_LABELS) == expected
+
+
 def test_compute_rsi_rejects_small_period() -> None:
     with pytest.raises(ValidationError, match="period must be >= 2"):
         compute_rsi(pd.Series([1.0, 2.0, 3.0]), period=1)
@@ -164,6 +225,16 @@ def test_compute_rsi_fully_rising() -> None:
     assert value == pytest.approx(100.0)
 
 
+def test_compute_rsi_matches_pandas_wilder_smoothing(sample_ohlcv_df: pd.DataFrame) -> None:
+    close = sample_ohlcv_df["Close"]
+    delta = close.diff()
+    avg_gain = delta.clip(lower=0.0).ewm(alpha=1.0 / 14, adjust=False).mean().iloc[-1]
+    avg_loss = (-delta.clip(upper=0.0)).ewm(alpha=1.0 / 14, adjust=False).mean().iloc[-1]
+    expected = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    assert compute_rsi(close) == pytest.approx(expected)
+
+
 def test_compute_macd_rejects_bad_periods() -> None:
     with pytest.raises(ValidationError, match="fast_period must be smaller"):
         compute_macd(pd.Series([1.0] * 100), fast_period=26, slow_period=12)
@@ -185,6 +256,12 @@ def test_compute_bollinger_flat_series() -> None:
     assert position == "at midline"
 
 
+def test_compute_bollinger_flat_series_with_inexact_float() -> None:
+    position, squeeze = compute_bollinger(pd.Series([0.1] * 45))
+    assert position == "at midline"
+    assert squeeze is True
+
+
 def test_compute_ma_crossover_insufficient_data() -> None:
     cross, days = compute_ma_crossover(pd.Series([1.0] * 50))
     assert cross is None
@@ -220,3 +297,51 @@ def test_describe_indicators_with_intraday_bar_units(sample_ohlcv_df: pd.DataFra
     stats = analyze_indicators(sample_ohlcv_df, frequency="15min")
     text = describe_indicators(stats)
     assert "bar" in text.lower()
+
+
+@pytest.mark.parametrize("frequency", ["daily", "15min"])
+def test_indicators_state_matches_batch_analysis(monkeypatch, real_aapl_df: pd.DataFrame, frequency: str) -> None:
+    monkeypatch.setattr(_pandas_ta, "ta", None)
+    state = indicators.IndicatorsState.from_history(real_aapl_df.iloc[:150], frequency=frequency)
+
+    for offset in range(150, len(real_aapl_df)):
+        row = real_aapl_df.iloc[offset]
+        streamed = state.update(float(row["Close"]), float(row["Volume"]))
+
+    expected = analyze_indicators(real_aapl_df, frequency=frequency)
+    for field in dataclasses.fields(expected):
+        assert getattr(streamed, field.name) == pytest.approx(getattr(expected, field.name)), field.name
+
+
+def test_indicators_state_requires_enough_bars() -> None:
+    state = indicators.IndicatorsState()
+    for close in range(10):
+        state.update_close(float(close))
+
+    with pytest.raises(ValidationError, match="Not enough data to compute RSI"):
+        state.stats()
+
+
+def test_indicators_state_skips_missing_values() -> None:
+    state = indicators.IndicatorsState()
+    state.update_close(100.0, 1000.0)
+    state.update_close(float("nan"), float("nan"))
+
+    assert state.bars == 1
+
+
+def test_analyze_indicators_batch_preserves_order(sample_ohlcv_df: pd.DataFrame, real_aapl_df: pd.DataFrame) -> None:
+    frames = [sample_ohlcv_df, real_aapl_df, sample_ohlcv_df.iloc[:80]]
+
+    results = indicators.analyze_indicators_batch(frames, max_workers=2)
+
+    assert results == [analyze_indicators(frame) for frame in frames]
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_analyze_indicators_batch_rejects_non_positive_max_workers(
+    sample_ohlcv_df: pd.DataFrame, max_workers: int
+) -> None:
+    # Rejected even for a single frame, which would otherwise skip the thread pool.
+    with pytest.raises(ValidationError, match="max_workers"):
+        indicators.analyze_indicators_batch([sample_ohlcv_df], max_workers=max_workers)
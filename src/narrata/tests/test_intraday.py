@@ -219,24 +219,3 @@ def test_narrate_irregular_frequency_uses_bar_units(sample_ohlcv_df):
     if "Volume" in text:
         assert "bar avg" in text
         assert "day avg" not in text
-
-
-@pytest.fixture
-def sample_ohlcv_df():
-    """Standard daily fixture matching conftest pattern."""
-    points = 120
-    dates = pd.date_range("2025-01-01", periods=points, freq="D")
-    rng = np.random.default_rng(42)
-    base = np.linspace(100.0, 130.0, points)
-    noise = rng.normal(0.0, 0.6, points)
-    close = base + noise
-    open_ = close + rng.normal(0.0, 0.5, points)
-    high = np.maximum(open_, close) + np.abs(rng.normal(0.4, 0.2, points))
-    low = np.minimum(open_, close) - np.abs(rng.normal(0.4, 0.2, points))
-    volume = rng.integers(900, 1800, points)
-    df = pd.DataFrame(
-        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume},
-        index=dates,
-    )
-    df.attrs["ticker"] = "AAPL"
-    return df
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
+import narrata.validation.ohlcv as ohlcv
 from narrata.exceptions import ValidationError
 from narrata.mcp_api import (
     astride_from_records,
@@ -19,19 +21,9 @@ from narrata.mcp_api import (
 
 
 def _records_from_frame(df: pd.DataFrame) -> list[dict[str, object]]:
-    records: list[dict[str, object]] = []
-    for ts, row in df.iterrows():
-        records.append(
-            {
-                "timestamp": ts.isoformat(),
-                "open": row["Open"],
-                "high": row["High"],
-                "low": row["Low"],
-                "close": row["Close"],
-                "volume": row["Volume"],
-            }
-        )
-    return records
+    timestamps = df.index.strftime("%Y-%m-%dT%H:%M:%S")
+    rows = zip(timestamps, *(df[name].to_numpy() for name in ("Open", "High", "Low", "Close", "Volume")), strict=True)
+    return [{"timestamp": ts, "open": o, "high": h, "low": lo, "close": c, "volume": v} for ts, o, h, lo, c, v in rows]
 
 
 def test_ohlcv_records_to_frame_handles_patchy_and_deduplicates(sample_ohlcv_df: pd.DataFrame) -> None:
@@ -72,6 +64,20 @@ def test_ohlcv_records_to_frame_allows_close_only_records() -> None:
     assert frame.attrs["ticker"] == "BTC"
 
 
+def test_ohlcv_records_to_frame_fills_fields_missing_from_some_records() -> None:
+    records = [
+        {"timestamp": "2024-01-01T00:00:00", "close": 100.0, "volume": 10},
+        {"timestamp": "2024-01-02T00:00:00", "close": 101.0},
+        {"close": "102.5", "timestamp": "2024-01-03T00:00:00", "volume": 12},
+    ]
+
+    frame = ohlcv_records_to_frame(records)
+
+    assert list(frame.columns) == ["Close", "Volume"]
+    assert frame["Close"].tolist() == [100.0, 101.0, 102.5]
+    assert pd.isna(frame["Volume"].iloc[1])
+
+
 def test_narrate_from_records_allows_close_only_records() -> None:
     records = [{"timestamp": f"2024-01-{day:02d}T00:00:00", "close": 100.0 + day} for day in range(1, 25)]
 
@@ -97,8 +103,8 @@ def test_summary_from_records_returns_structured_and_text(sample_ohlcv_df: pd.Da
 
 def test_indicators_from_records_handles_patchy_inputs(sample_ohlcv_df: pd.DataFrame) -> None:
     frame = sample_ohlcv_df.copy()
-    frame.loc[frame.index[::13], "Close"] = pd.NA
-    frame.loc[frame.index[::17], "Volume"] = pd.NA
+    frame.iloc[::13, frame.columns.get_loc("Close")] = np.nan
+    frame.iloc[::17, frame.columns.get_loc("Volume")] = np.nan
     records = _records_from_frame(frame)
 
     payload = indicators_from_records(records)
@@ -160,6 +166,28 @@ def test_compare_from_records(sample_ohlcv_df: pd.DataFrame) -> None:
     assert "→" in text
 
 
+def test_ohlcv_records_to_frame_accepts_column_mapping(sample_ohlcv_df: pd.DataFrame) -> None:
+    records = _records_from_frame(sample_ohlcv_df.head(12))
+    columns = {key: [record[key] for record in records] for key in records[0]}
+
+    from_columns = ohlcv_records_to_frame(columns, ticker="AAPL")
+    from_rows = ohlcv_records_to_frame(records, ticker="AAPL")
+    pd.testing.assert_frame_equal(from_columns, from_rows)
+
+
+def test_ohlcv_records_to_frame_rejects_unequal_column_lengths() -> None:
+    columns = {"timestamp": ["2024-01-01", "2024-01-02"], "close": [100.0]}
+    with pytest.raises(ValidationError, match="same length"):
+        ohlcv_records_to_frame(columns)
+
+
+@pytest.mark.parametrize("close", [100.0, "100.0"])
+def test_ohlcv_records_to_frame_rejects_scalar_column_values(close: object) -> None:
+    columns = {"timestamp": ["2024-01-01"], "close": close}
+    with pytest.raises(ValidationError, match="Column 'close' must be a sequence"):
+        ohlcv_records_to_frame(columns)
+
+
 def test_ohlcv_records_to_frame_rejects_empty() -> None:
     with pytest.raises(ValidationError, match="At least one"):
         ohlcv_records_to_frame([])
@@ -199,3 +227,13 @@ def test_ohlcv_records_to_frame_no_timestamp_column() -> None:
     records = [{"price": 100.0, "close": 100.0}]
     with pytest.raises(ValidationError, match="timestamp column"):
         ohlcv_records_to_frame(records)
+
+
+def test_ohlcv_records_to_frame_marks_only_guaranteed_frames_validated() -> None:
+    records = [
+        {"timestamp": "2024-01-02", "close": 101.0},
+        {"timestamp": "2024-01-01", "close": 100.0},
+    ]
+    assert ohlcv._is_validated_index(ohlcv_records_to_frame(records).index)
+    assert not ohlcv._is_validated_index(ohlcv_records_to_frame(records, sort_index=False).index)
+    assert not ohlcv._is_validated_index(ohlcv_records_to_frame(records, deduplicate_timestamps=False).index)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -63,11 +64,11 @@ def test_narrate_rejects_missing_column(sample_ohlcv_df: pd.DataFrame) -> None:
 
 def test_narrate_handles_patchy_misaligned_data(sample_ohlcv_df: pd.DataFrame) -> None:
     patchy = sample_ohlcv_df.copy()
-    patchy.loc[patchy.index[::10], "Close"] = pd.NA
-    patchy.loc[patchy.index[1::15], "Open"] = pd.NA
-    patchy.loc[patchy.index[2::16], "High"] = pd.NA
-    patchy.loc[patchy.index[3::17], "Low"] = pd.NA
-    patchy.loc[patchy.index[4::18], "Volume"] = pd.NA
+    patchy.iloc[::10, patchy.columns.get_loc("Close")] = np.nan
+    patchy.iloc[1::15, patchy.columns.get_loc("Open")] = np.nan
+    patchy.iloc[2::16, patchy.columns.get_loc("High")] = np.nan
+    patchy.iloc[3::17, patchy.columns.get_loc("Low")] = np.nan
+    patchy.iloc[4::18, patchy.columns.get_loc("Volume")] = np.nan
     patchy = patchy.drop(index=patchy.index[[7, 24, 40]])
 
     text = narrate(patchy)
@@ -230,3 +231,35 @@ def test_narrate_without_sparkline(sample_ohlcv_df: pd.DataFrame) -> None:
     # Overview should not contain sparkline chars
     overview_line = text.splitlines()[0]
     assert "▁" not in overview_line
+
+
+def test_narrate_string_columns_match_numeric_columns(sample_ohlcv_df: pd.DataFrame) -> None:
+    as_text = sample_ohlcv_df.astype(str)
+    assert narrate(as_text, ticker="TEST") == narrate(sample_ohlcv_df, ticker="TEST")
+
+
+def test_narrate_thread_pool_matches_sequential(sample_ohlcv_df: pd.DataFrame) -> None:
+    sequential = narrate(sample_ohlcv_df, verbose=True)
+    assert narrate(sample_ohlcv_df, verbose=True, max_workers=4) == sequential
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_narrate_rejects_non_positive_max_workers(sample_ohlcv_df: pd.DataFrame, max_workers: int) -> None:
+    # Rejected even when a single builder would otherwise skip the thread pool.
+    with pytest.raises(ValidationError, match="max_workers"):
+        narrate(
+            sample_ohlcv_df,
+            include_summary=False,
+            include_sparkline=False,
+            include_regime=False,
+            include_symbolic=False,
+            include_patterns=False,
+            include_support_resistance=False,
+            max_workers=max_workers,
+        )
+
+
+def test_narrate_arrow_backed_columns_match_numpy_columns(sample_ohlcv_df: pd.DataFrame) -> None:
+    pytest.importorskip("pyarrow")
+    arrow_backed = sample_ohlcv_df.convert_dtypes(dtype_backend="pyarrow")
+    assert narrate(arrow_backed, verbose=True) == narrate(sample_ohlcv_df, verbose=True)
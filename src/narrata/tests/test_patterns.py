@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 import narrata.analysis.patterns as patterns
+from narrata.analysis import _pandas_ta
 from narrata.analysis.patterns import (
     describe_candlestick,
     describe_patterns,
@@ -66,7 +68,7 @@ def test_detect_candlestick_pattern_uses_pandas_ta_when_available(monkeypatch, s
     def should_not_be_called(*_args, **_kwargs):
         raise AssertionError("In-house fallback should not run when pandas_ta detected a pattern.")
 
-    monkeypatch.setattr(patterns, "ta", FakeTA())
+    monkeypatch.setattr(_pandas_ta, "ta", FakeTA())
     monkeypatch.setattr(patterns, "_detect_candlestick_inhouse", should_not_be_called)
 
     name, when = patterns.detect_candlestick_pattern(sample_ohlcv_df)
@@ -102,14 +104,14 @@ def test_detect_candlestick_pattern_falls_back_when_pandas_ta_returns_none(
                 index=close.index[-2:],
             )
 
-    monkeypatch.setattr(patterns, "ta", FakeTA())
+    monkeypatch.setattr(_pandas_ta, "ta", FakeTA())
     name, when = patterns.detect_candlestick_pattern(df)
     assert name == "Bullish Engulfing"
     assert when == dates[-1].date()
 
 
 def test_detect_candlestick_pattern_inhouse_detects_doji(monkeypatch) -> None:
-    monkeypatch.setattr(patterns, "ta", None)
+    monkeypatch.setattr(_pandas_ta, "ta", None)
     dates = pd.date_range("2025-01-01", periods=4, freq="D")
     df = pd.DataFrame(
         {
@@ -127,7 +129,7 @@ def test_detect_candlestick_pattern_inhouse_detects_doji(monkeypatch) -> None:
 
 
 def test_detect_candlestick_pattern_inhouse_detects_inside_bar(monkeypatch) -> None:
-    monkeypatch.setattr(patterns, "ta", None)
+    monkeypatch.setattr(_pandas_ta, "ta", None)
     dates = pd.date_range("2025-01-01", periods=4, freq="D")
     df = pd.DataFrame(
         {
@@ -179,7 +181,7 @@ def test_describe_patterns_none_when_no_pattern() -> None:
 
 
 def test_detect_candlestick_inhouse_bearish_engulfing(monkeypatch) -> None:
-    monkeypatch.setattr(patterns, "ta", None)
+    monkeypatch.setattr(_pandas_ta, "ta", None)
     dates = pd.date_range("2025-01-01", periods=5, freq="D")
     # prev: open=11.0, close=13.5 (bullish, close > open)
     # curr: open=13.5, close=11.0 (bearish, close < open, engulfs prev body)
@@ -213,3 +215,50 @@ def test_detect_chart_pattern_no_pattern_when_too_few_points() -> None:
     pattern, since = detect_chart_pattern(df, lookback=60)
     assert pattern is None
     assert since is None
+
+
+def test_detect_candlestick_inhouse_newest_candle_wins_over_stronger_pattern(monkeypatch) -> None:
+    monkeypatch.setattr(_pandas_ta, "ta", None)
+    dates = pd.date_range("2025-01-01", periods=4, freq="D")
+    # Row 2 is a bullish engulfing; row 3 is an inside bar (and not a doji).
+    df = pd.DataFrame(
+        {
+            "Open": [10.0, 11.0, 10.4, 11.5],
+            "High": [11.0, 11.2, 12.5, 12.4],
+            "Low": [9.5, 10.2, 10.0, 10.9],
+            "Close": [10.5, 10.5, 12.0, 12.2],
+            "Volume": [1000, 1100, 1200, 1300],
+        },
+        index=dates,
+    )
+    name, when = detect_candlestick_pattern(df)
+    assert name == "Inside Bar"
+    assert when == dates[-1].date()
+
+
+@pytest.mark.parametrize("size", [5, 17, 60])
+def test_trend_slope_matches_polyfit(size: int) -> None:
+    rng = np.random.default_rng(size)
+    values = rng.normal(size=size) + 0.05 * np.arange(size)
+    expected = np.polyfit(np.arange(size, dtype=float), values, 1)[0]
+    assert patterns._trend_slope(values) == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+
+def test_trend_slope_is_exactly_zero_for_flat_values() -> None:
+    assert patterns._trend_slope(np.full(20, 3.3)) == 0.0
+
+
+@pytest.mark.parametrize("size", [1, 5, 21, 60])
+def test_quantile_matches_series_quantile(size: int) -> None:
+    values = np.round(np.random.default_rng(size).normal(100.0, 5.0, size=size), 1)
+    assert patterns._quantile(values, 0.85) == pd.Series(values).quantile(0.85)
+
+
+def test_detect_patterns_rechecks_columns_on_frame_validated_for_close_only() -> None:
+    from narrata.validation import validate_ohlcv_frame
+
+    dates = pd.date_range("2025-01-01", periods=30, freq="D")
+    df = pd.DataFrame({"Close": np.linspace(10.0, 12.0, 30)}, index=dates)
+    validate_ohlcv_frame(df, required_columns=("Close",))
+    with pytest.raises(ValidationError, match="missing required columns: Open, High, Low"):
+        detect_patterns(df)
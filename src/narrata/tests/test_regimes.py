@@ -1,5 +1,6 @@
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -95,3 +96,54 @@ def test_analyze_regime_flat_series_is_ranging() -> None:
     df = pd.DataFrame({"Close": [100.0] * 60}, index=index)
     stats = analyze_regime(df)
     assert stats.trend_label == "Ranging"
+
+
+@pytest.mark.parametrize("window", [5, 20])
+def test_rolling_mean_std_matches_pandas_rolling(window: int) -> None:
+    values = np.random.default_rng(window).normal(0.001, 0.02, size=120)
+    values[40:70] = 0.0
+    series = pd.Series(values)
+
+    mean, std = regimes._rolling_mean_std(values, window)
+
+    expected_mean = series.rolling(window).mean().dropna().to_numpy()
+    expected_std = series.rolling(window).std(ddof=0).dropna().to_numpy()
+    np.testing.assert_allclose(mean, expected_mean, rtol=1e-9, atol=1e-15)
+    np.testing.assert_allclose(std, expected_std, rtol=1e-9, atol=1e-15)
+    assert (std[45 : 70 - window + 1] == 0.0).all()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [pd.Timestamp("2025-03-04 23:30", tz="US/Eastern"), pd.Timestamp("2025-03-04"), date(2025, 3, 4)],
+)
+def test_to_date_returns_plain_wall_clock_date(value: object) -> None:
+    result = regimes._to_date(value)
+    assert type(result) is date
+    assert result == date(2025, 3, 4)
+
+
+def test_ruptures_fit_is_reused_for_identical_returns(monkeypatch, sample_ohlcv_df: pd.DataFrame) -> None:
+    fits: list[int] = []
+
+    class CountingPelt:
+        def __init__(self, model: str, min_size: int) -> None:
+            self._n = 0
+
+        def fit(self, signal):
+            fits.append(len(signal))
+            self._n = len(signal)
+            return self
+
+        def predict(self, pen: float):
+            return [40, self._n]
+
+    class FakeRuptures:
+        Pelt = CountingPelt
+
+    monkeypatch.setattr(regimes, "rpt", FakeRuptures())
+
+    first = analyze_regime(sample_ohlcv_df)
+    second = analyze_regime(sample_ohlcv_df.copy())
+    assert first == second
+    assert len(fits) == 1
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from narrata.rendering.sparkline import BARS, downsample_evenly, make_sparkline, normalize_to_bins
@@ -49,6 +50,17 @@ def test_normalize_to_bins_empty_input() -> None:
     assert normalize_to_bins([], bins=8) == []
 
 
-def test_normalize_to_bins_rejects_non_finite() -> None:
+@pytest.mark.parametrize("bad", [float("inf"), float("-inf"), float("nan")])
+def test_normalize_to_bins_rejects_non_finite(bad: float) -> None:
     with pytest.raises(ValueError, match="finite numbers"):
-        normalize_to_bins([1.0, float("inf")], bins=8)
+        normalize_to_bins([1.0, bad], bins=8)
+
+
+def test_make_sparkline_accepts_arrays_and_custom_bars() -> None:
+    assert make_sparkline(np.array([0.0, 1.0, 2.0, 3.0]), bars="ab") == "aabb"
+
+
+def test_downsample_evenly_short_list_coerces_like_array_path() -> None:
+    sampled = downsample_evenly([1, "2.5", None], width=5)
+    assert sampled[:2] == [1.0, 2.5]
+    assert np.isnan(sampled[2])
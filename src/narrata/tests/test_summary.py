@@ -1,26 +1,33 @@
 import math
 
+import numpy as np
 import pandas as pd
 import pytest
 
+import narrata.analysis.summary as summary
 from narrata.analysis.summary import analyze_summary, describe_summary
 from narrata.exceptions import ValidationError
+from narrata.types import SummaryStats
 
 
-def test_analyze_summary_computes_expected_values(sample_ohlcv_df: pd.DataFrame) -> None:
-    stats = analyze_summary(sample_ohlcv_df)
+@pytest.fixture(scope="module")
+def summary_stats(sample_ohlcv_df: pd.DataFrame) -> SummaryStats:
+    """Default summary of the shared OHLCV fixture (frozen, safe to share)."""
+    return analyze_summary(sample_ohlcv_df)
+
+
+def test_analyze_summary_computes_expected_values(sample_ohlcv_df: pd.DataFrame, summary_stats: SummaryStats) -> None:
+    stats = summary_stats
+    close = sample_ohlcv_df["Close"].to_numpy(dtype=float)
+    index = sample_ohlcv_df.index
     assert stats.ticker == "AAPL"
-    assert stats.points == len(sample_ohlcv_df)
+    assert stats.points == close.size
     assert stats.frequency == "daily"
-    close = sample_ohlcv_df["Close"].astype(float)
-    assert stats.start_date == sample_ohlcv_df.index[0].date()
-    assert stats.end_date == sample_ohlcv_df.index[-1].date()
-    assert stats.start == pytest.approx(float(close.iloc[0]))
-    assert stats.end == pytest.approx(float(close.iloc[-1]))
-    assert stats.minimum == pytest.approx(float(close.min()))
-    assert stats.maximum == pytest.approx(float(close.max()))
-    assert stats.mean == pytest.approx(float(close.mean()))
-    assert stats.std == pytest.approx(float(close.std(ddof=0)))
+    assert stats.start_date == index[0].date()
+    assert stats.end_date == index[-1].date()
+    computed = np.array([stats.start, stats.end, stats.minimum, stats.maximum, stats.mean, stats.std])
+    expected = np.array([close[0], close[-1], close.min(), close.max(), close.mean(), close.std(ddof=0)])
+    np.testing.assert_allclose(computed, expected, rtol=1e-6)
 
 
 def test_analyze_summary_prefers_explicit_ticker(sample_ohlcv_df: pd.DataFrame) -> None:
@@ -48,27 +55,34 @@ def test_analyze_summary_uses_first_and_last_numeric_timestamps() -> None:
     assert stats.end == pytest.approx(12.0)
 
 
-def test_describe_summary_formats_compact_text(sample_ohlcv_df: pd.DataFrame) -> None:
-    stats = analyze_summary(sample_ohlcv_df)
-    text = describe_summary(stats)
+def test_describe_summary_formats_compact_text(sample_ohlcv_df: pd.DataFrame, summary_stats: SummaryStats) -> None:
+    text = describe_summary(summary_stats)
     assert f"AAPL ({len(sample_ohlcv_df)} pts, daily)" in text
     assert "Range: [" in text
     assert "Change:" in text
 
 
 def test_describe_summary_handles_nan_change(sample_ohlcv_df: pd.DataFrame) -> None:
-    modified = sample_ohlcv_df.copy().astype({"Close": float})
-    modified.loc[:, "Close"] = [0.0] + [float(i) for i in range(1, len(modified))]
-    text = describe_summary(analyze_summary(modified))
+    # A zero starting close makes the percentage change undefined.
+    modified = sample_ohlcv_df.assign(Close=np.arange(len(sample_ohlcv_df), dtype=np.float64))
+    stats = analyze_summary(modified)
+    text = describe_summary(stats)
     assert "Change: n/a" in text
-    assert math.isnan(analyze_summary(modified).change_pct)
+    assert math.isnan(stats.change_pct)
 
 
-def test_describe_summary_without_header(sample_ohlcv_df: pd.DataFrame) -> None:
-    text = describe_summary(analyze_summary(sample_ohlcv_df), include_header=False)
+def test_describe_summary_without_header(summary_stats: SummaryStats) -> None:
+    text = describe_summary(summary_stats, include_header=False)
     assert text.startswith("Range:")
 
 
 def test_analyze_summary_rejects_invalid_frequency(sample_ohlcv_df: pd.DataFrame) -> None:
     with pytest.raises(ValidationError, match="Unknown frequency"):
         analyze_summary(sample_ohlcv_df, frequency="every-other-tuesday")
+
+
+def test_mean_std_matches_numpy_population_std() -> None:
+    values = 1e6 + np.random.default_rng(3).normal(0.0, 1e-3, size=500)
+    mean, std = summary._mean_std(values)
+    assert mean == pytest.approx(values.mean(), rel=1e-15)
+    assert std == pytest.approx(values.std(ddof=0), rel=1e-9)
@@ -1,14 +1,18 @@
+import numpy as np
 import pandas as pd
 import pytest
 
+import narrata.analysis.support_resistance as support_resistance
 from narrata.analysis.support_resistance import describe_support_resistance, find_support_resistance
 from narrata.exceptions import ValidationError
+from narrata.types import PriceLevel
 
 
 def test_find_support_resistance_returns_levels(sample_ohlcv_df: pd.DataFrame) -> None:
     stats = find_support_resistance(sample_ohlcv_df)
-    assert isinstance(stats.supports, tuple)
-    assert isinstance(stats.resistances, tuple)
+    supports, resistances = stats.supports, stats.resistances
+    assert type(supports) is tuple and type(resistances) is tuple
+    assert all(type(level) is PriceLevel for level in (*supports, *resistances))
 
 
 def test_describe_support_resistance_format(sample_ohlcv_df: pd.DataFrame) -> None:
@@ -42,3 +46,32 @@ def test_find_support_resistance_insufficient_data() -> None:
     df = pd.DataFrame({"Close": [100.0, 101.0, 102.0, 103.0, 104.0]}, index=index)
     with pytest.raises(ValidationError, match="Not enough data"):
         find_support_resistance(df)
+
+
+@pytest.mark.parametrize(("reverse", "expected"), [(False, [1.05, 2.01]), (True, [2.01, 1.05])])
+def test_cluster_means_sweeps_sorted_values(reverse: bool, expected: list[float]) -> None:
+    values = np.array([2.0, 1.1, 1.0, 2.02, 1.05])
+    means = support_resistance._cluster_means(values, tolerance=0.1, reverse=reverse)
+    assert means == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("order", [1, 3, 5])
+def test_local_extrema_matches_argrelextrema(order: int) -> None:
+    from scipy.signal import argrelextrema
+
+    prices = np.round(100.0 + np.cumsum(np.random.default_rng(order).normal(size=300)), 1)
+    minima, maxima = support_resistance._local_extrema(prices, order)
+    np.testing.assert_array_equal(minima, argrelextrema(prices, np.less_equal, order=order)[0])
+    np.testing.assert_array_equal(maxima, argrelextrema(prices, np.greater_equal, order=order)[0])
+
+
+def test_band_counts_match_pairwise_comparison() -> None:
+    prices = np.sort(np.round(100.0 + np.cumsum(np.random.default_rng(7).normal(size=400)), 1))
+    tolerance = 0.3
+    # Levels sitting exactly one tolerance away from prices exercise the band edges.
+    levels = np.concatenate((prices[::37] + tolerance, prices[::41] - tolerance, [prices[0] - 5.0]))
+
+    counts = support_resistance._band_counts(prices, levels, tolerance)
+
+    expected = np.count_nonzero(np.abs(prices[:, None] - levels) <= tolerance, axis=0)
+    np.testing.assert_array_equal(counts, expected)
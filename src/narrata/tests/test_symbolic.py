@@ -24,33 +24,43 @@ def test_describe_sax_format(sample_ohlcv_df: pd.DataFrame) -> None:
     assert text.startswith("SAX(12): ")
 
 
-def test_sax_encode_prefers_tslearn_when_available(monkeypatch, sample_ohlcv_df: pd.DataFrame) -> None:
-    class FakeSAX:
-        def __init__(self, n_segments: int, alphabet_size_avg: int, scale: bool) -> None:
-            assert n_segments == 4
-            assert alphabet_size_avg == 4
-            assert scale is True
+_FAKE_SAX_CODES = np.asarray([[[0], [1], [2], [3]]], dtype=np.int64)
 
-        def fit_transform(self, values):
-            assert values.shape[0] == 1
-            return np.asarray([[[0], [1], [2], [3]]], dtype=int)
 
-    def should_not_be_called(*_args, **_kwargs):
-        raise AssertionError("In-house fallback should not be used when tslearn is available.")
+class _FakeSAX:
+    """Stand-in for tslearn's SAX that checks its arguments and emits codes 0-3."""
 
-    monkeypatch.setattr(symbolic, "SymbolicAggregateApproximation", FakeSAX)
-    monkeypatch.setattr(symbolic, "_sax_encode_inhouse", should_not_be_called)
+    def __init__(self, n_segments: int, alphabet_size_avg: int, scale: bool) -> None:
+        assert n_segments == 4
+        assert alphabet_size_avg == 4
+        assert scale is True
+
+    def fit_transform(self, values):
+        assert values.shape[0] == 1
+        return _FAKE_SAX_CODES
 
-    stats = symbolic.sax_encode(sample_ohlcv_df, word_size=4, alphabet_size=4)
-    assert stats.symbols == "abcd"
 
+def _inhouse_sax_must_not_run(*_args, **_kwargs):
+    raise AssertionError("In-house fallback should not be used when tslearn is available.")
 
-def test_sax_encode_falls_back_when_tslearn_missing(monkeypatch, sample_ohlcv_df: pd.DataFrame) -> None:
-    monkeypatch.setattr(symbolic, "SymbolicAggregateApproximation", None)
-    monkeypatch.setattr(symbolic, "_sax_encode_inhouse", lambda **_kwargs: "zzzz")
+
+@pytest.mark.parametrize(
+    ("use_tslearn", "expected"),
+    [(True, "abcd"), (False, "zzzz")],
+    ids=["prefers_tslearn_when_available", "falls_back_when_tslearn_missing"],
+)
+def test_sax_encode_engine_selection(
+    monkeypatch, sample_ohlcv_df: pd.DataFrame, use_tslearn: bool, expected: str
+) -> None:
+    if use_tslearn:
+        monkeypatch.setattr(symbolic, "SymbolicAggregateApproximation", _FakeSAX)
+        monkeypatch.setattr(symbolic, "_sax_encode_inhouse", _inhouse_sax_must_not_run)
+    else:
+        monkeypatch.setattr(symbolic, "SymbolicAggregateApproximation", None)
+        monkeypatch.setattr(symbolic, "_sax_encode_inhouse", lambda **_kwargs: "zzzz")
 
     stats = symbolic.sax_encode(sample_ohlcv_df, word_size=4, alphabet_size=4)
-    assert stats.symbols == "zzzz"
+    assert stats.symbols == expected
 
 
 def test_sax_rejects_small_word_size(sample_ohlcv_df: pd.DataFrame) -> None:
@@ -119,3 +129,32 @@ def test_astride_rejects_insufficient_data() -> None:
     df = pd.DataFrame({"Close": [100.0, 101.0, 102.0, 103.0, 104.0]}, index=index)
     with pytest.raises(ValidationError, match="Not enough data"):
         astride_encode(df, n_segments=16)
+
+
+@pytest.mark.parametrize(("size", "segments"), [(10, 3), (16, 16), (250, 16), (97, 7)])
+def test_piecewise_aggregate_matches_array_split_means(size: int, segments: int) -> None:
+    values = np.random.default_rng(size).normal(size=size)
+    expected = [chunk.mean() for chunk in np.array_split(values, segments)]
+    np.testing.assert_allclose(symbolic._piecewise_aggregate(values, segments), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("alphabet_size", [2, 3, 8, 26])
+def test_gaussian_breakpoints_match_normal_quantiles(alphabet_size: int) -> None:
+    from statistics import NormalDist
+
+    expected = [NormalDist().inv_cdf(i / alphabet_size) for i in range(1, alphabet_size)]
+    breakpoints = symbolic._gaussian_breakpoints(alphabet_size)
+    np.testing.assert_allclose(breakpoints, expected, rtol=1e-12, atol=1e-15)
+    assert not breakpoints.flags.writeable
+
+
+def test_symbols_maps_indices_to_letters() -> None:
+    assert symbolic._symbols(np.array([0, 1, 25, 2])) == "abzc"
+
+
+def test_z_normalize_leaves_input_untouched() -> None:
+    values = np.array([1.0, 2.0, 3.0])
+    normalized = symbolic._z_normalize(values)
+    np.testing.assert_allclose(normalized, (values - 2.0) / values.std())
+    np.testing.assert_array_equal(values, [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(symbolic._z_normalize(np.full(4, 5.0)), np.zeros(4))
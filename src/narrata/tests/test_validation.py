@@ -1,8 +1,21 @@
+import numpy as np
 import pandas as pd
 import pytest
 
+import narrata.validation.ohlcv as ohlcv
 from narrata.exceptions import ValidationError
-from narrata.validation.ohlcv import infer_frequency_label, normalize_columns, validate_ohlcv_frame
+from narrata.validation.ohlcv import (
+    infer_frequency_label,
+    normalize_columns,
+    numeric_values,
+    ohlcv_arrays,
+    validate_ohlcv_frame,
+)
+
+# Built once at import and shared by the parametrized frequency test below.
+INTRADAY_15MIN_INDEX = pd.date_range("2025-01-01", periods=16, freq="15min")
+WEEKLY_INDEX = pd.date_range("2025-01-03", periods=10, freq="W-FRI")
+SINGLE_TIMESTAMP_INDEX = pd.DatetimeIndex([pd.Timestamp("2025-01-01")])
 
 
 def test_validate_ohlcv_frame_accepts_valid_input(sample_ohlcv_df: pd.DataFrame) -> None:
@@ -15,6 +28,19 @@ def test_validate_ohlcv_frame_rejects_missing_columns(sample_ohlcv_df: pd.DataFr
         validate_ohlcv_frame(missing_close)
 
 
+def test_validate_ohlcv_frame_lists_missing_columns_in_required_order(sample_ohlcv_df: pd.DataFrame) -> None:
+    close_only = sample_ohlcv_df[["Close"]]
+    with pytest.raises(ValidationError, match="missing required columns: Open, High, Low\\."):
+        validate_ohlcv_frame(close_only)
+
+
+def test_validate_ohlcv_frame_accepts_required_columns_as_list(sample_ohlcv_df: pd.DataFrame) -> None:
+    validate_ohlcv_frame(sample_ohlcv_df, required_columns=["Close", "Volume"])
+    without_volume = sample_ohlcv_df.drop(columns=["Volume"])
+    with pytest.raises(ValidationError, match="missing required columns: Volume, Adj\\."):
+        validate_ohlcv_frame(without_volume, required_columns=["Close", "Volume", "Adj"])
+
+
 def test_validate_ohlcv_frame_rejects_non_datetime_index(sample_ohlcv_df: pd.DataFrame) -> None:
     bad = sample_ohlcv_df.copy()
     bad.index = range(len(bad))
@@ -33,38 +59,36 @@ def test_validate_ohlcv_frame_rejects_multiindex_panel(sample_ohlcv_df: pd.DataF
 
 
 def test_validate_ohlcv_frame_accepts_patchy_misaligned_values(sample_ohlcv_df: pd.DataFrame) -> None:
-    patchy = sample_ohlcv_df.copy()
-    patchy.loc[patchy.index[::11], "Close"] = pd.NA
-    patchy.loc[patchy.index[1::17], "Open"] = pd.NA
-    patchy.loc[patchy.index[2::19], "High"] = pd.NA
-    patchy.loc[patchy.index[3::23], "Low"] = pd.NA
-    patchy.loc[patchy.index[4::29], "Volume"] = pd.NA
+    columns = ["Close", "Open", "High", "Low", "Volume"]
+    gaps = np.zeros((len(sample_ohlcv_df), len(columns)), dtype=bool)
+    for position, (offset, step) in enumerate([(0, 11), (1, 17), (2, 19), (3, 23), (4, 29)]):
+        gaps[offset::step, position] = True
+    patchy = sample_ohlcv_df.mask(pd.DataFrame(gaps, index=sample_ohlcv_df.index, columns=columns))
 
     validate_ohlcv_frame(patchy)
 
 
 def test_validate_ohlcv_frame_accepts_irregular_gaps(sample_ohlcv_df: pd.DataFrame) -> None:
-    gapped = sample_ohlcv_df.drop(index=sample_ohlcv_df.index[[5, 6, 18, 41, 76]])
-    validate_ohlcv_frame(gapped)
+    keep = np.ones(len(sample_ohlcv_df), dtype=bool)
+    keep[[5, 6, 18, 41, 76]] = False
+    validate_ohlcv_frame(sample_ohlcv_df.iloc[keep])
 
 
 def test_infer_frequency_label_daily(sample_ohlcv_df: pd.DataFrame) -> None:
     assert infer_frequency_label(sample_ohlcv_df.index) == "daily"
 
 
-def test_infer_frequency_label_intraday_15min() -> None:
-    index = pd.date_range("2025-01-01", periods=16, freq="15min")
-    assert infer_frequency_label(index) == "15min"
-
-
-def test_infer_frequency_label_weekly() -> None:
-    index = pd.date_range("2025-01-03", periods=10, freq="W-FRI")
-    assert infer_frequency_label(index) == "weekly"
-
-
-def test_infer_frequency_label_irregular_for_short_index() -> None:
-    index = pd.DatetimeIndex([pd.Timestamp("2025-01-01")])
-    assert infer_frequency_label(index) == "irregular"
+@pytest.mark.parametrize(
+    ("index", "label"),
+    [
+        (INTRADAY_15MIN_INDEX, "15min"),
+        (WEEKLY_INDEX, "weekly"),
+        (SINGLE_TIMESTAMP_INDEX, "irregular"),
+    ],
+    ids=["intraday_15min", "weekly", "irregular_for_short_index"],
+)
+def test_infer_frequency_label(index: pd.DatetimeIndex, label: str) -> None:
+    assert infer_frequency_label(index) == label
 
 
 def test_normalize_columns_lowercased(sample_ohlcv_df: pd.DataFrame) -> None:
@@ -135,11 +159,20 @@ def test_validate_rejects_unsorted_index(sample_ohlcv_df: pd.DataFrame) -> None:
         validate_ohlcv_frame(rev)
 
 
-def test_validate_caches_validated_attr(sample_ohlcv_df: pd.DataFrame) -> None:
+def test_validate_caches_validated_index_without_mutating_attrs(sample_ohlcv_df: pd.DataFrame) -> None:
     validate_ohlcv_frame(sample_ohlcv_df)
-    assert sample_ohlcv_df.attrs.get("_narrata_validated") is True
-    # Second call should short-circuit
+    assert "_narrata_validated" not in sample_ohlcv_df.attrs
+    assert ohlcv._is_validated_index(sample_ohlcv_df.index)
+    # Frames derived without reindexing share the cached index; a reversed frame does not.
+    assert ohlcv._is_validated_index(sample_ohlcv_df.rename(columns={"Close": "close"}).index)
+    with pytest.raises(ValidationError, match="ascending order"):
+        validate_ohlcv_frame(sample_ohlcv_df.iloc[::-1])
+
+
+def test_validate_rechecks_columns_on_cached_index(sample_ohlcv_df: pd.DataFrame) -> None:
     validate_ohlcv_frame(sample_ohlcv_df)
+    with pytest.raises(ValidationError, match="missing required columns: Open"):
+        validate_ohlcv_frame(sample_ohlcv_df.drop(columns=["Open"]))
 
 
 def test_infer_frequency_5min() -> None:
@@ -172,6 +205,23 @@ def test_infer_frequency_business_daily() -> None:
     assert infer_frequency_label(index) == "business-daily"
 
 
+def test_infer_frequency_uses_attached_freq_for_two_points() -> None:
+    index = pd.date_range("2024-01-01", periods=2, freq="D")
+    assert infer_frequency_label(index) == "daily"
+
+
+def test_infer_frequency_unknown_attached_freq_falls_back_to_inference() -> None:
+    index = pd.date_range("2024-01-01", periods=30, freq="SME")
+    assert infer_frequency_label(index) == infer_frequency_label(pd.DatetimeIndex(list(index))) == "monthly"
+
+
+@pytest.mark.parametrize(("freq", "expected"), [("15min", "15min"), ("h", "hourly"), ("7D", "weekly"), ("2h", "2h")])
+def test_infer_frequency_evenly_spaced_without_attached_freq(freq: str, expected: str) -> None:
+    index = pd.DatetimeIndex(list(pd.date_range("2025-03-01", periods=40, freq=freq)))
+    assert index.freq is None
+    assert infer_frequency_label(index) == expected
+
+
 def test_infer_frequency_fallback_median_daily() -> None:
     # Irregular timestamps but ~daily spacing, pandas can't infer freq
     import numpy as np
@@ -183,8 +233,61 @@ def test_infer_frequency_fallback_median_daily() -> None:
     assert infer_frequency_label(pd.DatetimeIndex(jittered)) == "daily"
 
 
+def test_infer_frequency_fallback_respects_index_unit_and_skips_nat() -> None:
+    # Parsed strings give a microsecond-unit index; deltas touching NaT are ignored.
+    timestamps = ["2025-01-01", "2025-01-01 23:00", None, "2025-01-03", "2025-01-04 01:00", "2025-01-05"]
+    index = pd.DatetimeIndex(timestamps)
+    assert index.unit == "us"
+    assert infer_frequency_label(index) == "daily"
+    assert infer_frequency_label(index.as_unit("ns")) == "daily"
+
+
+@pytest.mark.parametrize(
+    ("median_step", "expected"),
+    [(3600, "hourly"), (3601, "daily"), (86_400 * 7, "weekly"), (86_400 * 31 + 1, "irregular")],
+)
+def test_infer_frequency_fallback_thresholds_are_inclusive(median_step: int, expected: str) -> None:
+    offsets = np.cumsum([0, median_step - 1, median_step, median_step + 1])
+    index = pd.Timestamp("2025-01-01") + pd.to_timedelta(offsets, unit="s")
+    assert infer_frequency_label(pd.DatetimeIndex(index)) == expected
+
+
 def test_infer_frequency_fallback_weekly() -> None:
     # Irregular weekly spacing
     timestamps = pd.to_datetime(["2025-01-01", "2025-01-08", "2025-01-16", "2025-01-22", "2025-01-29"])
     result = infer_frequency_label(pd.DatetimeIndex(timestamps))
     assert result == "weekly"
+
+
+def test_ohlcv_arrays_drops_missing_values_per_column(sample_ohlcv_df: pd.DataFrame) -> None:
+    patchy = sample_ohlcv_df.drop(columns=["Volume"])
+    patchy["Close"] = patchy["Close"].astype(object)
+    patchy.loc[patchy.index[::7], "Close"] = "bad"
+
+    arrays = ohlcv_arrays(patchy)
+
+    expected = pd.to_numeric(patchy["Close"], errors="coerce").dropna().to_numpy()
+    assert arrays.close.dtype == np.float64
+    assert arrays.close.flags.c_contiguous
+    np.testing.assert_array_equal(arrays.close, expected)
+    assert arrays.volume is None
+    assert arrays._fields == ("close", "volume")
+
+
+def test_ohlcv_arrays_rejects_missing_column(sample_ohlcv_df: pd.DataFrame) -> None:
+    with pytest.raises(ValidationError, match="does not exist"):
+        ohlcv_arrays(sample_ohlcv_df, column="Adj")
+
+
+def test_numeric_values_coerces_and_optionally_keeps_missing() -> None:
+    series = pd.Series(["1.5", None, "bad", 4])
+
+    np.testing.assert_array_equal(numeric_values(series), [1.5, 4.0])
+    np.testing.assert_array_equal(numeric_values(series, dropna=False), [1.5, np.nan, np.nan, 4.0])
+    assert numeric_values(pd.Series([1, 2, 3])).dtype == np.float64
+
+
+def test_numeric_values_accepts_arrays() -> None:
+    np.testing.assert_array_equal(numeric_values(np.array([1, 2, 3])), [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(numeric_values(np.array([1.0, np.nan, 3.0])), [1.0, 3.0])
+    np.testing.assert_array_equal(numeric_values(np.array(["1", "x"], dtype=object), dropna=False), [1.0, np.nan])